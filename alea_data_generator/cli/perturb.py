@@ -0,0 +1,329 @@
+"""
+Perturb a text or JSONL corpus with a configured sequence of error methods.
+
+The configuration file is a JSON object with an optional corpus seed and a list of error methods,
+each with a method name and the ErrorConfig.from_dict fields, e.g.:
+
+    {
+        "seed": 42,
+        "methods": [
+            {"method": "keyboard_character", "error_sample_type": "independent_rate", "rate": 0.01},
+            {"method": "skip_word", "error_sample_type": "fixed_count", "distribution_args": {"count": 1}}
+        ]
+    }
+
+Records are streamed from stdin or the input files and written incrementally, with a bounded number
+of records read ahead, so memory use does not depend on the size of the corpus.
+
+Input records are split on \\n only, and a trailing \\r is dropped.  Text output has one record per
+line, so line breaks inserted by error methods, e.g., whitespace_newline, are escaped as \\n and
+\\r, and backslashes as \\\\, so the escapes can be undone; use JSONL to keep them verbatim.
+"""
+
+# imports
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+# packages
+import tqdm
+
+# project
+from alea_data_generator.perturbations.errors.corpus import (
+    DEFAULT_SHARD_SIZE,
+    CorpusPerturber,
+    MethodSpec,
+)
+from alea_data_generator.perturbations.errors.instrumentation import INSTRUMENTATION
+from alea_data_generator.perturbations.errors.plan import compile_plan
+
+# escapes for line breaks in text output, which would otherwise split a record across lines, and
+# for the escape character itself, so the escapes can be undone
+TEXT_LINE_ESCAPES = str.maketrans({"\\": "\\\\", "\r": "\\r", "\n": "\\n"})
+
+
+def load_method_specs(config_path: Path) -> Tuple[List[MethodSpec], Optional[int]]:
+    """
+    Load the error method specifications and corpus seed from a JSON configuration file.
+
+    Args:
+        config_path: Path to the configuration file.
+
+    Returns:
+        Tuple of error method classes and configurations, and the corpus seed.
+    """
+    with open(config_path, "rt", encoding="utf-8") as config_file:
+        plan = compile_plan(json.load(config_file))
+
+    return plan.specs, plan.seed
+
+
+def iter_input_lines(input_paths: List[Path], stdin: TextIO) -> Iterator[str]:
+    """
+    Iterate over the lines of the input files, or stdin if there are none, without line endings.
+
+    Lines are split on \\n only, so a lone \\r inside a record does not split it.
+
+    Args:
+        input_paths: Paths to read, in order; "-" reads stdin.
+        stdin: Standard input stream.
+
+    Yields:
+        Input lines.
+    """
+    for input_path in input_paths or [Path("-")]:
+        if str(input_path) == "-":
+            for line in stdin:
+                yield line.rstrip("\r\n")
+            continue
+
+        with open(input_path, "rt", encoding="utf-8", newline="\n") as input_file:
+            for line in input_file:
+                yield line.rstrip("\r\n")
+
+
+def iter_texts(
+    lines: Iterable[str],
+    input_format: str,
+    field: str,
+    pending_records: Deque[Dict[str, Any]],
+) -> Iterator[str]:
+    """
+    Iterate over the texts to perturb, keeping JSONL records until their output is written.
+
+    Args:
+        lines: Input lines.
+        input_format: Input format, "text" or "jsonl".
+        field: JSONL field to perturb.
+        pending_records: Queue of JSONL records whose texts have been read but not yet written.
+
+    Yields:
+        Texts to perturb.
+
+    Raises:
+        ValueError: If a JSONL record does not have the field.
+    """
+    for line_number, line in enumerate(lines, 1):
+        if input_format == "text":
+            yield line
+            continue
+
+        # skip blank lines between records
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if field not in record:
+            raise ValueError(f"Input line {line_number} has no field {field!r}.")
+        pending_records.append(record)
+        yield record[field]
+
+
+def perturb_stream(
+    perturber: CorpusPerturber,
+    lines: Iterable[str],
+    output_file: TextIO,
+    *,
+    input_format: str = "text",
+    field: str = "text",
+    progress: Optional[tqdm.tqdm] = None,
+) -> Tuple[int, int]:
+    """
+    Perturb a stream of input lines and write the results incrementally.
+
+    Text output is written one record per line with line breaks in the output escaped, so output
+    line i is always the perturbation of input line i.
+
+    Args:
+        perturber: Corpus perturber to apply.
+        lines: Input lines.
+        output_file: Output stream.
+        input_format: Input format, "text" or "jsonl".
+        field: JSONL field to perturb.
+        progress: Optional progress bar to update per record.
+
+    Returns:
+        Tuple of the number of records and the number of input characters.
+    """
+    pending_records: Deque[Dict[str, Any]] = deque()
+    num_records = 0
+    num_characters = 0
+
+    def count_characters(texts: Iterable[str]) -> Iterator[str]:
+        nonlocal num_characters
+        for text in texts:
+            num_characters += len(text)
+            yield text
+
+    for output_text in perturber.perturb(
+        count_characters(iter_texts(lines, input_format, field, pending_records))
+    ):
+        if input_format == "text":
+            output_file.write(output_text.translate(TEXT_LINE_ESCAPES) + "\n")
+        else:
+            record = pending_records.popleft()
+            record[field] = output_text
+            output_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        num_records += 1
+        if progress is not None:
+            progress.update(1)
+
+    return num_records, num_characters
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Args:
+        argv: Command line arguments; sys.argv is used if None.
+
+    Returns:
+        Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Perturb a text or JSONL corpus with error methods."
+    )
+    parser.add_argument(
+        "input_paths",
+        type=Path,
+        nargs="*",
+        help="Input files; reads stdin if none are given or for -.",
+    )
+    parser.add_argument(
+        "--config_path",
+        type=Path,
+        required=True,
+        help="Path to the JSON error method configuration.",
+    )
+    parser.add_argument(
+        "--output_path",
+        type=Path,
+        default=None,
+        help="Path to the output file; writes stdout if not given.",
+    )
+    parser.add_argument(
+        "--format",
+        dest="input_format",
+        choices=("text", "jsonl"),
+        default="text",
+        help="Input format; text perturbs each line and escapes inserted line breaks, "
+        "jsonl perturbs one field per record.",
+    )
+    parser.add_argument(
+        "--field",
+        default="text",
+        help="JSONL field to perturb.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Corpus seed; overrides the seed in the configuration file.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes; 0 uses all CPUs.",
+    )
+    parser.add_argument(
+        "--shard_size",
+        type=int,
+        default=DEFAULT_SHARD_SIZE,
+        help="Number of records per shard.",
+    )
+    parser.add_argument(
+        "--max_pending",
+        type=int,
+        default=None,
+        help="Maximum number of shards read ahead; defaults to twice the number of workers.",
+    )
+    parser.add_argument(
+        "--stats_path",
+        type=Path,
+        default=None,
+        help="Path to write per-method instrumentation counters to as JSON; disabled if not given.",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Do not report progress and throughput on stderr.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Perturb a corpus from the command line.
+
+    Args:
+        argv: Command line arguments; sys.argv is used if None.
+
+    Returns:
+        None.
+    """
+    args = parse_args(argv)
+
+    specs, config_seed = load_method_specs(args.config_path)
+    perturber = CorpusPerturber(
+        specs,
+        seed=args.seed if args.seed is not None else config_seed,
+        workers=args.workers or None,
+        shard_size=args.shard_size,
+        max_pending=args.max_pending,
+    )
+
+    if args.stats_path is not None:
+        INSTRUMENTATION.reset()
+        INSTRUMENTATION.enable()
+
+    # split stdin on \\n only, like the input files
+    if isinstance(sys.stdin, io.TextIOWrapper):
+        sys.stdin.reconfigure(newline="\n")
+    lines = iter_input_lines(args.input_paths, sys.stdin)
+    start_time = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        output_file = (
+            stack.enter_context(open(args.output_path, "wt", encoding="utf-8"))
+            if args.output_path is not None
+            else sys.stdout
+        )
+        progress = stack.enter_context(
+            tqdm.tqdm(unit=" records", disable=args.quiet, file=sys.stderr)
+        )
+        try:
+            num_records, num_characters = perturb_stream(
+                perturber,
+                lines,
+                output_file,
+                input_format=args.input_format,
+                field=args.field,
+                progress=progress,
+            )
+        except ValueError as error:
+            print(f"Error: {error}", file=sys.stderr)
+            sys.exit(1)
+    elapsed = max(time.perf_counter() - start_time, 1e-9)
+
+    if args.stats_path is not None:
+        INSTRUMENTATION.disable()
+        args.stats_path.write_text(INSTRUMENTATION.to_json(indent=2), encoding="utf-8")
+
+    if not args.quiet:
+        print(
+            f"Perturbed {num_records} records in {elapsed:.2f}s "
+            f"({num_records / elapsed:.1f} records/s, "
+            f"{num_characters / elapsed / 1e6:.2f}M characters/s)",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
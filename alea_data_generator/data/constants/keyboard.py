@@ -6,6 +6,12 @@ correcting typos in text data, or other representation or shift tasks.
 # imports
 from typing import Dict, List, Tuple
 
+# project
+from alea_data_generator.data.constants.substitution_table import (
+    SubstitutionTable,
+    compile_substitution_table,
+)
+
 # glissando here
 PHYSICAL_LOWER_QWERTY_LAYOUT = [
     list("`1234567890-="),
@@ -156,8 +162,12 @@ ALL_KEYBOARD_PAIRS: Tuple[Tuple[str, str], ...] = tuple(
     KEYBOARD_PAIRS + REVERSE_KEYBOARD_PAIRS
 )
 
-# Translate this into a mapping from each character to a set of possible typos
-KEY_ERROR_MAPPING: Dict[str, Tuple[str, ...]] = {
-    a: tuple({b for a_, b in ALL_KEYBOARD_PAIRS if a_ == a})
-    for a in set(a for a, _ in ALL_KEYBOARD_PAIRS)
-}
+# Translate this into a mapping from each character to its possible typos, in first-seen order so
+# that seeded draws are stable
+KEY_ERROR_MAPPING: Dict[str, Tuple[str, ...]] = {}
+for a, b in ALL_KEYBOARD_PAIRS:
+    if b not in KEY_ERROR_MAPPING.setdefault(a, ()):
+        KEY_ERROR_MAPPING[a] += (b,)
+
+# Compiled single-character table for vectorized lookups and draws
+KEY_ERROR_TABLE: SubstitutionTable = compile_substitution_table(KEY_ERROR_MAPPING)
@@ -6,6 +6,12 @@ correcting OCR errors in text data, or other OCR-related tasks.
 # imports
 from typing import Dict, List, Tuple
 
+# project
+from alea_data_generator.data.constants.substitution_table import (
+    SubstitutionTable,
+    compile_substitution_table,
+)
+
 # common OCR character confusion pairs (derived from ocr_confusions)
 ocr_confusions = {
     # (Previous definition of ocr_confusions from above goes here)
@@ -238,7 +244,11 @@ REVERSE_OCR_PAIRS: List[Tuple[str, str]] = [(b, a) for a, b in OCR_PAIRS]
 # Combine both directions for a complete set of possible substitutions
 ALL_OCR_PAIRS: Tuple[Tuple[str, str], ...] = tuple(OCR_PAIRS + REVERSE_OCR_PAIRS)
 
-# Map each character to its possible OCR mistakes
+# Map each character to its possible OCR mistakes, in first-seen order so that seeded draws are stable
 OCR_ERROR_MAPPING: Dict[str, Tuple[str, ...]] = {}
-for a in set(a for a, _ in ALL_OCR_PAIRS):
-    OCR_ERROR_MAPPING[a] = tuple({b for a_, b in ALL_OCR_PAIRS if a_ == a})
+for a, b in ALL_OCR_PAIRS:
+    if b not in OCR_ERROR_MAPPING.setdefault(a, ()):
+        OCR_ERROR_MAPPING[a] += (b,)
+
+# Compiled single-character table for vectorized lookups and draws
+OCR_ERROR_TABLE: SubstitutionTable = compile_substitution_table(OCR_ERROR_MAPPING)
@@ -0,0 +1,173 @@
+"""
+Compiled substitution tables for looking up and sampling character substitutions in bulk.
+"""
+
+# imports
+from dataclasses import dataclass
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+# packages
+import numpy
+
+
+@dataclass(frozen=True)
+class SubstitutionTable:
+    """
+    Flat substitution table indexed by code point.
+
+    The candidates for code point c are candidates[offsets[c]:offsets[c + 1]], and each candidate
+    slot has an alias-method probability and alias slot for weighted sampling.  All arrays are
+    read-only, so a table can be shared across threads and forked workers.
+    """
+
+    offsets: numpy.ndarray
+    candidates: numpy.ndarray
+    probabilities: numpy.ndarray
+    aliases: numpy.ndarray
+
+    def __len__(self) -> int:
+        """
+        Get the number of code points the offsets array covers.
+
+        Returns:
+            Number of code points.
+        """
+        return len(self.offsets) - 1
+
+    def get_candidates(self, character: str) -> Tuple[str, ...]:
+        """
+        Get the substitution candidates for a character.
+
+        Args:
+            character: Character to look up.
+
+        Returns:
+            Tuple of candidates, empty if the character has none.
+        """
+        if len(character) != 1 or ord(character) >= len(self):
+            return ()
+        code_point = ord(character)
+        return tuple(
+            self.candidates[self.offsets[code_point] : self.offsets[code_point + 1]]
+        )
+
+    def sample(
+        self, code_points: numpy.ndarray, uniforms: numpy.ndarray
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Sample one substitution for each code point with a single vectorized gather.
+
+        Each uniform picks a candidate slot with its integer part and flips the slot's alias coin
+        with its fractional part, so one uniform is used per code point.
+
+        Args:
+            code_points: Code points to substitute; negative values have no candidates.
+            uniforms: One uniform in [0, 1) per code point.
+
+        Returns:
+            Tuple of a boolean mask of the code points with candidates and the sampled
+            substitutions for those code points.
+        """
+        in_range = (code_points >= 0) & (code_points < len(self))
+        safe_code_points = numpy.where(in_range, code_points, 0)
+        starts = self.offsets[safe_code_points]
+        counts = numpy.where(in_range, self.offsets[safe_code_points + 1] - starts, 0)
+        has_candidates = counts > 0
+
+        starts = starts[has_candidates]
+        scaled = uniforms[has_candidates] * counts[has_candidates]
+        slots = numpy.minimum(scaled.astype(numpy.int64), counts[has_candidates] - 1)
+        slots = starts + slots
+
+        # keep the slot or take its alias
+        keep = (scaled - numpy.floor(scaled)) < self.probabilities[slots]
+        chosen = numpy.where(keep, slots, starts + self.aliases[slots])
+
+        return has_candidates, self.candidates[chosen]
+
+
+def build_alias_table(weights: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """
+    Build Vose's alias table for a discrete distribution.
+
+    Args:
+        weights: Non-negative weights with a positive sum.
+
+    Returns:
+        Tuple of the probability of keeping each slot and the alias of each slot.
+    """
+    num_weights = len(weights)
+    total = float(sum(weights))
+    if num_weights == 0 or total <= 0:
+        raise ValueError("weights must be non-empty with a positive sum")
+
+    scaled = [weight * num_weights / total for weight in weights]
+    probabilities = [1.0] * num_weights
+    aliases = list(range(num_weights))
+    small = [i for i, value in enumerate(scaled) if value < 1.0]
+    large = [i for i, value in enumerate(scaled) if value >= 1.0]
+
+    while small and large:
+        less, more = small.pop(), large.pop()
+        probabilities[less] = scaled[less]
+        aliases[less] = more
+        scaled[more] = scaled[more] + scaled[less] - 1.0
+        if scaled[more] < 1.0:
+            small.append(more)
+        else:
+            large.append(more)
+
+    return probabilities, aliases
+
+
+def compile_substitution_table(
+    mapping: Mapping[str, Sequence[str]],
+    weights: Optional[Mapping[str, Sequence[float]]] = None,
+) -> SubstitutionTable:
+    """
+    Compile a mapping from characters to substitution candidates into a flat table.
+
+    Only single-character keys are compiled; candidates may be any string.
+
+    Args:
+        mapping: Mapping from each character to its candidates.
+        weights: Optional mapping from each character to one weight per candidate; candidates are
+            sampled uniformly if None or if a character has no weights.
+
+    Returns:
+        Compiled substitution table.
+    """
+    keys = sorted(key for key in mapping if len(key) == 1 and mapping[key])
+    size = max((ord(key) for key in keys), default=-1) + 1
+
+    counts = numpy.zeros(size, dtype=numpy.int64)
+    candidates: List[str] = []
+    probabilities: List[float] = []
+    aliases: List[int] = []
+    for key in keys:
+        key_candidates = list(mapping[key])
+        key_weights = (weights or {}).get(key) or [1.0] * len(key_candidates)
+        if len(key_weights) != len(key_candidates):
+            raise ValueError(f"Expected one weight per candidate for {key!r}")
+
+        key_probabilities, key_aliases = build_alias_table(key_weights)
+        counts[ord(key)] = len(key_candidates)
+        candidates.extend(key_candidates)
+        probabilities.extend(key_probabilities)
+        aliases.extend(key_aliases)
+
+    offsets = numpy.zeros(size + 1, dtype=numpy.int64)
+    numpy.cumsum(counts, out=offsets[1:])
+
+    candidate_array = numpy.empty(len(candidates), dtype=object)
+    candidate_array[:] = candidates
+    table = SubstitutionTable(
+        offsets=offsets,
+        candidates=candidate_array,
+        probabilities=numpy.array(probabilities, dtype=numpy.float64),
+        aliases=numpy.array(aliases, dtype=numpy.int64),
+    )
+    for array in (table.offsets, table.candidates, table.probabilities, table.aliases):
+        array.flags.writeable = False
+
+    return table
@@ -0,0 +1,6 @@
+"""Initialization file for the errors module."""
+
+from .corpus import CorpusPerturber
+from .chain import ErrorChain
+
+__all__ = ["CorpusPerturber", "ErrorChain"]
@@ -0,0 +1,134 @@
+"""
+Aho-Corasick automaton for finding every occurrence of a set of patterns in one pass.
+"""
+
+# imports
+from collections import deque
+from typing import Deque, Dict, List, Sequence, Tuple
+
+# packages
+import numpy
+
+
+class AhoCorasickAutomaton:
+    """
+    Aho-Corasick automaton over a fixed set of string patterns.
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        """
+        Build the automaton.
+
+        Args:
+            patterns: Non-empty patterns to match.
+        """
+        if any(len(pattern) == 0 for pattern in patterns):
+            raise ValueError("Patterns must be non-empty.")
+
+        self.patterns: Tuple[str, ...] = tuple(patterns)
+        self.goto: List[Dict[str, int]] = [{}]
+        self.terminal: List[int] = [-1]
+
+        # build the trie
+        for pattern_index, pattern in enumerate(self.patterns):
+            state = 0
+            for symbol in pattern:
+                if symbol not in self.goto[state]:
+                    self.goto.append({})
+                    self.terminal.append(-1)
+                    self.goto[state][symbol] = len(self.goto) - 1
+                state = self.goto[state][symbol]
+            self.terminal[state] = pattern_index
+
+        # link each state to its longest proper suffix state and collect its outputs, breadth first
+        self.fail: List[int] = [0] * len(self.goto)
+        self.outputs: List[Tuple[int, ...]] = [()] * len(self.goto)
+        queue: Deque[int] = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            own_output = (self.terminal[state],) if self.terminal[state] >= 0 else ()
+            self.outputs[state] = own_output + self.outputs[self.fail[state]]
+            for symbol, next_state in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and symbol not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(symbol, 0)
+                queue.append(next_state)
+
+        # distinct lengths of the patterns ending at each state, which is all find_starts needs
+        self.output_lengths: List[Tuple[int, ...]] = [
+            tuple(sorted({len(self.patterns[index]) for index in output}))
+            for output in self.outputs
+        ]
+
+    def find_all(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Find every occurrence of every pattern, including overlapping ones.
+
+        Args:
+            text: String to search.
+
+        Returns:
+            List of (start, pattern index) tuples in order of their end position.
+        """
+        goto, fail, outputs, patterns = (
+            self.goto,
+            self.fail,
+            self.outputs,
+            self.patterns,
+        )
+        matches: List[Tuple[int, int]] = []
+        state = 0
+        for i, symbol in enumerate(text):
+            while state and symbol not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(symbol, 0)
+            for pattern_index in outputs[state]:
+                matches.append((i - len(patterns[pattern_index]) + 1, pattern_index))
+        return matches
+
+    def find_starts(self, text: str) -> numpy.ndarray:
+        """
+        Find the positions where at least one pattern starts.
+
+        Args:
+            text: String to search.
+
+        Returns:
+            Sorted array of distinct start positions.
+        """
+        goto, fail, output_lengths = self.goto, self.fail, self.output_lengths
+
+        # collect plain integers rather than match tuples, which the garbage collector would track
+        starts: List[int] = []
+        state = 0
+        for end, symbol in enumerate(text, 1):
+            while state and symbol not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(symbol, 0)
+            for length in output_lengths[state]:
+                starts.append(end - length)
+        is_start = numpy.zeros(len(text), dtype=numpy.bool_)
+        is_start[starts] = True
+        return numpy.flatnonzero(is_start)
+
+    def match_at(self, text: str, start: int) -> List[int]:
+        """
+        Find the patterns that occur at a start position by walking the trie.
+
+        Args:
+            text: String to search.
+            start: Start position.
+
+        Returns:
+            Indices of the matching patterns, shortest first.
+        """
+        pattern_indices: List[int] = []
+        state = 0
+        for i in range(start, len(text)):
+            state = self.goto[state].get(text[i], -1)
+            if state < 0:
+                break
+            if self.terminal[state] >= 0:
+                pattern_indices.append(self.terminal[state])
+        return pattern_indices
@@ -0,0 +1,165 @@
+"""
+Offset alignment maps from an input string to its perturbed output, built from edit scripts.
+"""
+
+# future
+from __future__ import annotations
+
+# imports
+from typing import List, Sequence, Tuple, Union
+
+# packages
+import numpy
+
+# project
+from alea_data_generator.perturbations.errors.edits import Edit
+
+# a span is a (start, end) pair of character offsets with an exclusive end
+Span = Tuple[int, int]
+
+
+class OffsetAlignment:
+    """
+    Monotone offset map from a source string to the target string an edit script produced.
+
+    The map is stored as anchor arrays: anchor 0 is (0, 0), and each edit adds an anchor at its start
+    and one at its end.  Between an even anchor and the next one, text is unchanged and offsets shift
+    by a constant; between an odd anchor and the next one, text was replaced.  Span starts inside a
+    replaced region map to the start of its replacement and span ends map to the end of it, so spans
+    that overlap an edit grow to cover the new text.
+    """
+
+    def __init__(
+        self,
+        source_anchors: numpy.ndarray,
+        target_anchors: numpy.ndarray,
+        source_length: int,
+        target_length: int,
+    ):
+        """
+        Initialize the offset alignment.
+
+        Args:
+            source_anchors: Non-decreasing anchor offsets in the source string.
+            target_anchors: Non-decreasing anchor offsets in the target string.
+            source_length: Length of the source string.
+            target_length: Length of the target string.
+        """
+        self.source_anchors: numpy.ndarray = source_anchors
+        self.target_anchors: numpy.ndarray = target_anchors
+        self.source_length: int = source_length
+        self.target_length: int = target_length
+
+    @classmethod
+    def from_edits(cls, edits: Sequence[Edit], source_length: int) -> OffsetAlignment:
+        """
+        Build the offset alignment for an edit script in O(edits) time.
+
+        Args:
+            edits: Non-overlapping edits sorted by offset.
+            source_length: Length of the source string.
+
+        Returns:
+            Offset alignment from the source string to the edited string.
+        """
+        source_anchors = numpy.zeros(2 * len(edits) + 1, dtype=numpy.int64)
+        target_anchors = numpy.zeros(2 * len(edits) + 1, dtype=numpy.int64)
+        delta = 0
+        for i, (offset, delete_length, insert_text) in enumerate(edits):
+            source_anchors[2 * i + 1] = offset
+            target_anchors[2 * i + 1] = offset + delta
+            delta += len(insert_text) - delete_length
+            source_anchors[2 * i + 2] = offset + delete_length
+            target_anchors[2 * i + 2] = offset + delete_length + delta
+
+        return cls(source_anchors, target_anchors, source_length, source_length + delta)
+
+    @classmethod
+    def identity(cls, length: int) -> OffsetAlignment:
+        """
+        Build the offset alignment for an unchanged string.
+
+        Args:
+            length: Length of the string.
+
+        Returns:
+            Identity offset alignment.
+        """
+        return cls.from_edits([], length)
+
+    def map_starts(self, offsets: numpy.ndarray) -> numpy.ndarray:
+        """
+        Map span start offsets from the source string to the target string.
+
+        Text inserted at a start offset is placed before the span.
+
+        Args:
+            offsets: Start offsets in [0, source_length].
+
+        Returns:
+            Start offsets in the target string.
+        """
+        offsets = numpy.asarray(offsets, dtype=numpy.int64)
+        anchors = numpy.searchsorted(self.source_anchors, offsets, side="right") - 1
+        unchanged = anchors % 2 == 0
+        return numpy.where(
+            unchanged,
+            self.target_anchors[anchors] + offsets - self.source_anchors[anchors],
+            self.target_anchors[anchors],
+        )
+
+    def map_ends(self, offsets: numpy.ndarray) -> numpy.ndarray:
+        """
+        Map exclusive span end offsets from the source string to the target string.
+
+        Text inserted at an end offset is placed after the span.
+
+        Args:
+            offsets: End offsets in [0, source_length].
+
+        Returns:
+            End offsets in the target string.
+        """
+        offsets = numpy.asarray(offsets, dtype=numpy.int64)
+
+        # map the end of the last character in the span
+        last = numpy.maximum(offsets - 1, 0)
+        anchors = numpy.searchsorted(self.source_anchors, last, side="right") - 1
+        unchanged = anchors % 2 == 0
+        next_anchors = numpy.minimum(anchors + 1, len(self.target_anchors) - 1)
+        mapped = numpy.where(
+            unchanged,
+            self.target_anchors[anchors] + last - self.source_anchors[anchors] + 1,
+            self.target_anchors[next_anchors],
+        )
+        return numpy.where(offsets > 0, mapped, 0)
+
+
+def remap_spans(
+    spans: Sequence[Span],
+    alignments: Union[OffsetAlignment, Sequence[OffsetAlignment]],
+) -> List[Span]:
+    """
+    Remap spans through one or more offset alignments in O(spans log edits) time per alignment.
+
+    Args:
+        spans: List of (start, end) spans in the source string.
+        alignments: Offset alignment, or offset alignments applied in order, e.g., from a chain.
+
+    Returns:
+        List of (start, end) spans in the target string, in input order.
+    """
+    if isinstance(alignments, OffsetAlignment):
+        alignments = [alignments]
+
+    if len(spans) == 0:
+        return []
+
+    span_array = numpy.asarray(spans, dtype=numpy.int64).reshape(-1, 2)
+    starts, ends = span_array[:, 0], span_array[:, 1]
+    for alignment in alignments:
+        starts, ends = alignment.map_starts(starts), alignment.map_ends(ends)
+
+    # empty spans stay empty
+    ends = numpy.maximum(starts, ends)
+    return list(zip(starts.tolist(), ends.tolist()))
@@ -0,0 +1,150 @@
+"""
+Error chain, a convenience wrapper that applies an ordered list of error methods to a batch of strings.
+"""
+
+# imports
+from typing import List, Optional, Sequence, Tuple
+
+# packages
+import numpy
+
+# project
+from alea_data_generator.perturbations.errors.alignment import OffsetAlignment
+from alea_data_generator.perturbations.errors.methods.base import (
+    BaseErrorMethod,
+    get_thread_generator,
+)
+
+
+class ErrorChain:
+    """
+    Apply an ordered list of error methods to a string or a batch of strings.
+
+    This is a convenience for chaining the methods by hand: each method runs over the whole batch
+    with its own execute_batch and returns new strings for the next one, so a chain produces the same
+    output as chaining the methods' execute_batch calls, and a chain over one string the same output
+    as chaining their execute calls.  There is no shared buffer between the methods; every method
+    reads and edits the output of the one before it.
+    """
+
+    def __init__(self, methods: Sequence[BaseErrorMethod]):
+        """
+        Initialize the error chain.
+
+        Args:
+            methods: Error methods to apply, in order.
+        """
+        self.methods: List[BaseErrorMethod] = list(methods)
+
+    def seed_chunk(self, document_id: int, chunk_index: int) -> None:
+        """
+        Switch every method to its counter-based random streams for one document chunk.
+
+        Args:
+            document_id: Non-negative document id.
+            chunk_index: Non-negative chunk index within the document.
+
+        Returns:
+            None.
+        """
+        for method in self.methods:
+            method.seed_chunk(document_id, chunk_index)
+
+    def execute(self, input_string: str) -> str:
+        """
+        Execute the error chain on the input string.
+
+        Args:
+            input_string: Input string to apply errors to.
+
+        Returns:
+            Modified string with applied errors.
+        """
+        return self.execute_batch([input_string])[0]
+
+    def execute_batch(self, input_strings: Sequence[str]) -> List[str]:
+        """
+        Execute the error chain on each input string in a batch.
+
+        Args:
+            input_strings: Input strings to apply errors to.
+
+        Returns:
+            Modified strings with applied errors, in input order.
+        """
+        output_strings = list(input_strings)
+        for method in self.methods:
+            output_strings = method.execute_batch(output_strings)
+        return output_strings
+
+    def execute_stateless(
+        self, input_string: str, rng: Optional[numpy.random.Generator] = None
+    ) -> str:
+        """
+        Execute the error chain without touching the methods' own state, e.g., from several threads.
+
+        Args:
+            input_string: Input string to apply errors to.
+            rng: Generator to draw from; the calling thread's default generator is used if None.
+
+        Returns:
+            Modified string with applied errors.
+        """
+        return self.execute_batch_stateless([input_string], rng)[0]
+
+    def execute_batch_stateless(
+        self,
+        input_strings: Sequence[str],
+        rng: Optional[numpy.random.Generator] = None,
+    ) -> List[str]:
+        """
+        Execute the error chain on each input string in a batch without touching the methods' own state.
+
+        Every method draws from the same generator, so one chain object can serve many threads,
+        each passing its own generator.
+
+        Args:
+            input_strings: Input strings to apply errors to.
+            rng: Generator to draw from; the calling thread's default generator is used if None.
+
+        Returns:
+            Modified strings with applied errors, in input order.
+        """
+        if rng is None:
+            rng = get_thread_generator()
+        bound = ErrorChain([method.with_generator(rng) for method in self.methods])
+        return bound.execute_batch(input_strings)
+
+    def execute_with_alignment(
+        self, input_string: str
+    ) -> Tuple[str, List[OffsetAlignment]]:
+        """
+        Execute the error chain on the input string and return the offset alignments.
+
+        Each method contributes one alignment, built from its edits; pass the list to remap_spans to
+        remap spans in the input string to the output string.
+
+        Args:
+            input_string: Input string to apply errors to.
+
+        Returns:
+            Tuple of the modified string and the offset alignments, in order.
+        """
+        alignments: List[OffsetAlignment] = []
+        output_string = input_string
+        for method in self.methods:
+            output_string, alignment = method.execute_with_alignment(output_string)
+            alignments.append(alignment)
+        return output_string, alignments
+
+    def __call__(self, input_string: str) -> str:
+        """
+        Call the execute method on the input string.
+
+        Args:
+            input_string: Input string to apply errors to.
+
+        Returns:
+            Modified string with applied errors.
+        """
+        return self.execute(input_string)
@@ -0,0 +1,175 @@
+"""
+Vectorized character-class masks for selecting valid error positions.
+"""
+
+# imports
+import string
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Dict
+
+# packages
+import numpy
+
+# project
+from alea_data_generator.perturbations.errors.codepoints import to_code_points
+
+# lookup tables cover the basic multilingual plane; other code points are evaluated individually
+TABLE_SIZE = 0x10000
+
+PRINTABLE_CHARACTERS = frozenset(string.printable)
+
+
+def is_whitespace(character: str) -> bool:
+    """
+    Check whether a character is whitespace.
+    """
+    return character.isspace()
+
+
+def is_blank(character: str) -> bool:
+    """
+    Check whether a character is a space or tab.
+    """
+    return character in (" ", "\t")
+
+
+def is_alpha(character: str) -> bool:
+    """
+    Check whether a character is alphabetic.
+    """
+    return character.isalpha()
+
+
+def is_digit(character: str) -> bool:
+    """
+    Check whether a character is a digit.
+    """
+    return character.isdigit()
+
+
+def is_printable(character: str) -> bool:
+    """
+    Check whether a character is in string.printable.
+    """
+    return character in PRINTABLE_CHARACTERS
+
+
+def is_punctuation(character: str) -> bool:
+    """
+    Check whether a character is in a Unicode punctuation category.
+    """
+    return len(character) == 1 and unicodedata.category(character).startswith("P")
+
+
+CHARACTER_CLASSES: Dict[str, Callable[[str], bool]] = {
+    "whitespace": is_whitespace,
+    "blank": is_blank,
+    "alpha": is_alpha,
+    "digit": is_digit,
+    "printable": is_printable,
+    "punctuation": is_punctuation,
+}
+
+
+@lru_cache(maxsize=None)
+def get_class_table(character_class: str) -> numpy.ndarray:
+    """
+    Get the boolean lookup table for a character class over the basic multilingual plane.
+
+    Tables are built once per process and are read-only.
+
+    Args:
+        character_class: Name of the character class, e.g., "whitespace".
+
+    Returns:
+        Read-only boolean array indexed by code point.
+    """
+    if character_class not in CHARACTER_CLASSES:
+        raise ValueError(f"Unknown character class: {character_class}")
+
+    predicate = CHARACTER_CLASSES[character_class]
+    table = numpy.fromiter(
+        (predicate(chr(code_point)) for code_point in range(TABLE_SIZE)),
+        dtype=numpy.bool_,
+        count=TABLE_SIZE,
+    )
+    table.flags.writeable = False
+    return table
+
+
+class CharacterClassIndex:
+    """
+    Character-class masks for one input string, computed with vectorized table lookups.
+
+    The input is converted to a UTF-32 code point array once, and each class mask is computed on
+    first use and then reused by later lookups on the same index. Error methods do not share an
+    index; each call to character_class_mask builds its own.
+    """
+
+    def __init__(self, input_string: str):
+        """
+        Initialize the character-class index.
+
+        Args:
+            input_string: Input string to index.
+        """
+        self.code_points: numpy.ndarray = to_code_points(input_string)
+        self.masks: Dict[str, numpy.ndarray] = {}
+
+    def __len__(self) -> int:
+        """
+        Get the number of characters in the indexed string.
+
+        Returns:
+            Number of characters.
+        """
+        return len(self.code_points)
+
+    def mask(self, character_class: str) -> numpy.ndarray:
+        """
+        Get the boolean mask of characters in a character class.
+
+        Args:
+            character_class: Name of the character class, e.g., "whitespace".
+
+        Returns:
+            Read-only boolean mask with one entry per character.
+        """
+        if character_class not in self.masks:
+            table = get_class_table(character_class)
+            in_table = self.code_points < TABLE_SIZE
+            mask = table[numpy.where(in_table, self.code_points, 0)]
+
+            # evaluate code points outside the table once per distinct value
+            if not in_table.all():
+                outside = self.code_points[~in_table]
+                distinct = numpy.unique(outside)
+                predicate = CHARACTER_CLASSES[character_class]
+                values = numpy.array(
+                    [predicate(chr(code_point)) for code_point in distinct.tolist()],
+                    dtype=numpy.bool_,
+                )
+                mask[~in_table] = values[numpy.searchsorted(distinct, outside)]
+
+            mask.flags.writeable = False
+            self.masks[character_class] = mask
+
+        return self.masks[character_class]
+
+
+def character_class_mask(input_string: str, character_class: str) -> numpy.ndarray:
+    """
+    Get the boolean mask of characters in a character class for a string.
+
+    The input is indexed once per call and nothing is cached across calls, so long strings are not
+    kept alive; callers that need several classes for one string can keep a CharacterClassIndex.
+
+    Args:
+        input_string: Input string.
+        character_class: Name of the character class, e.g., "whitespace".
+
+    Returns:
+        Boolean mask with one entry per character.
+    """
+    return CharacterClassIndex(input_string).mask(character_class)
@@ -0,0 +1,38 @@
+"""
+Conversions between strings and NumPy arrays of code points.
+"""
+
+# packages
+import numpy
+
+
+def to_code_points(input_string: str) -> numpy.ndarray:
+    """
+    Convert a string to an array of code points without a Python-level loop.
+
+    Args:
+        input_string: Input string.
+
+    Returns:
+        Read-only uint32 array with one code point per character.
+    """
+    return numpy.frombuffer(
+        input_string.encode("utf-32-le", "surrogatepass"), dtype=numpy.uint32
+    )
+
+
+def from_code_points(code_points: numpy.ndarray) -> str:
+    """
+    Convert an array of code points back to a string.
+
+    Args:
+        code_points: Array of code points.
+
+    Returns:
+        String with one character per code point.
+    """
+    return (
+        numpy.ascontiguousarray(code_points, dtype=numpy.uint32)
+        .tobytes()
+        .decode("utf-32-le", "surrogatepass")
+    )
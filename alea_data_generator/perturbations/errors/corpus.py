@@ -0,0 +1,259 @@
+"""
+Corpus-level perturbation engine that shards records across a process pool.
+"""
+
+# imports
+import dataclasses
+import functools
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+# packages
+import numpy
+
+# project
+from alea_data_generator.perturbations.errors.config import ErrorConfig
+from alea_data_generator.perturbations.errors.instrumentation import INSTRUMENTATION
+from alea_data_generator.perturbations.errors.methods.base import BaseErrorMethod
+from alea_data_generator.perturbations.errors.chain import ErrorChain
+
+# default number of records per shard; shards are the unit of seeding, so this must not depend on workers
+DEFAULT_SHARD_SIZE = 256
+
+# default number of shards in flight per worker
+DEFAULT_PENDING_PER_WORKER = 2
+
+# an error method class and the configuration to build it with
+MethodSpec = Tuple[Type[BaseErrorMethod], ErrorConfig]
+
+
+def get_shard_seed(entropy: int, shard_index: int, method_index: int) -> int:
+    """
+    Derive the seed for one error method in one shard.
+
+    This is the seed of the child SeedSequence that SeedSequence(entropy).spawn would return at
+    position shard_index, spawned again at position method_index, so any shard can be seeded
+    without spawning the ones before it.  The full 256 bits of the child's state are packed into the
+    seed, so shard seeds do not collide the way 32-bit seeds would across large corpora.
+
+    Args:
+        entropy: Root entropy, e.g., the corpus seed.
+        shard_index: Index of the shard in the corpus.
+        method_index: Index of the error method in the chain.
+
+    Returns:
+        Integer seed for the error configuration.
+    """
+    seed_sequence = numpy.random.SeedSequence(
+        entropy, spawn_key=(shard_index, method_index)
+    )
+    return functools.reduce(
+        lambda seed, word: (seed << 64) | word,
+        seed_sequence.generate_state(4, dtype=numpy.uint64).tolist(),
+        0,
+    )
+
+
+def build_shard_chain(
+    specs: Sequence[MethodSpec], entropy: int, shard_index: int
+) -> ErrorChain:
+    """
+    Build the error chain for one shard with independently seeded error methods.
+
+    Methods whose configuration has a seed derive their shard seeds from it; the others derive them
+    from the corpus entropy.
+
+    Args:
+        specs: Error method classes and configurations, in order.
+        entropy: Corpus entropy used for methods without a seed.
+        shard_index: Index of the shard in the corpus.
+
+    Returns:
+        Error chain for the shard.
+    """
+    methods = []
+    for method_index, (method_class, config) in enumerate(specs):
+        method_entropy = config.seed if config.seed is not None else entropy
+        shard_config = dataclasses.replace(
+            config, seed=get_shard_seed(method_entropy, shard_index, method_index)
+        )
+        methods.append(method_class(shard_config))
+    return ErrorChain(methods)
+
+
+def perturb_shard(
+    specs: Sequence[MethodSpec], entropy: int, shard_index: int, records: List[str]
+) -> List[str]:
+    """
+    Perturb one shard of records.
+
+    Args:
+        specs: Error method classes and configurations, in order.
+        entropy: Corpus entropy used for methods without a seed.
+        shard_index: Index of the shard in the corpus.
+        records: Records in the shard.
+
+    Returns:
+        Perturbed records, in input order.
+    """
+    return build_shard_chain(specs, entropy, shard_index).execute_batch(records)
+
+
+def perturb_shard_instrumented(
+    specs: Sequence[MethodSpec], entropy: int, shard_index: int, records: List[str]
+) -> Tuple[List[str], Dict[str, Dict[str, int]]]:
+    """
+    Perturb one shard of records in a worker process and return the shard's instrumentation counters.
+
+    Args:
+        specs: Error method classes and configurations, in order.
+        entropy: Corpus entropy used for methods without a seed.
+        shard_index: Index of the shard in the corpus.
+        records: Records in the shard.
+
+    Returns:
+        Tuple of the perturbed records, in input order, and the counters for the shard.
+    """
+    INSTRUMENTATION.enable()
+    INSTRUMENTATION.reset()
+    outputs = perturb_shard(specs, entropy, shard_index, records)
+    return outputs, INSTRUMENTATION.to_dict()
+
+
+def iter_file_lines(paths: Iterable[Path]) -> Iterator[str]:
+    """
+    Iterate over the lines of each file without their line endings.
+
+    Args:
+        paths: Paths to read, in order.
+
+    Yields:
+        Lines of each file.
+    """
+    for path in paths:
+        with Path(path).open("rt", encoding="utf-8") as input_file:
+            for line in input_file:
+                yield line.rstrip("\r\n")
+
+
+class CorpusPerturber:
+    """
+    Perturb a corpus of records with a sequence of error methods across worker processes.
+
+    Records are grouped into fixed-size shards in input order.  Each shard builds its own error
+    methods seeded from (seed, shard index, method index) with SeedSequence, so the output for a given
+    seed is identical for any number of workers, and results are yielded in input order.  Only a bounded
+    number of shards is in flight at a time, so memory use does not grow with the corpus.
+    """
+
+    def __init__(
+        self,
+        specs: Sequence[MethodSpec],
+        seed: Optional[int] = None,
+        workers: Optional[int] = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        max_pending: Optional[int] = None,
+    ):
+        """
+        Initialize the corpus perturber.
+
+        Args:
+            specs: Error method classes and configurations, in order.
+            seed: Corpus seed; fresh entropy is drawn if None.
+            workers: Number of worker processes; records are processed in this process if 0 or 1,
+                and the number of CPUs is used if None.
+            shard_size: Number of records per shard.
+            max_pending: Maximum number of shards in flight; defaults to twice the number of workers.
+        """
+        if shard_size < 1:
+            raise ValueError("shard_size must be positive")
+
+        self.specs: List[MethodSpec] = list(specs)
+        self.entropy: int = int(numpy.random.SeedSequence(seed).entropy)
+        self.workers: Optional[int] = workers
+        self.shard_size: int = shard_size
+        self.max_pending: Optional[int] = max_pending
+
+    def iter_shards(self, records: Iterable[str]) -> Iterator[List[str]]:
+        """
+        Group records into shards of shard_size records.
+
+        Args:
+            records: Records to group.
+
+        Yields:
+            Lists of records.
+        """
+        iterator = iter(records)
+        while True:
+            shard = list(islice(iterator, self.shard_size))
+            if not shard:
+                return
+            yield shard
+
+    def perturb(self, records: Iterable[str]) -> Iterator[str]:
+        """
+        Perturb records, yielding results in input order.
+
+        Args:
+            records: Records to perturb.
+
+        Yields:
+            Perturbed records.
+        """
+        if self.workers is not None and self.workers <= 1:
+            for shard_index, shard in enumerate(self.iter_shards(records)):
+                yield from perturb_shard(self.specs, self.entropy, shard_index, shard)
+            return
+
+        # workers count into their own registries, which are merged into this one per shard
+        instrumented = INSTRUMENTATION.enabled
+        shard_function = perturb_shard_instrumented if instrumented else perturb_shard
+
+        def get_outputs(future: Future) -> List[str]:
+            if not instrumented:
+                return future.result()
+            outputs, stats = future.result()
+            INSTRUMENTATION.merge(stats)
+            return outputs
+
+        workers = self.workers or os.cpu_count() or 1
+        max_pending = self.max_pending or DEFAULT_PENDING_PER_WORKER * workers
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: Deque[Future] = deque()
+            for shard_index, shard in enumerate(self.iter_shards(records)):
+                if len(pending) >= max_pending:
+                    yield from get_outputs(pending.popleft())
+                pending.append(
+                    executor.submit(
+                        shard_function, self.specs, self.entropy, shard_index, shard
+                    )
+                )
+            while pending:
+                yield from get_outputs(pending.popleft())
+
+    def perturb_files(self, paths: Iterable[Path]) -> Iterator[str]:
+        """
+        Perturb each line of each file, yielding results in input order.
+
+        Args:
+            paths: Paths to read, in order.
+
+        Yields:
+            Perturbed lines without line endings.
+        """
+        yield from self.perturb(iter_file_lines(paths))
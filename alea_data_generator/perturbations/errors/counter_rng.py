@@ -0,0 +1,64 @@
+"""
+Counter-based random streams keyed by (seed, document id, chunk index) for random-access perturbation.
+"""
+
+# imports
+from typing import Optional
+
+# packages
+import numpy
+import numpy.random
+
+# number of independent streams per error method: positions, counts, and per-substitution draws
+NUM_STREAMS = 3
+
+# largest document id or chunk index, which each fill one 64-bit word of the Philox counter
+MAX_COUNTER_WORD = 2**64 - 1
+
+
+def get_stream_keys(
+    seed: Optional[int], num_streams: int = NUM_STREAMS
+) -> numpy.ndarray:
+    """
+    Derive one 128-bit Philox key per stream from a seed.
+
+    Args:
+        seed: Seed of the error method; fresh entropy is drawn if None.
+        num_streams: Number of streams.
+
+    Returns:
+        Array of shape (num_streams, 2) of uint64 keys.
+    """
+    return numpy.stack(
+        [
+            child.generate_state(2, dtype=numpy.uint64)
+            for child in numpy.random.SeedSequence(seed).spawn(num_streams)
+        ]
+    )
+
+
+def get_counter_generator(
+    key: numpy.ndarray, document_id: int, chunk_index: int
+) -> numpy.random.Generator:
+    """
+    Get the generator for one chunk of one document on a keyed stream.
+
+    The chunk's stream starts at the Philox counter (0, 0, chunk_index, document_id) and only
+    advances the low words, so every (document id, chunk index) pair has its own disjoint stream
+    that can be generated directly, without drawing the streams of any other chunk.
+
+    Args:
+        key: 128-bit Philox key from get_stream_keys.
+        document_id: Non-negative document id.
+        chunk_index: Non-negative chunk index within the document.
+
+    Returns:
+        Generator for the chunk.
+    """
+    if not 0 <= document_id <= MAX_COUNTER_WORD:
+        raise ValueError(f"document_id must be in [0, 2**64), got {document_id}")
+    if not 0 <= chunk_index <= MAX_COUNTER_WORD:
+        raise ValueError(f"chunk_index must be in [0, 2**64), got {chunk_index}")
+
+    counter = numpy.array([0, 0, chunk_index, document_id], dtype=numpy.uint64)
+    return numpy.random.Generator(numpy.random.Philox(counter=counter, key=key))
@@ -0,0 +1,236 @@
+"""
+Chunked perturbation of large memory-mapped documents with bounded memory use.
+"""
+
+# imports
+import copy
+import mmap
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Deque, Iterator, Optional, Pattern, Tuple, Union
+
+# project
+from alea_data_generator.perturbations.errors.chain import ErrorChain
+
+# default target chunk size in bytes
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# default number of chunks in flight per worker
+DEFAULT_PENDING_PER_WORKER = 2
+
+# number of bytes at the end of a chunk searched for a boundary before searching the whole chunk
+BOUNDARY_SEARCH_SIZE = 4096
+
+# a safe boundary follows an ASCII whitespace byte that ends a word, so words are never split and a
+# hyphenated line break ("exam-\nple") stays in one chunk
+BOUNDARY_PATTERN: Pattern[bytes] = re.compile(rb"[^\s-][ \t\n\r\f\v]")
+
+# UTF-8 continuation bytes are 0b10xxxxxx
+UTF8_CONTINUATION_MASK = 0xC0
+UTF8_CONTINUATION_BYTE = 0x80
+
+
+def find_chunk_end(buffer: Union[bytes, mmap.mmap], start: int, chunk_size: int) -> int:
+    """
+    Find the end of the chunk that starts at start, at most chunk_size bytes later.
+
+    The chunk ends after the last whitespace byte that follows a word character in the window;
+    if there is none, e.g., in one very long token, it ends at the last UTF-8 character boundary.
+
+    Args:
+        buffer: UTF-8 encoded document.
+        start: Start offset of the chunk.
+        chunk_size: Maximum chunk size in bytes.
+
+    Returns:
+        Exclusive end offset of the chunk.
+    """
+    end = min(start + chunk_size, len(buffer))
+    if end == len(buffer):
+        return end
+
+    # search the tail of the window first, then the whole window
+    for search_start in (max(start, end - BOUNDARY_SEARCH_SIZE), start):
+        last_match = None
+        for last_match in BOUNDARY_PATTERN.finditer(buffer[search_start:end]):
+            pass
+        if last_match is not None:
+            return search_start + last_match.end()
+        if search_start == start:
+            break
+
+    # fall back to a character boundary
+    while end > start + 1 and (
+        buffer[end] & UTF8_CONTINUATION_MASK == UTF8_CONTINUATION_BYTE
+    ):
+        end -= 1
+    return end
+
+
+def iter_chunk_bounds(
+    buffer: Union[bytes, mmap.mmap], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Tuple[int, int]]:
+    """
+    Split a UTF-8 encoded document into chunks at word-safe boundaries.
+
+    Args:
+        buffer: UTF-8 encoded document.
+        chunk_size: Maximum chunk size in bytes.
+
+    Yields:
+        Tuples of start and exclusive end offsets, covering the buffer in order.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    start = 0
+    while start < len(buffer):
+        end = find_chunk_end(buffer, start, chunk_size)
+        yield start, end
+        start = end
+
+
+def perturb_chunk(
+    chain: ErrorChain,
+    text: str,
+    document_id: Optional[int],
+    chunk_index: int,
+) -> str:
+    """
+    Perturb one chunk of a document.
+
+    Args:
+        chain: Error chain to apply.
+        text: Chunk text.
+        document_id: Document id for counter-based random streams; the chain's sequential
+            streams are used if None.
+        chunk_index: Index of the chunk in the document.
+
+    Returns:
+        Perturbed chunk text.
+    """
+    if document_id is not None:
+        chain.seed_chunk(document_id, chunk_index)
+    return chain.execute(text)
+
+
+def perturb_chunk_bytes(
+    chain: ErrorChain,
+    input_path: Union[str, Path],
+    *,
+    document_id: int,
+    chunk_index: int,
+    start: int,
+    end: int,
+) -> bytes:
+    """
+    Read and perturb one chunk of a document file, e.g., in a worker process.
+
+    Args:
+        chain: Error chain to apply.
+        input_path: Path to the input document.
+        document_id: Document id for counter-based random streams.
+        chunk_index: Index of the chunk in the document.
+        start: Start offset of the chunk in bytes.
+        end: Exclusive end offset of the chunk in bytes.
+
+    Returns:
+        UTF-8 encoded perturbed chunk.
+    """
+    with open(input_path, "rb") as input_file:
+        input_file.seek(start)
+        text = input_file.read(end - start).decode("utf-8")
+    return perturb_chunk(chain, text, document_id, chunk_index).encode("utf-8")
+
+
+def perturb_document(
+    chain: ErrorChain,
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    document_id: Optional[int] = None,
+    workers: int = 1,
+    max_pending: Optional[int] = None,
+) -> Tuple[int, int]:
+    """
+    Perturb a UTF-8 text file chunk by chunk and stream the result to an output file.
+
+    The input file is memory-mapped, and only a bounded number of decoded chunks and their outputs
+    are held in memory at a time, so peak memory is bounded by the chunk size rather than the
+    document size.  Count-based configurations apply their counts per chunk, and errors never span
+    two chunks.
+
+    Without a document id, chunks are processed in order with the chain's sequential random
+    streams.  With a document id, each chunk uses counter-based streams keyed by (seed, document id,
+    chunk index), so chunks can be processed by several workers and the output is identical for any
+    number of workers.  In both modes, the output is deterministic for a given seed and chunk size.
+    Runs with a document id seed copies of the chain's methods and leave the caller's random
+    streams as they were.
+
+    Args:
+        chain: Error chain to apply to each chunk.
+        input_path: Path to the input document.
+        output_path: Path to the output document.
+        chunk_size: Maximum chunk size in bytes.
+        document_id: Document id for counter-based random streams; required if workers > 1.
+        workers: Number of worker processes; chunks are processed in this process if 1.
+        max_pending: Maximum number of chunks in flight; defaults to twice the number of workers.
+
+    Returns:
+        Tuple of the number of bytes read and the number of bytes written.
+    """
+    if workers > 1 and document_id is None:
+        raise ValueError("document_id is required to perturb chunks in parallel")
+
+    bytes_written = 0
+    with open(input_path, "rb") as input_file, open(output_path, "wb") as output_file:
+        # empty files cannot be memory-mapped
+        if Path(input_path).stat().st_size == 0:
+            return 0, 0
+
+        with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            bytes_read = len(buffer)
+            chunk_bounds = enumerate(iter_chunk_bounds(buffer, chunk_size))
+
+            if document_id is not None:
+                # seed shallow copies, so the caller's chain keeps its streams, and derive the
+                # stream keys here, so unseeded methods share them with every worker
+                chain = ErrorChain([copy.copy(method) for method in chain.methods])
+                chain.seed_chunk(document_id, 0)
+
+            if workers <= 1:
+                for chunk_index, (start, end) in chunk_bounds:
+                    output_chunk = perturb_chunk(
+                        chain,
+                        buffer[start:end].decode("utf-8"),
+                        document_id,
+                        chunk_index,
+                    ).encode("utf-8")
+                    output_file.write(output_chunk)
+                    bytes_written += len(output_chunk)
+                return bytes_read, bytes_written
+
+            max_pending = max_pending or DEFAULT_PENDING_PER_WORKER * workers
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending: Deque[Future] = deque()
+                for chunk_index, (start, end) in chunk_bounds:
+                    if len(pending) >= max_pending:
+                        bytes_written += output_file.write(pending.popleft().result())
+                    pending.append(
+                        executor.submit(
+                            perturb_chunk_bytes,
+                            chain,
+                            input_path,
+                            document_id=document_id,
+                            chunk_index=chunk_index,
+                            start=start,
+                            end=end,
+                        )
+                    )
+                while pending:
+                    bytes_written += output_file.write(pending.popleft().result())
+
+    return bytes_read, bytes_written
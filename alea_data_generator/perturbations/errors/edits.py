@@ -0,0 +1,48 @@
+"""
+Edit scripts describing the changes an error method makes to a string.
+"""
+
+# imports
+from typing import List, NamedTuple, Sequence
+
+
+class Edit(NamedTuple):
+    """
+    Replace input[offset:offset + delete_length] with insert_text.
+    """
+
+    offset: int
+    delete_length: int
+    insert_text: str
+
+
+# an edit script is a list of non-overlapping edits sorted by offset
+EditScript = List[Edit]
+
+
+def apply_edits(input_string: str, edits: Sequence[Edit]) -> str:
+    """
+    Apply an edit script to a string in a single O(n + edits) pass.
+
+    Args:
+        input_string: Input string the edits refer to.
+        edits: Non-overlapping edits sorted by offset.
+
+    Returns:
+        Modified string.
+    """
+    # jump out early if there is nothing to do
+    if not edits:
+        return input_string
+
+    pieces: List[str] = []
+    cursor = 0
+    for offset, delete_length, insert_text in edits:
+        if offset < cursor:
+            raise ValueError("Edits must be sorted by offset and non-overlapping.")
+        pieces.append(input_string[cursor:offset])
+        pieces.append(insert_text)
+        cursor = offset + delete_length
+    pieces.append(input_string[cursor:])
+
+    return "".join(pieces)
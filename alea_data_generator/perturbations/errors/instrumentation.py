@@ -0,0 +1,183 @@
+"""
+Opt-in per-method instrumentation counters for the error method hot paths.
+"""
+
+# future
+from __future__ import annotations
+
+# imports
+import json
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Mapping, Union
+
+# packages
+import numpy
+
+
+@dataclass
+class MethodStats:
+    """
+    Counters for one error method.
+
+    Units are characters for character-level methods and words for word-level methods.
+    """
+
+    calls: int = 0
+    units: int = 0
+    positions: int = 0
+    get_positions_ns: int = 0
+    apply_error_ns: int = 0
+
+    def merge(self, other: Union[MethodStats, Mapping[str, int]]) -> None:
+        """
+        Add another set of counters to these counters.
+
+        Args:
+            other: Method statistics or a dictionary from to_dict.
+
+        Returns:
+            None.
+        """
+        if isinstance(other, MethodStats):
+            other = other.to_dict()
+        self.calls += int(other.get("calls", 0))
+        self.units += int(other.get("units", 0))
+        self.positions += int(other.get("positions", 0))
+        self.get_positions_ns += int(other.get("get_positions_ns", 0))
+        self.apply_error_ns += int(other.get("apply_error_ns", 0))
+
+    def to_dict(self) -> Dict[str, int]:
+        """
+        Convert the counters to a dictionary.
+
+        Returns:
+            Dictionary of counter names to values.
+        """
+        return asdict(self)
+
+
+class InstrumentationRegistry:
+    """
+    Process-wide registry of error method counters, keyed by method class name.
+
+    Instrumentation is disabled by default.  The hot paths only check the enabled flag once per
+    input, so the counters can stay compiled in; counters from worker processes can be exported with
+    to_dict and added to the parent registry with merge.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty, disabled registry.
+        """
+        self.enabled: bool = False
+        self.stats: Dict[str, MethodStats] = {}
+        self.lock = threading.Lock()
+
+    def enable(self) -> None:
+        """
+        Enable instrumentation.
+
+        Returns:
+            None.
+        """
+        self.enabled = True
+
+    def disable(self) -> None:
+        """
+        Disable instrumentation; recorded counters are kept.
+
+        Returns:
+            None.
+        """
+        self.enabled = False
+
+    def reset(self) -> None:
+        """
+        Clear all recorded counters.
+
+        Returns:
+            None.
+        """
+        with self.lock:
+            self.stats = {}
+
+    def record(
+        self,
+        name: str,
+        units: int,
+        positions: Union[numpy.ndarray, int],
+        get_positions_ns: int,
+        apply_error_ns: int,
+        *,
+        calls: int = 1,
+    ) -> None:
+        """
+        Record one or more calls of an error method.
+
+        Args:
+            name: Error method name.
+            units: Number of characters or words in the inputs.
+            positions: Boolean mask or array of the sampled positions, or their number.
+            get_positions_ns: Nanoseconds spent sampling positions.
+            apply_error_ns: Nanoseconds spent applying the error.
+            calls: Number of inputs, e.g., the size of a batch.
+
+        Returns:
+            None.
+        """
+        if isinstance(positions, int):
+            num_positions = positions
+        elif positions.dtype == numpy.bool_:
+            num_positions = int(numpy.count_nonzero(positions))
+        else:
+            num_positions = len(positions)
+        with self.lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = MethodStats()
+            stats.calls += calls
+            stats.units += units
+            stats.positions += num_positions
+            stats.get_positions_ns += get_positions_ns
+            stats.apply_error_ns += apply_error_ns
+
+    def merge(self, stats: Mapping[str, Union[MethodStats, Mapping[str, int]]]) -> None:
+        """
+        Add counters, e.g., from to_dict in a worker process, to this registry.
+
+        Args:
+            stats: Dictionary of method names to method statistics or their dictionaries.
+
+        Returns:
+            None.
+        """
+        with self.lock:
+            for name, method_stats in stats.items():
+                self.stats.setdefault(name, MethodStats()).merge(method_stats)
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        """
+        Export the counters as a dictionary.
+
+        Returns:
+            Dictionary of method names to counter dictionaries, sorted by method name.
+        """
+        with self.lock:
+            return {name: self.stats[name].to_dict() for name in sorted(self.stats)}
+
+    def to_json(self, **kwargs: Any) -> str:
+        """
+        Export the counters as JSON.
+
+        Args:
+            **kwargs: Keyword arguments for json.dumps, e.g., indent.
+
+        Returns:
+            JSON string of the to_dict output.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+# shared registry used by the error methods and chains in this process
+INSTRUMENTATION = InstrumentationRegistry()
@@ -3,18 +3,52 @@ Base class for error methods.
 """
 
 # imports
-import random
+import copy
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 # packages
+import numpy
 import numpy.random
 
-from alea_data_generator.perturbations.errors.config import (
-    ErrorConfig,
-    ErrorDistributionType,
-    ErrorSampleType,
+from alea_data_generator.perturbations.errors.alignment import OffsetAlignment
+from alea_data_generator.perturbations.errors.config import ErrorConfig
+from alea_data_generator.perturbations.errors.counter_rng import (
+    get_counter_generator,
+    get_stream_keys,
 )
+from alea_data_generator.perturbations.errors.edits import EditScript
+from alea_data_generator.perturbations.errors.random_buffer import RandomBuffer
+from alea_data_generator.perturbations.errors.sampling import (
+    CountSampler,
+    PositionSampler,
+    draw_error_counts,
+    get_count_sampler,
+    get_position_sampler,
+    positions_to_mask,
+    sample_batch_rate_positions,
+)
+
+
+# per-substitution draws needed by one call are usually few, so stateless calls draw small blocks
+STATELESS_BLOCK_SIZE = 64
+
+# default generators for stateless calls, one per thread
+THREAD_STATE = threading.local()
+
+
+def get_thread_generator() -> numpy.random.Generator:
+    """
+    Get the calling thread's default generator for stateless calls, creating it on first use.
+
+    Returns:
+        Generator owned by the calling thread, seeded with fresh entropy.
+    """
+    rng = getattr(THREAD_STATE, "rng", None)
+    if rng is None:
+        rng = THREAD_STATE.rng = numpy.random.default_rng()
+    return rng
 
 
 class BaseErrorMethod(ABC):
@@ -36,9 +70,107 @@ class BaseErrorMethod(ABC):
         self.config = config
 
         # create a method-specific rng and set seed if present in config
-        self.rng: numpy.random.RandomState = numpy.random.RandomState()  # pylint: disable=no-member
-        if self.config.seed is not None:
-            self.rng.seed(self.config.seed)
+        self.rng: numpy.random.Generator = numpy.random.default_rng(self.config.seed)
+
+        # error counts and per-substitution draws come from their own streams, so that counts can be
+        # drawn for a whole batch at once and substitutions can be served from pre-drawn blocks
+        count_seed, draw_seed = numpy.random.SeedSequence(self.config.seed).spawn(2)
+        self.count_rng: numpy.random.Generator = numpy.random.default_rng(count_seed)
+        self.random_buffer: RandomBuffer = RandomBuffer(
+            numpy.random.default_rng(draw_seed)
+        )
+
+        # counter-based stream keys for seed_chunk, derived on first use
+        self.stream_keys: Optional[numpy.ndarray] = None
+
+        # resolve the count distribution and position sampler once rather than on every call
+        self.count_sampler: Optional[CountSampler] = get_count_sampler(self.config)
+        self.position_sampler: PositionSampler = get_position_sampler(self.config)
+
+    def seed_chunk(self, document_id: int, chunk_index: int) -> None:
+        """
+        Switch the method's random streams to counter-based Philox streams for one document chunk.
+
+        The streams are keyed by the configured seed and start at a counter given by the document id
+        and chunk index, so any chunk can be perturbed on any worker, in any order, and produce the
+        same output as a sequential run that calls seed_chunk before each chunk.
+
+        Args:
+            document_id: Non-negative document id.
+            chunk_index: Non-negative chunk index within the document.
+
+        Returns:
+            None.
+        """
+        if self.stream_keys is None:
+            self.stream_keys = get_stream_keys(self.config.seed)
+
+        position_key, count_key, draw_key = self.stream_keys
+        self.rng = get_counter_generator(position_key, document_id, chunk_index)
+        self.count_rng = get_counter_generator(count_key, document_id, chunk_index)
+        self.random_buffer = RandomBuffer(
+            get_counter_generator(draw_key, document_id, chunk_index)
+        )
+
+    def with_generator(
+        self, rng: Optional[numpy.random.Generator] = None
+    ) -> "BaseErrorMethod":
+        """
+        Get a shallow copy of the method that draws every random value from the given generator.
+
+        The copy shares the configuration, samplers, and lookup tables, which are never modified
+        after construction, and owns its random streams and per-call state, so it can run while other
+        threads use the original or their own copies.
+
+        Args:
+            rng: Generator to draw from; the calling thread's default generator is used if None.
+
+        Returns:
+            Bound copy of the error method.
+        """
+        if rng is None:
+            rng = get_thread_generator()
+
+        bound = copy.copy(self)
+        bound.rng = rng
+        bound.count_rng = rng
+        bound.random_buffer = RandomBuffer(rng, STATELESS_BLOCK_SIZE)
+        return bound
+
+    def execute_stateless(
+        self, input_string: str, rng: Optional[numpy.random.Generator] = None
+    ) -> str:
+        """
+        Execute the error method without touching the method's own state, e.g., from several threads.
+
+        Outputs are reproducible for a seeded generator as long as each generator is used by one
+        thread at a time, e.g., one generator per task spawned from a SeedSequence.
+
+        Args:
+            input_string: Input string.
+            rng: Generator to draw from; the calling thread's default generator is used if None.
+
+        Returns:
+            Modified string.
+        """
+        return self.with_generator(rng).execute(input_string)
+
+    def execute_batch_stateless(
+        self,
+        input_strings: Sequence[str],
+        rng: Optional[numpy.random.Generator] = None,
+    ) -> List[str]:
+        """
+        Execute the error method on each input string in a batch without touching the method's own state.
+
+        Args:
+            input_strings: Input strings.
+            rng: Generator to draw from; the calling thread's default generator is used if None.
+
+        Returns:
+            Modified strings in input order.
+        """
+        return self.with_generator(rng).execute_batch(input_strings)
 
     @abstractmethod
     def execute(self, input_string: str) -> str:
@@ -52,6 +184,48 @@ class BaseErrorMethod(ABC):
             Modified string.
         """
 
+    def execute_with_edits(self, input_string: str) -> Tuple[str, EditScript]:
+        """
+        Execute the error method on the input string and return the edit script.
+
+        Args:
+            input_string: Input string.
+
+        Returns:
+            Tuple of the modified string and the edit script that produced it from the input string.
+        """
+        raise NotImplementedError(
+            "Subclasses must implement the execute_with_edits method."
+        )
+
+    def execute_with_alignment(self, input_string: str) -> Tuple[str, OffsetAlignment]:
+        """
+        Execute the error method on the input string and return the offset alignment.
+
+        The alignment is built from the edit script in O(edits) time and can be used to remap spans
+        in the input string to the modified string with remap_spans.
+
+        Args:
+            input_string: Input string.
+
+        Returns:
+            Tuple of the modified string and the offset alignment from the input string to it.
+        """
+        output_string, edits = self.execute_with_edits(input_string)
+        return output_string, OffsetAlignment.from_edits(edits, len(input_string))
+
+    def execute_batch(self, input_strings: Sequence[str]) -> List[str]:
+        """
+        Execute the error method on each input string in a batch.
+
+        Args:
+            input_strings: Input strings.
+
+        Returns:
+            Modified strings in input order.
+        """
+        return [self.execute(input_string) for input_string in input_strings]
+
     @abstractmethod
     def get_indices(self) -> List[int]:
         """
@@ -65,13 +239,16 @@ class BaseErrorMethod(ABC):
 
     # pylint: disable=unused-argument
     def get_positions(
-        self, length: int, input_string: Optional[str] = None
-    ) -> List[int]:
+        self,
+        length: int,
+        input_string: Optional[str] = None,
+        count: Optional[int] = None,
+    ) -> numpy.ndarray:
         """
-        Get the positions to apply the error to based on the error configuration.
+        Get a boolean mask of the positions to apply the error to based on the error configuration.
 
         If the error sample type is INDEPENDENT_RATE, the positions are sampled independently with the given rate,
-        i.e., each position is sampled with probability rate.
+        i.e., each position is sampled with probability rate, using the method's own rng.
 
         If the error sample type is FIXED_COUNT, the positions are sampled without replacement from the range of
         positions with the given count.
@@ -82,49 +259,59 @@ class BaseErrorMethod(ABC):
         Args:
             length: Length of the input string.
             input_string: Input string, which may be required by some override methods.
+            count: Pre-drawn number of errors, e.g., from sample_error_counts; drawn if None.
 
         Returns:
-            List of positions.
-        """
-        # jump out early if length is 0
-        if length == 0:
-            return []
-
-        # handle case with independent rate
-        if self.config.error_sample_type == ErrorSampleType.INDEPENDENT_RATE:
-            rate = self.config.rate
-            if rate == 0 or rate is None:
-                return []
-            if rate == 1:
-                return list(range(length))
-            return [i for i in range(length) if random.random() < rate]
-
-        # handle case with fixed count or sampled count
-        if self.config.error_sample_type == ErrorSampleType.FIXED_COUNT:
-            count = self.config.distribution_kwargs["count"]
-        elif self.config.error_sample_type == ErrorSampleType.SAMPLED_COUNT:
-            if self.config.error_distribution_type == ErrorDistributionType.UNIFORM:
-                count = self.rng.randint(**self.config.distribution_kwargs)
-            elif self.config.error_distribution_type == ErrorDistributionType.NORMAL:
-                count = self.rng.normal(**self.config.distribution_kwargs)
-            elif self.config.error_distribution_type == ErrorDistributionType.POISSON:
-                # sample a poisson distribution from inverse
-                count = self.rng.poisson(**self.config.distribution_kwargs)
-            else:
-                raise ValueError(
-                    f"Invalid error distribution type: {self.config.error_distribution_type}"
-                )
-        else:
-            raise ValueError(
-                f"Invalid error sample type: {self.config.error_sample_type}"
-            )
-
-        # if the count is greater than or equal to the length, return all positions
-        if count >= length:
-            return list(range(length))
-
-        # get numpy array with choices
-        choice_array = self.rng.choice(length, size=count, replace=False)
-
-        # return as list
-        return choice_array.tolist()  # type: ignore
+            Boolean mask of length length with the positions to apply the error set.
+        """
+        return positions_to_mask(self.sample_positions(length, count), length)
+
+    def sample_error_counts(self, size: int) -> List[Optional[int]]:
+        """
+        Draw the number of errors for each of size inputs in one vectorized call.
+
+        Args:
+            size: Number of counts to draw.
+
+        Returns:
+            List of counts, or a list of None for INDEPENDENT_RATE configurations.
+        """
+        return draw_error_counts(self.count_sampler, self.count_rng, size)
+
+    def sample_positions(
+        self, length: int, count: Optional[int] = None
+    ) -> numpy.ndarray:
+        """
+        Sample positions from the range [0, length) based on the error configuration.
+
+        Subclasses that restrict the valid positions can sample indices into their own array of
+        candidate positions with this method.
+
+        Args:
+            length: Number of positions to sample from.
+            count: Pre-drawn number of errors for count-based configurations; drawn if None.
+
+        Returns:
+            Sorted array of positions.
+        """
+        if count is None and self.count_sampler is not None:
+            count = self.sample_error_counts(1)[0]
+        return self.position_sampler(self.rng, length, count)
+
+    def sample_batch_rate_positions(
+        self, lengths: numpy.ndarray
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Sample INDEPENDENT_RATE positions for several ranges in one vectorized call.
+
+        The draws are the same as one sample_positions call per range, in order, so batches stay
+        reproducible against a loop over the ranges.
+
+        Args:
+            lengths: Number of positions to sample from in each range.
+
+        Returns:
+            Tuple of the sampled positions and the index of the range each belongs to, sorted by range
+            and position.
+        """
+        return sample_batch_rate_positions(self.rng, lengths, self.config.rate or 0.0)
@@ -5,12 +5,27 @@ Base class for character-level error methods.
 # pylint: disable=duplicate-code
 
 # imports
-from typing import List
+from time import perf_counter_ns
+from typing import List, Optional, Sequence, Tuple
 
+# packages
+import numpy
 
 # project
 from alea_data_generator.perturbations.errors.config import ErrorConfig
+from alea_data_generator.perturbations.errors.edits import EditScript, apply_edits
+from alea_data_generator.perturbations.errors.instrumentation import INSTRUMENTATION
 from alea_data_generator.perturbations.errors.methods.base import BaseErrorMethod
+from alea_data_generator.perturbations.errors.sampling import (
+    Positions,
+    get_lengths,
+    positions_to_mask,
+    split_batch_mask,
+)
+
+# input strings in a batch are joined with a character that is in no character class and starts no
+# OCR confusion, so the candidates found in the joined batch never depend on a neighbouring input
+BATCH_SEPARATOR = "\x00"
 
 
 class BaseCharacterErrorMethod(BaseErrorMethod):
@@ -18,6 +33,10 @@ class BaseCharacterErrorMethod(BaseErrorMethod):
     Base class for character-level error methods.
     """
 
+    # opt-in for subclasses whose edits from get_edits replace or insert within their own input string
+    # and read no characters past it, so one call over a joined batch equals one call per input string
+    local_edits: bool = False
+
     def __init__(self, config: ErrorConfig):
         """
         Initialize the character-level error method.
@@ -47,21 +66,309 @@ class BaseCharacterErrorMethod(BaseErrorMethod):
         Returns:
             Modified string with applied errors.
         """
-        self.input_string = input_string
-        positions = self.get_positions(len(input_string), input_string)
-        return self.apply_error(input_string, positions)
+        return self.execute_batch([input_string])[0]
+
+    def execute_with_edits(self, input_string: str) -> Tuple[str, EditScript]:
+        """
+        Execute the character-level error method on the input string and return the edit script.
+
+        Args:
+            input_string: Input string to apply errors to.
+
+        Returns:
+            Tuple of the modified string and the edit script that produced it from the input string.
+        """
+        return self.execute_batch_with_edits([input_string])[0]
+
+    def execute_batch(self, input_strings: Sequence[str]) -> List[str]:
+        """
+        Execute the character-level error method on each input string in a batch.
+
+        Positions for the whole batch are sampled up front with sample_batch_positions.  For
+        INDEPENDENT_RATE configurations of methods that opt in with local_edits, the batch is then
+        edited as one joined string with one get_edits call; otherwise, only the input strings with at
+        least one position are edited, one by one.  Either way, a seeded batch produces the same output
+        as calling execute on each input string in order.
+
+        Args:
+            input_strings: Input strings to apply errors to.
+
+        Returns:
+            Modified strings with applied errors, in input order.
+        """
+        if self.count_sampler is None and self.local_edits and len(input_strings) > 1:
+            return self._execute_joined(input_strings)
+
+        instrumented = INSTRUMENTATION.enabled
+        start = perf_counter_ns() if instrumented else 0
+        batch_positions = self.sample_batch_positions(input_strings)
+        middle = perf_counter_ns() if instrumented else 0
+        results = list(input_strings)
+        for index, positions in batch_positions:
+            self.input_string = results[index]
+            results[index] = self.apply_error(results[index], positions)
+        if instrumented:
+            self._record_batch(
+                input_strings,
+                sum(
+                    int(numpy.count_nonzero(positions))
+                    for _, positions in batch_positions
+                ),
+                start,
+                middle,
+            )
+        return results
+
+    def _execute_joined(self, input_strings: Sequence[str]) -> List[str]:
+        """
+        Execute the error method on a batch of input strings joined by BATCH_SEPARATOR.
+
+        Since local edits never reach past their own input string, the output is split at the
+        separators shifted by the length change of the edits before them.
+
+        Args:
+            input_strings: Input strings to apply errors to.
+
+        Returns:
+            Modified strings with applied errors, in input order.
+        """
+        instrumented = INSTRUMENTATION.enabled
+        start = perf_counter_ns() if instrumented else 0
+        joined = BATCH_SEPARATOR.join(input_strings)
+        lengths = get_lengths(input_strings)
+        starts = numpy.cumsum(lengths + 1) - lengths - 1
+        ends = starts + lengths
+        positions = self.sample_joined_positions(joined, starts, ends)
+        middle = perf_counter_ns() if instrumented else 0
+
+        edits = self.get_edits(joined, positions)
+        output_string = apply_edits(joined, edits)
+        offsets = numpy.fromiter(
+            (edit.offset for edit in edits), dtype=numpy.int64, count=len(edits)
+        )
+        shifts = numpy.zeros(len(edits) + 1, dtype=numpy.int64)
+        numpy.cumsum(
+            numpy.fromiter(
+                (len(edit.insert_text) - edit.delete_length for edit in edits),
+                dtype=numpy.int64,
+                count=len(edits),
+            ),
+            out=shifts[1:],
+        )
+        starts += shifts[numpy.searchsorted(offsets, starts)]
+        ends += shifts[numpy.searchsorted(offsets, ends)]
+        results = [
+            output_string[begin:end]
+            for begin, end in zip(starts.tolist(), ends.tolist())
+        ]
+
+        if instrumented:
+            self._record_batch(
+                input_strings, int(numpy.count_nonzero(positions)), start, middle
+            )
+        return results
+
+    def execute_batch_with_edits(
+        self, input_strings: Sequence[str]
+    ) -> List[Tuple[str, EditScript]]:
+        """
+        Execute the character-level error method on each input string in a batch and return the edit scripts.
+
+        Args:
+            input_strings: Input strings to apply errors to.
+
+        Returns:
+            Tuples of the modified string and its edit script, in input order.
+        """
+        instrumented = INSTRUMENTATION.enabled
+        start = perf_counter_ns() if instrumented else 0
+        batch_positions = self.sample_batch_positions(input_strings)
+        middle = perf_counter_ns() if instrumented else 0
+        results: List[Tuple[str, EditScript]] = [
+            (input_string, []) for input_string in input_strings
+        ]
+        for index, positions in batch_positions:
+            input_string = self.input_string = input_strings[index]
+            edits = self.get_edits(input_string, positions)
+            results[index] = (apply_edits(input_string, edits), edits)
+        if instrumented:
+            self._record_batch(
+                input_strings,
+                sum(
+                    int(numpy.count_nonzero(positions))
+                    for _, positions in batch_positions
+                ),
+                start,
+                middle,
+            )
+        return results
 
-    def apply_error(self, input_string: str, positions: List[int]) -> str:
+    def sample_batch_positions(
+        self, input_strings: Sequence[str]
+    ) -> List[Tuple[int, numpy.ndarray]]:
+        """
+        Sample the positions for each input string in a batch.
+
+        For INDEPENDENT_RATE configurations, candidates are found once in the input strings joined by
+        BATCH_SEPARATOR, and positions for all input strings are drawn in one vectorized call.  For
+        count-based configurations, the counts are drawn in one call and positions are sampled per
+        input string.  In both cases, the draws are the same as calling execute on each input string in
+        order.
+
+        Args:
+            input_strings: Input strings to sample positions for.
+
+        Returns:
+            Tuples of the input index and its boolean position mask, for each input string with at
+            least one position, in input order.
+        """
+        if self.count_sampler is None and len(input_strings) == 1:
+            positions = self.get_positions(len(input_strings[0]), input_strings[0])
+            return [(0, positions)] if positions.any() else []
+
+        if self.count_sampler is None:
+            joined = BATCH_SEPARATOR.join(input_strings)
+            lengths = get_lengths(input_strings)
+            starts = numpy.cumsum(lengths + 1) - lengths - 1
+            ends = starts + lengths
+            return split_batch_mask(
+                self.sample_joined_positions(joined, starts, ends), starts, ends
+            )
+
+        batch_positions = []
+        for index, (input_string, count) in enumerate(
+            zip(input_strings, self.sample_error_counts(len(input_strings)))
+        ):
+            if count == 0:
+                continue
+            self.input_string = input_string
+            positions = self.get_positions(len(input_string), input_string, count)
+            if positions.any():
+                batch_positions.append((index, positions))
+        return batch_positions
+
+    def sample_joined_positions(
+        self, joined: str, starts: numpy.ndarray, ends: numpy.ndarray
+    ) -> numpy.ndarray:
+        """
+        Sample INDEPENDENT_RATE positions for input strings joined by BATCH_SEPARATOR.
+
+        Args:
+            joined: Input strings joined by BATCH_SEPARATOR.
+            starts: Start of each input string in the joined string.
+            ends: End of each input string in the joined string.
+
+        Returns:
+            Boolean mask over the joined string with the positions of every input string set.
+        """
+        # candidates are sorted, so each input string owns a contiguous run of them
+        candidates = self.get_candidates(joined)
+        first = numpy.searchsorted(candidates, starts)
+        samples, sample_inputs = self.sample_batch_rate_positions(
+            numpy.searchsorted(candidates, ends) - first
+        )
+        return positions_to_mask(
+            candidates[first[sample_inputs] + samples], len(joined)
+        )
+
+    def _record_batch(
+        self,
+        input_strings: Sequence[str],
+        num_positions: int,
+        start: int,
+        middle: int,
+    ) -> None:
+        """
+        Record a batch in the instrumentation registry.
+
+        Args:
+            input_strings: Input strings of the batch.
+            num_positions: Number of positions sampled for the batch.
+            start: Time at which position sampling started, in nanoseconds.
+            middle: Time at which applying the errors started, in nanoseconds.
+
+        Returns:
+            None.
+        """
+        INSTRUMENTATION.record(
+            type(self).__name__,
+            sum(map(len, input_strings)),
+            num_positions,
+            middle - start,
+            perf_counter_ns() - middle,
+            calls=len(input_strings),
+        )
+
+    def get_candidates(self, input_string: str) -> numpy.ndarray:
+        """
+        Get the candidate positions that errors are sampled from, all characters by default.
+
+        Subclasses that restrict the valid positions override this.  Candidates must only depend on
+        the characters of their own input string, since batches find them in the input strings joined
+        by BATCH_SEPARATOR.
+
+        Args:
+            input_string: Input string to get candidates from.
+
+        Returns:
+            Sorted array of candidate positions.
+        """
+        return numpy.arange(len(input_string), dtype=numpy.int64)
+
+    def get_positions(
+        self,
+        length: int,
+        input_string: Optional[str] = None,
+        count: Optional[int] = None,
+    ) -> numpy.ndarray:
+        """
+        Get a boolean mask of the positions to apply the error to, sampled from the candidates.
+
+        Args:
+            length: Length of the input string.
+            input_string: Input string to get candidates from.
+            count: Pre-drawn number of errors, e.g., from sample_error_counts; drawn if None.
+
+        Returns:
+            Boolean mask of length length with the positions to apply the error set.
+        """
+        # handle case with no input string or length
+        if length == 0 or input_string is None:
+            return numpy.zeros(length, dtype=numpy.bool_)
+
+        candidates = self.get_candidates(input_string)
+        candidates = candidates[: numpy.searchsorted(candidates, length)]
+        return positions_to_mask(
+            candidates[self.sample_positions(len(candidates), count)], length
+        )
+
+    def apply_error(self, input_string: str, positions: Positions) -> str:
         """
         Apply the character-level error to the specified positions in the input string.
 
-        This method should be implemented by subclasses to define the specific error application.
+        The edit script from get_edits is applied in a single pass over the input string.
 
         Args:
             input_string: Input string to apply errors to.
-            positions: List of positions to apply the error.
+            positions: Boolean mask or list of positions to apply the error.
 
         Returns:
             Modified string with applied errors.
         """
-        raise NotImplementedError("Subclasses must implement the apply_error method.")
+        mask = positions_to_mask(positions, len(input_string))
+        return apply_edits(input_string, self.get_edits(input_string, mask))
+
+    def get_edits(self, input_string: str, positions: numpy.ndarray) -> EditScript:
+        """
+        Get the edit script for the character-level error at the specified positions in the input string.
+
+        This method should be implemented by subclasses to define the specific error application.
+
+        Args:
+            input_string: Input string to apply errors to.
+            positions: Boolean mask of the positions to apply the error.
+
+        Returns:
+            Non-overlapping edits sorted by offset.
+        """
+        raise NotImplementedError("Subclasses must implement the get_edits method.")
@@ -4,17 +4,46 @@ Base class for word-level error methods.
 
 # imports
 from abc import abstractmethod
-from typing import List
+from time import perf_counter_ns
+from typing import List, Sequence, Tuple
+
+# packages
+import numpy
 
 from alea_data_generator.perturbations.errors.config import ErrorConfig
+from alea_data_generator.perturbations.errors.edits import (
+    Edit,
+    EditScript,
+    apply_edits,
+)
+from alea_data_generator.perturbations.errors.instrumentation import INSTRUMENTATION
 
 # local imports
 from alea_data_generator.perturbations.errors.methods.base import BaseErrorMethod
+from alea_data_generator.perturbations.errors.sampling import (
+    Positions,
+    get_lengths,
+    positions_to_mask,
+    split_batch_mask,
+)
+from alea_data_generator.perturbations.errors.tokenizer import (
+    get_span_words,
+    tokenize_spans,
+)
+
+# input strings in a batch are joined with whitespace, so no word spans two inputs
+BATCH_SEPARATOR = "\n"
+
+# input index, word start offsets, word end offsets, and word position mask of one input in a batch
+BatchWordPositions = Tuple[int, numpy.ndarray, numpy.ndarray, numpy.ndarray]
 
 
 class BaseWordErrorMethod(BaseErrorMethod):
     """
     Base class for word-level error methods.
+
+    Strings are tokenized into word spans in one regex pass and edited by span, so the whitespace
+    around and between words is preserved verbatim.
     """
 
     def __init__(self, config: ErrorConfig):
@@ -34,7 +63,7 @@ class BaseWordErrorMethod(BaseErrorMethod):
         Returns:
             List of indices representing all words.
         """
-        return list(range(len(self.input_string.split())))
+        return list(range(len(tokenize_spans(self.input_string)[0])))
 
     def execute(self, input_string: str) -> str:
         """
@@ -46,13 +75,200 @@ class BaseWordErrorMethod(BaseErrorMethod):
         Returns:
             Modified string with applied errors.
         """
+        return self.execute_batch([input_string])[0]
+
+    def execute_batch(self, input_strings: Sequence[str]) -> List[str]:
+        """
+        Execute the word-level error method on each input string in a batch.
+
+        Positions for the whole batch are sampled up front with sample_batch_positions, and only the
+        input strings with at least one position are edited; the others are returned as they are.
+
+        Args:
+            input_strings: Input strings to apply errors to.
+
+        Returns:
+            Modified strings with applied errors, in input order.
+        """
+        instrumented = INSTRUMENTATION.enabled
+        start = perf_counter_ns() if instrumented else 0
+        num_words, batch_positions = self.sample_batch_positions(input_strings)
+        middle = perf_counter_ns() if instrumented else 0
+        results = list(input_strings)
+        for index, starts, ends, positions in batch_positions:
+            input_string = self.input_string = input_strings[index]
+            edits = self.get_word_edits(input_string, starts, ends, positions)
+            results[index] = apply_edits(input_string, edits)
+        if instrumented:
+            INSTRUMENTATION.record(
+                type(self).__name__,
+                num_words,
+                sum(
+                    int(numpy.count_nonzero(positions))
+                    for *_, positions in batch_positions
+                ),
+                middle - start,
+                perf_counter_ns() - middle,
+                calls=len(input_strings),
+            )
+        return results
+
+    def sample_batch_positions(
+        self, input_strings: Sequence[str]
+    ) -> Tuple[int, List[BatchWordPositions]]:
+        """
+        Sample the word positions for each input string in a batch.
+
+        For INDEPENDENT_RATE configurations, the input strings are joined by BATCH_SEPARATOR and
+        tokenized in one pass, and positions for all input strings are drawn in one vectorized call.
+        For count-based configurations, the counts are drawn in one call and positions are sampled per
+        input string.  In both cases, the draws are the same as calling execute on each input string in
+        order, so a seeded batch produces the same output.
+
+        Args:
+            input_strings: Input strings to sample positions for.
+
+        Returns:
+            Tuple of the number of words in the batch and, for each input string with at least one
+            position, its index, word start and end offsets, and boolean word position mask.
+        """
+        batch_positions: List[BatchWordPositions] = []
+
+        if self.count_sampler is None and len(input_strings) == 1:
+            starts, ends = tokenize_spans(input_strings[0])
+            positions = self.get_positions(len(starts), input_strings[0])
+            if positions.any():
+                batch_positions.append((0, starts, ends, positions))
+            return len(starts), batch_positions
+
+        if self.count_sampler is None:
+            joined = BATCH_SEPARATOR.join(input_strings)
+            starts, ends = tokenize_spans(joined)
+            lengths = get_lengths(input_strings)
+            offsets = numpy.cumsum(lengths + 1) - lengths - 1
+            first_words = numpy.searchsorted(starts, offsets)
+            last_words = numpy.append(first_words[1:], len(starts))
+            samples, sample_inputs = self.sample_batch_rate_positions(
+                last_words - first_words
+            )
+            for index, positions in split_batch_mask(
+                positions_to_mask(first_words[sample_inputs] + samples, len(starts)),
+                first_words,
+                last_words,
+            ):
+                first_word, offset = int(first_words[index]), int(offsets[index])
+                last_word = first_word + len(positions)
+                batch_positions.append(
+                    (
+                        index,
+                        starts[first_word:last_word] - offset,
+                        ends[first_word:last_word] - offset,
+                        positions,
+                    )
+                )
+            return len(starts), batch_positions
+
+        num_words = 0
+        for index, (input_string, count) in enumerate(
+            zip(input_strings, self.sample_error_counts(len(input_strings)))
+        ):
+            starts, ends = tokenize_spans(input_string)
+            num_words += len(starts)
+            if count == 0:
+                continue
+            self.input_string = input_string
+            positions = self.get_positions(len(starts), input_string, count)
+            if positions.any():
+                batch_positions.append((index, starts, ends, positions))
+        return num_words, batch_positions
+
+    def execute_with_edits(self, input_string: str) -> Tuple[str, EditScript]:
+        """
+        Execute the word-level error method on the input string and return the edit script.
+
+        Args:
+            input_string: Input string to apply errors to.
+
+        Returns:
+            Tuple of the modified string and the edit script that produced it from the input string.
+        """
+        instrumented = INSTRUMENTATION.enabled
         self.input_string = input_string
-        words = input_string.split()
-        positions = self.get_positions(len(words), input_string)
-        return self.apply_error(words, positions)
+        count = self.sample_error_counts(1)[0]
+        starts, ends = tokenize_spans(input_string)
+        start = perf_counter_ns() if instrumented else 0
+        positions = self.get_positions(len(starts), input_string, count)
+        middle = perf_counter_ns() if instrumented else 0
+        edits = self.get_word_edits(input_string, starts, ends, positions)
+        output_string = apply_edits(input_string, edits)
+        if instrumented:
+            INSTRUMENTATION.record(
+                type(self).__name__,
+                len(starts),
+                positions,
+                middle - start,
+                perf_counter_ns() - middle,
+            )
+        return output_string, edits
+
+    def apply_error(self, words: List[str], positions: Positions) -> str:
+        """
+        Apply the word-level error to the specified positions in the input words.
+
+        Args:
+            words: List of words from the input string.
+            positions: Boolean mask or list of positions to apply the error.
+
+        Returns:
+            Modified string with applied errors.
+        """
+        mask = positions_to_mask(positions, len(words))
+        return " ".join(self.apply_error_words(words, mask))
+
+    def get_word_edits(
+        self,
+        input_string: str,
+        starts: numpy.ndarray,
+        ends: numpy.ndarray,
+        positions: numpy.ndarray,
+    ) -> EditScript:
+        """
+        Get the edit script for the word-level error at the specified word positions.
+
+        By default, apply_error_words is applied to the words and each changed word is replaced in
+        place; if the number of words changes, the text from the first to the last word is replaced
+        with the space-joined result.  Subclasses can override this to keep whitespace for inserted
+        and removed words too.
+
+        Args:
+            input_string: Input string the spans refer to.
+            starts: Word start offsets.
+            ends: Word end offsets.
+            positions: Boolean mask of the word positions to apply the error.
+
+        Returns:
+            Non-overlapping edits sorted by offset.
+        """
+        if not positions.any():
+            return []
+
+        words = get_span_words(input_string, starts, ends)
+        result = self.apply_error_words(words, positions)
+        if len(result) != len(words):
+            return [Edit(int(starts[0]), int(ends[-1] - starts[0]), " ".join(result))]
+
+        return [
+            Edit(start, end - start, new_word)
+            for start, end, word, new_word in zip(
+                starts.tolist(), ends.tolist(), words, result
+            )
+            if new_word != word
+        ]
 
     @abstractmethod
-    def apply_error(self, words: List[str], positions: List[int]) -> str:
+    def apply_error_words(
+        self, words: List[str], positions: numpy.ndarray
+    ) -> List[str]:
         """
         Apply the word-level error to the specified positions in the input words.
 
@@ -60,8 +276,8 @@ class BaseWordErrorMethod(BaseErrorMethod):
 
         Args:
             words: List of words from the input string.
-            positions: List of positions to apply the error.
+            positions: Boolean mask of the positions to apply the error.
 
         Returns:
-            Modified string with applied errors.
+            Modified list of words with applied errors.
         """
@@ -2,14 +2,23 @@
 Double character error method.
 """
 
-# imports
-from typing import List
+# packages
+import numpy
 
 
 # local imports
+from alea_data_generator.perturbations.errors.codepoints import (
+    from_code_points,
+    to_code_points,
+)
+from alea_data_generator.perturbations.errors.edits import Edit, EditScript
 from alea_data_generator.perturbations.errors.methods.base_character import (
     BaseCharacterErrorMethod,
 )
+from alea_data_generator.perturbations.errors.sampling import (
+    Positions,
+    positions_to_mask,
+)
 
 
 class DoubleCharacterErrorMethod(BaseCharacterErrorMethod):
@@ -17,20 +26,34 @@ class DoubleCharacterErrorMethod(BaseCharacterErrorMethod):
     Error method that doubles characters at specified positions.
     """
 
-    def apply_error(self, input_string: str, positions: List[int]) -> str:
+    # each doubled character is inserted at its own position
+    local_edits = True
+
+    def apply_error(self, input_string: str, positions: Positions) -> str:
         """
-        Apply the double character error to the specified positions in the input string.
+        Apply the double character error by repeating the masked code points in one vectorized operation.
 
         Args:
             input_string: Input string to apply errors to.
-            positions: List of positions to apply the error.
+            positions: Boolean mask or list of positions to apply the error.
 
         Returns:
             Modified string with doubled characters.
         """
-        return "".join(
-            [
-                char * 2 if i in positions else char
-                for i, char in enumerate(input_string)
-            ]
-        )
+        mask = positions_to_mask(positions, len(input_string))
+        return from_code_points(numpy.repeat(to_code_points(input_string), mask + 1))
+
+    def get_edits(self, input_string: str, positions: numpy.ndarray) -> EditScript:
+        """
+        Get the edits that double the characters at the specified positions.
+
+        Args:
+            input_string: Input string to apply errors to.
+            positions: Boolean mask of the positions to apply the error.
+
+        Returns:
+            Non-overlapping edits sorted by offset.
+        """
+        return [
+            Edit(i, 0, input_string[i]) for i in numpy.flatnonzero(positions).tolist()
+        ]
@@ -5,8 +5,12 @@ Double word error method.
 # imports
 from typing import List
 
+# packages
+import numpy
+
 
 # local imports
+from alea_data_generator.perturbations.errors.edits import Edit, EditScript
 from alea_data_generator.perturbations.errors.methods.base_word import (
     BaseWordErrorMethod,
 )
@@ -17,20 +21,42 @@ class DoubleWordErrorMethod(BaseWordErrorMethod):
     Error method that doubles words at specified positions.
     """
 
-    def apply_error(self, words: List[str], positions: List[int]) -> str:
+    def apply_error_words(
+        self, words: List[str], positions: numpy.ndarray
+    ) -> List[str]:
         """
         Apply the double word error to the specified positions in the input words.
 
         Args:
             words: List of words from the input string.
-            positions: List of positions to apply the error.
+            positions: Boolean mask of the positions to apply the error.
+
+        Returns:
+            Modified list of words with doubled words.
+        """
+        return numpy.repeat(numpy.array(words, dtype=object), positions + 1).tolist()  # type: ignore
+
+    def get_word_edits(
+        self,
+        input_string: str,
+        starts: numpy.ndarray,
+        ends: numpy.ndarray,
+        positions: numpy.ndarray,
+    ) -> EditScript:
+        """
+        Get the edits that insert a space and a copy of each word at the specified positions.
+
+        Args:
+            input_string: Input string the spans refer to.
+            starts: Word start offsets.
+            ends: Word end offsets.
+            positions: Boolean mask of the word positions to apply the error.
 
         Returns:
-            Modified string with doubled words.
+            Non-overlapping edits sorted by offset.
         """
-        result = []
-        for i, word in enumerate(words):
-            result.append(word)
-            if i in positions:
-                result.append(word)
-        return " ".join(result)
+        indices = numpy.flatnonzero(positions)
+        return [
+            Edit(end, 0, " " + input_string[start:end])
+            for start, end in zip(starts[indices].tolist(), ends[indices].tolist())
+        ]
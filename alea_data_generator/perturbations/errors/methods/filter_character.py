@@ -3,15 +3,17 @@ Character-level error method for filtering characters based on a condition.
 """
 
 # imports
-from typing import List, Optional, Callable
+from typing import Callable, Optional
+
+# packages
+import numpy
 
 
 # local imports
-from alea_data_generator.perturbations.errors.config import (
-    ErrorConfig,
-    ErrorSampleType,
-    ErrorDistributionType,
+from alea_data_generator.perturbations.errors.character_classes import (
+    character_class_mask,
 )
+from alea_data_generator.perturbations.errors.config import ErrorConfig
 from alea_data_generator.perturbations.errors.methods.base_character import (
     BaseCharacterErrorMethod,
 )
@@ -23,76 +25,55 @@ class FilterCharacterErrorMethod(BaseCharacterErrorMethod):
     """
 
     def __init__(
-        self, config: ErrorConfig, filter_method: Callable[[str], bool] = lambda x: True
+        self,
+        config: ErrorConfig,
+        filter_method: Optional[Callable[[str], bool]] = None,
+        character_class: Optional[str] = None,
     ):
         """
         Initialize the character-level error method.
 
         Args:
             config: Error configuration.
-            filter_method: Method to filter characters.
+            filter_method: Method to filter characters; all characters are valid if None.
+            character_class: Name of a character class from character_classes.CHARACTER_CLASSES
+                to filter characters with vectorized masks; takes precedence over filter_method.
         """
         super().__init__(config)
         self.input_string: str = ""
-        self.filter_method: Callable[[str], bool] = filter_method
+        self.filter_method: Optional[Callable[[str], bool]] = filter_method
+        self.character_class: Optional[str] = character_class
+
+    def get_valid_mask(self, input_string: str) -> numpy.ndarray:
+        """
+        Get the boolean mask of characters that pass the filter.
+
+        Args:
+            input_string: Input string.
+
+        Returns:
+            Boolean mask with one entry per character.
+        """
+        if self.character_class is not None:
+            return character_class_mask(input_string, self.character_class)
+
+        if self.filter_method is None:
+            return numpy.ones(len(input_string), dtype=numpy.bool_)
+
+        return numpy.fromiter(
+            map(self.filter_method, input_string),
+            dtype=numpy.bool_,
+            count=len(input_string),
+        )
 
-    def get_positions(
-        self, length: int, input_string: Optional[str] = None
-    ) -> List[int]:
+    def get_candidates(self, input_string: str) -> numpy.ndarray:
         """
-        Get valid positions to replace from the input string.
+        Get the positions of the characters that pass the filter.
 
         Args:
-            length: Length of the input string.
-            input_string: Input string to get positions from.
+            input_string: Input string to get candidates from.
 
         Returns:
-            List of positions to replace
+            Sorted array of candidate positions.
         """
-        # handle case with no input string or length
-        if length == 0 or input_string is None:
-            return []
-
-        # get valid whitespace positions
-        valid_positions = [
-            i for i in range(length) if self.filter_method(input_string[i])
-        ]
-
-        # handle case with independent rate
-        if self.config.error_sample_type == ErrorSampleType.INDEPENDENT_RATE:
-            rate = self.config.rate
-            if rate == 0 or rate is None:
-                return []
-            if rate == 1:
-                return valid_positions
-            return [i for i in valid_positions if self.rng.random() < rate]
-
-        # handle case with fixed count or sampled count
-        if self.config.error_sample_type == ErrorSampleType.FIXED_COUNT:
-            count = min(self.config.distribution_kwargs["count"], len(valid_positions))
-        elif self.config.error_sample_type == ErrorSampleType.SAMPLED_COUNT:
-            if self.config.error_distribution_type == ErrorDistributionType.UNIFORM:
-                count = self.rng.randint(**self.config.distribution_kwargs)
-            elif self.config.error_distribution_type == ErrorDistributionType.NORMAL:
-                count = self.rng.normal(**self.config.distribution_kwargs)
-            elif self.config.error_distribution_type == ErrorDistributionType.POISSON:
-                # sample a poisson distribution from inverse
-                count = self.rng.poisson(**self.config.distribution_kwargs)
-            else:
-                raise ValueError(
-                    f"Invalid error distribution type: {self.config.error_distribution_type}"
-                )
-        else:
-            raise ValueError(
-                f"Invalid error sample type: {self.config.error_sample_type}"
-            )
-
-        # if the count is greater than or equal to the length, return all positions
-        if count >= length:
-            return valid_positions
-
-        # get numpy array with choices
-        choice_array = self.rng.choice(valid_positions, size=count, replace=False)
-
-        # return as list
-        return choice_array.tolist()  # type: ignore
+        return numpy.flatnonzero(self.get_valid_mask(input_string))
@@ -2,18 +2,18 @@
 Keyboard-based character error method.
 """
 
-# imports
-from typing import List
-
 # project
-from alea_data_generator.data.constants.keyboard import KEY_ERROR_MAPPING
+from alea_data_generator.data.constants.keyboard import (
+    KEY_ERROR_MAPPING,
+    KEY_ERROR_TABLE,
+)
 from alea_data_generator.perturbations.errors.config import ErrorConfig
-from alea_data_generator.perturbations.errors.methods.base_character import (
-    BaseCharacterErrorMethod,
+from alea_data_generator.perturbations.errors.methods.substitution_character import (
+    SubstitutionCharacterErrorMethod,
 )
 
 
-class KeyboardCharacterErrorMethod(BaseCharacterErrorMethod):
+class KeyboardCharacterErrorMethod(SubstitutionCharacterErrorMethod):
     """
     Error method that applies keyboard-based character substitutions.
     """
@@ -25,23 +25,5 @@ class KeyboardCharacterErrorMethod(BaseCharacterErrorMethod):
         Args:
             config: Error configuration.
         """
-        super().__init__(config)
+        super().__init__(config, KEY_ERROR_TABLE)
         self.keyboard_pairs = KEY_ERROR_MAPPING
-
-    def apply_error(self, input_string: str, positions: List[int]) -> str:
-        """
-        Apply the keyboard character error to the specified positions in the input string.
-
-        Args:
-            input_string: Input string to apply errors to.
-            positions: List of positions to apply the error.
-
-        Returns:
-            Modified string with keyboard-based character substitutions.
-        """
-        result = list(input_string)
-        for i in positions:
-            if input_string[i] in self.keyboard_pairs:
-                result[i] = self.rng.choice(self.keyboard_pairs[input_string[i]])
-
-        return "".join(result)
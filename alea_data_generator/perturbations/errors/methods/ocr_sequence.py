@@ -0,0 +1,99 @@
+"""
+OCR-based error method for single- and multi-character confusions, e.g., "rn" -> "m" or "(c)" -> "©".
+"""
+
+# imports
+from typing import List
+
+# packages
+import numpy
+
+# project
+from alea_data_generator.data.constants.ocr import OCR_ERROR_MAPPING
+from alea_data_generator.perturbations.errors.aho_corasick import AhoCorasickAutomaton
+from alea_data_generator.perturbations.errors.config import ErrorConfig
+from alea_data_generator.perturbations.errors.edits import Edit, EditScript
+from alea_data_generator.perturbations.errors.methods.base_character import (
+    BaseCharacterErrorMethod,
+)
+
+# automaton over every OCR confusion key, built once at import
+OCR_SEQUENCE_AUTOMATON = AhoCorasickAutomaton(tuple(OCR_ERROR_MAPPING))
+
+
+class OCRSequenceErrorMethod(BaseCharacterErrorMethod):
+    """
+    Error method that applies OCR confusions whose source may span several characters.
+
+    Every candidate site is found in one pass of an Aho-Corasick automaton over all keys of
+    OCR_ERROR_MAPPING, including n-gram merges such as "rn" -> "m" and "cl" -> "d".  Positions
+    where at least one key starts are sampled under the error configuration; at each selected
+    position, one of the keys starting there and one of its candidates are drawn, and positions
+    inside an earlier substitution are skipped.
+    """
+
+    # each confusion replaces a key inside its own input string, since no key contains the separator
+    local_edits = True
+
+    def __init__(self, config: ErrorConfig):
+        """
+        Initialize the OCR sequence error method.
+
+        Args:
+            config: Error configuration.
+        """
+        super().__init__(config)
+        self.ocr_pairs = OCR_ERROR_MAPPING
+        self.automaton: AhoCorasickAutomaton = OCR_SEQUENCE_AUTOMATON
+
+    def get_candidates(self, input_string: str) -> numpy.ndarray:
+        """
+        Get the positions where at least one OCR confusion key starts.
+
+        Args:
+            input_string: Input string to get candidates from.
+
+        Returns:
+            Sorted array of candidate positions.
+        """
+        return self.automaton.find_starts(input_string)
+
+    def get_edits(self, input_string: str, positions: numpy.ndarray) -> EditScript:
+        """
+        Get the edits that substitute OCR confusions starting at the specified positions.
+
+        Args:
+            input_string: Input string to apply errors to.
+            positions: Boolean mask of the positions to apply the error.
+
+        Returns:
+            Non-overlapping edits sorted by offset.
+        """
+        indices = numpy.flatnonzero(positions).tolist()
+
+        # two buffered uniforms per position: one for the key, one for the candidate
+        uniforms = self.random_buffer.uniforms(2 * len(indices))
+
+        edits: List[Edit] = []
+        cursor = 0
+        for j, start in enumerate(indices):
+            if start < cursor:
+                continue
+            pattern_indices = self.automaton.match_at(input_string, start)
+            if not pattern_indices:
+                continue
+
+            key = self.automaton.patterns[
+                pattern_indices[int(uniforms[2 * j] * len(pattern_indices))]
+            ]
+            candidates = self.ocr_pairs[key]
+            edits.append(
+                Edit(
+                    start,
+                    len(key),
+                    candidates[int(uniforms[2 * j + 1] * len(candidates))],
+                )
+            )
+            cursor = start + len(key)
+
+        return edits
@@ -2,13 +2,22 @@
 Skip character error method.
 """
 
-# imports
-from typing import List
+# packages
+import numpy
 
 # local imports
+from alea_data_generator.perturbations.errors.codepoints import (
+    from_code_points,
+    to_code_points,
+)
+from alea_data_generator.perturbations.errors.edits import Edit, EditScript
 from alea_data_generator.perturbations.errors.methods.base_character import (
     BaseCharacterErrorMethod,
 )
+from alea_data_generator.perturbations.errors.sampling import (
+    Positions,
+    positions_to_mask,
+)
 
 
 class SkipCharacterErrorMethod(BaseCharacterErrorMethod):
@@ -16,17 +25,32 @@ class SkipCharacterErrorMethod(BaseCharacterErrorMethod):
     Error method that skips characters at specified positions.
     """
 
-    def apply_error(self, input_string: str, positions: List[int]) -> str:
+    # each skipped character is removed at its own position
+    local_edits = True
+
+    def apply_error(self, input_string: str, positions: Positions) -> str:
         """
-        Apply the skip character error to the specified positions in the input string.
+        Apply the skip character error by dropping the masked code points in one vectorized operation.
 
         Args:
             input_string: Input string to apply errors to.
-            positions: List of positions to apply the error.
+            positions: Boolean mask or list of positions to apply the error.
 
         Returns:
             Modified string with skipped characters.
         """
-        return "".join(
-            [char for i, char in enumerate(input_string) if i not in positions]
-        )
+        mask = positions_to_mask(positions, len(input_string))
+        return from_code_points(to_code_points(input_string)[~mask])
+
+    def get_edits(self, input_string: str, positions: numpy.ndarray) -> EditScript:
+        """
+        Get the edits that skip the characters at the specified positions.
+
+        Args:
+            input_string: Input string to apply errors to.
+            positions: Boolean mask of the positions to apply the error.
+
+        Returns:
+            Non-overlapping edits sorted by offset.
+        """
+        return [Edit(i, 1, "") for i in numpy.flatnonzero(positions).tolist()]
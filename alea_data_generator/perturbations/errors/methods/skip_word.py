@@ -5,7 +5,11 @@ Skip word error method.
 # imports
 from typing import List
 
+# packages
+import numpy
+
 # local imports
+from alea_data_generator.perturbations.errors.edits import Edit, EditScript
 from alea_data_generator.perturbations.errors.methods.base_word import (
     BaseWordErrorMethod,
 )
@@ -16,15 +20,60 @@ class SkipWordErrorMethod(BaseWordErrorMethod):
     Error method that skips words at specified positions.
     """
 
-    def apply_error(self, words: List[str], positions: List[int]) -> str:
+    def apply_error_words(
+        self, words: List[str], positions: numpy.ndarray
+    ) -> List[str]:
         """
         Apply the skip word error to the specified positions in the input words.
 
         Args:
             words: List of words from the input string.
-            positions: List of positions to apply the error.
+            positions: Boolean mask of the positions to apply the error.
 
         Returns:
-            Modified string with skipped words.
+            Modified list of words with skipped words.
+        """
+        return numpy.array(words, dtype=object)[~positions].tolist()  # type: ignore
+
+    def get_word_edits(
+        self,
+        input_string: str,
+        starts: numpy.ndarray,
+        ends: numpy.ndarray,
+        positions: numpy.ndarray,
+    ) -> EditScript:
         """
-        return " ".join([word for i, word in enumerate(words) if i not in positions])
+        Get the edits that remove the words at the specified positions.
+
+        Each run of consecutive removed words is deleted with the whitespace that follows it, or with
+        the whitespace before it if the run ends with the last word, so the remaining whitespace is
+        kept verbatim.
+
+        Args:
+            input_string: Input string the spans refer to.
+            starts: Word start offsets.
+            ends: Word end offsets.
+            positions: Boolean mask of the word positions to apply the error.
+
+        Returns:
+            Non-overlapping edits sorted by offset.
+        """
+        # group the removed words into runs of consecutive words
+        runs: List[List[int]] = []
+        for i in numpy.flatnonzero(positions).tolist():
+            if runs and runs[-1][1] == i - 1:
+                runs[-1][1] = i
+            else:
+                runs.append([i, i])
+
+        edits = []
+        for first, last in runs:
+            if last < len(starts) - 1:
+                delete_start, delete_end = int(starts[first]), int(starts[last + 1])
+            elif first > 0:
+                delete_start, delete_end = int(ends[first - 1]), int(ends[last])
+            else:
+                delete_start, delete_end = int(starts[first]), int(ends[last])
+            edits.append(Edit(delete_start, delete_end - delete_start, ""))
+
+        return edits
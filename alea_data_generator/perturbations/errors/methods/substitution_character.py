@@ -0,0 +1,67 @@
+"""
+Character-level error method for substitutions drawn from a compiled substitution table.
+"""
+
+# packages
+import numpy
+
+# project
+from alea_data_generator.data.constants.substitution_table import SubstitutionTable
+from alea_data_generator.perturbations.errors.config import ErrorConfig
+from alea_data_generator.perturbations.errors.edits import Edit, EditScript
+from alea_data_generator.perturbations.errors.methods.base_character import (
+    BaseCharacterErrorMethod,
+)
+
+
+class SubstitutionCharacterErrorMethod(BaseCharacterErrorMethod):
+    """
+    Base class for error methods that substitute characters from a substitution table.
+
+    All selected positions are looked up and sampled in one vectorized gather over the table, with
+    one buffered uniform per position; positions without candidates are left unchanged.
+    """
+
+    # each substitution replaces its own character
+    local_edits = True
+
+    def __init__(self, config: ErrorConfig, table: SubstitutionTable):
+        """
+        Initialize the substitution error method.
+
+        Args:
+            config: Error configuration.
+            table: Compiled substitution table.
+        """
+        super().__init__(config)
+        self.table: SubstitutionTable = table
+
+    def get_edits(self, input_string: str, positions: numpy.ndarray) -> EditScript:
+        """
+        Get the edits that substitute table candidates at the specified positions.
+
+        Args:
+            input_string: Input string to apply errors to.
+            positions: Boolean mask of the positions to apply the error.
+
+        Returns:
+            Non-overlapping edits sorted by offset.
+        """
+        indices = numpy.flatnonzero(positions)
+        if len(indices) == 0:
+            return []
+
+        code_points = numpy.array(
+            [ord(input_string[i]) for i in indices.tolist()], dtype=numpy.int64
+        )
+        uniforms = numpy.array(
+            self.random_buffer.uniforms(len(indices)), dtype=numpy.float64
+        )
+        has_candidates, substitutions = self.table.sample(code_points, uniforms)
+
+        return [
+            Edit(i, 1, substitution)
+            for i, substitution in zip(
+                indices[has_candidates].tolist(), substitutions.tolist()
+            )
+        ]
@@ -4,13 +4,14 @@ Swap printable characters in a string.
 
 import string
 
-# imports
-from typing import List
+# packages
+import numpy
 
 # project imports
 from alea_data_generator.perturbations.errors.config import (
     ErrorConfig,
 )
+from alea_data_generator.perturbations.errors.edits import Edit, EditScript
 from alea_data_generator.perturbations.errors.methods.filter_character import (
     FilterCharacterErrorMethod,
 )
@@ -21,9 +22,12 @@ class SwapCharacterErrorMethod(FilterCharacterErrorMethod):
     Error method that swaps printable characters with other printable characters.
     """
 
+    # each swap replaces its own character
+    local_edits = True
+
     VALID_CHARACTERS = list(string.printable)
 
-    # override constructor to set lambda for filter_method to check in printable
+    # override constructor to filter on a character class
     def __init__(self, config: ErrorConfig):
         """
         Initialize the whitespace copy error method.
@@ -31,28 +35,23 @@ class SwapCharacterErrorMethod(FilterCharacterErrorMethod):
         Args:
             config: Error configuration.
         """
-        super().__init__(config, filter_method=lambda x: x in self.VALID_CHARACTERS)
+        super().__init__(config, character_class="printable")
 
-    def apply_error(self, input_string: str, positions: List[int]) -> str:
+    def get_edits(self, input_string: str, positions: numpy.ndarray) -> EditScript:
         """
-        Apply the whitespace error by replacing whitespace with 2-5 copies.
+        Get the edits that replace the characters at the positions with random printable characters.
 
         Args:
             input_string: Input string to apply errors to.
-            positions: List of positions to apply the error.
+            positions: Boolean mask of the positions to apply the error.
 
         Returns:
-            Modified string with duplicated whitespace characters.
+            Non-overlapping edits sorted by offset.
         """
-        # create a new string with duplicated whitespace characters
-        new_string = input_string
-
-        # process from right to avoid left offset changes
-        for position in sorted(positions, reverse=True):
-            # get the character at the position
-            new_char = self.rng.choice(self.VALID_CHARACTERS)
-
-            # insert the copies
-            new_string = new_string[:position] + new_char + new_string[position + 1 :]
-
-        return new_string
+        indices = numpy.flatnonzero(positions).tolist()
+        return [
+            Edit(position, 1, character)
+            for position, character in zip(
+                indices, self.random_buffer.choices(self.VALID_CHARACTERS, len(indices))
+            )
+        ]
@@ -2,10 +2,11 @@
 Module for the transpose character error method.
 """
 
-# imports
-from typing import List
+# packages
+import numpy
 
 # local imports
+from alea_data_generator.perturbations.errors.edits import Edit, EditScript
 from alea_data_generator.perturbations.errors.methods.base_character import (
     BaseCharacterErrorMethod,
 )
@@ -16,20 +17,52 @@ class TransposeCharacterErrorMethod(BaseCharacterErrorMethod):
     Error method that transposes adjacent characters at specified positions.
     """
 
-    def apply_error(self, input_string: str, positions: List[int]) -> str:
+    # each transposition reads the character after its position
+    local_edits = False
+
+    def get_edits(self, input_string: str, positions: numpy.ndarray) -> EditScript:
         """
-        Apply the transpose character error to the specified positions in the input string.
+        Get the edits that transpose the characters at the specified positions with their successors.
 
         Args:
             input_string: Input string to apply errors to.
-            positions: List of positions to apply the error.
+            positions: Boolean mask of the positions to apply the error.
 
         Returns:
-            Modified string with transposed characters.
+            Non-overlapping edits sorted by offset.
+        """
+        # transposing i, ..., j from right to left rotates the run [i, j + 1] right by one
+        edits = []
+        run_start = run_end = -1
+        for i in numpy.flatnonzero(positions).tolist():
+            if i >= len(input_string) - 1:
+                break
+            if run_start >= 0 and i == run_end + 1:
+                run_end = i
+                continue
+            if run_start >= 0:
+                edits.append(self._rotate_edit(input_string, run_start, run_end))
+            run_start = run_end = i
+        if run_start >= 0:
+            edits.append(self._rotate_edit(input_string, run_start, run_end))
+
+        return edits
+
+    @staticmethod
+    def _rotate_edit(input_string: str, start: int, end: int) -> Edit:
         """
-        result = list(input_string)
-        for i in reversed(positions):
-            if i < len(input_string) - 1:
-                result[i], result[i + 1] = result[i + 1], result[i]
+        Get the edit that moves the character after a run of transposed positions to its front.
 
-        return "".join(result)
+        Args:
+            input_string: Input string.
+            start: First position in the run.
+            end: Last position in the run.
+
+        Returns:
+            Edit replacing the run and its successor.
+        """
+        return Edit(
+            start,
+            end - start + 2,
+            "".join([input_string[end + 1], *input_string[start : end + 1]]),
+        )
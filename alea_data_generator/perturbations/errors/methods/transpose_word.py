@@ -5,6 +5,9 @@ Module that defines the transpose word error method.
 # imports
 from typing import List
 
+# packages
+import numpy
+
 
 # local imports
 from alea_data_generator.perturbations.errors.methods.base_word import (
@@ -17,20 +20,22 @@ class TransposeWordErrorMethod(BaseWordErrorMethod):
     Error method that transposes adjacent words at specified positions.
     """
 
-    def apply_error(self, words: List[str], positions: List[int]) -> str:
+    def apply_error_words(
+        self, words: List[str], positions: numpy.ndarray
+    ) -> List[str]:
         """
         Apply the transpose word error to the specified positions in the input words.
 
         Args:
             words: List of words from the input string.
-            positions: List of positions to apply the error.
+            positions: Boolean mask of the positions to apply the error.
 
         Returns:
-            Modified string with transposed words.
+            Modified list of words with transposed words.
         """
         result = words.copy()
-        for i in reversed(positions):
+        for i in reversed(numpy.flatnonzero(positions).tolist()):
             if i < len(words) - 1:
                 result[i], result[i + 1] = result[i + 1], result[i]
 
-        return " ".join(result)
+        return result
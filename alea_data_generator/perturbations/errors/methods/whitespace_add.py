@@ -2,13 +2,12 @@
 Add whitespace at random positions in the input string.
 """
 
-import random
-
-# imports
-from typing import List
+# packages
+import numpy
 
 
 # local imports
+from alea_data_generator.perturbations.errors.edits import Edit, EditScript
 from alea_data_generator.perturbations.errors.methods.base_character import (
     BaseCharacterErrorMethod,
 )
@@ -19,28 +18,27 @@ class WhitespaceAddErrorMethod(BaseCharacterErrorMethod):
     Error method that adds random whitespace characters.
     """
 
+    # each whitespace character is inserted at its own position
+    local_edits = True
+
     VALID_WHITESPACE = [" ", "\t", "\n", "\r"]
 
-    def apply_error(self, input_string: str, positions: List[int]) -> str:
+    def get_edits(self, input_string: str, positions: numpy.ndarray) -> EditScript:
         """
-        Apply the whitespace error by adding whitespace characters.
+        Get the edits that add whitespace characters before the specified positions.
 
         Args:
             input_string: Input string to apply errors to.
-            positions: List of positions to apply the error.
+            positions: Boolean mask of the positions to apply the error.
 
         Returns:
-            Modified string with added whitespace characters.
+            Non-overlapping edits sorted by offset.
         """
-        # create a new string with doubled characters
-        new_string = input_string
-
-        # process positions in reverse to avoid offset
-        for position in sorted(positions, reverse=True):
-            # new char from whitespace list
-            new_char = random.choice(self.VALID_WHITESPACE)
-
-            # insert the character
-            new_string = new_string[:position] + new_char + new_string[position:]
-
-        return new_string
+        indices = numpy.flatnonzero(positions).tolist()
+        return [
+            Edit(position, 0, whitespace)
+            for position, whitespace in zip(
+                indices,
+                self.random_buffer.choices(self.VALID_WHITESPACE, len(indices)),
+            )
+        ]
@@ -2,13 +2,14 @@
 Whitespace copy error method that replaces whitespace characters with 2-5 copies.
 """
 
-# imports
-from typing import List
+# packages
+import numpy
 
 # project imports
 from alea_data_generator.perturbations.errors.config import (
     ErrorConfig,
 )
+from alea_data_generator.perturbations.errors.edits import Edit, EditScript
 from alea_data_generator.perturbations.errors.methods.filter_character import (
     FilterCharacterErrorMethod,
 )
@@ -19,7 +20,10 @@ class WhitespaceCopyErrorMethod(FilterCharacterErrorMethod):
     Error method that duplicates whitespace characters multiple times.
     """
 
-    # override constructor to set lambda for filter_method to .isspace()
+    # each copy replaces its own whitespace character
+    local_edits = True
+
+    # override constructor to filter on a character class
     def __init__(self, config: ErrorConfig):
         """
         Initialize the whitespace copy error method.
@@ -27,33 +31,23 @@ class WhitespaceCopyErrorMethod(FilterCharacterErrorMethod):
         Args:
             config: Error configuration.
         """
-        super().__init__(config, filter_method=lambda x: x.isspace())
+        super().__init__(config, character_class="whitespace")
 
-    def apply_error(self, input_string: str, positions: List[int]) -> str:
+    def get_edits(self, input_string: str, positions: numpy.ndarray) -> EditScript:
         """
-        Apply the whitespace error by replacing whitespace with 2-5 copies.
+        Get the edits that replace the whitespace at the specified positions with 2-5 copies.
 
         Args:
             input_string: Input string to apply errors to.
-            positions: List of positions to apply the error.
+            positions: Boolean mask of the positions to apply the error.
 
         Returns:
-            Modified string with duplicated whitespace characters.
+            Non-overlapping edits sorted by offset.
         """
-        # create a new string with duplicated whitespace characters
-        new_string = input_string
-
-        # process from right to avoid left offset changes
-        for position in sorted(positions, reverse=True):
-            # get the character at the position
-            char = new_string[position]
-
-            # get the number of copies to make
-            num_copies = self.rng.randint(2, 5)
-
-            # insert the copies
-            new_string = (
-                new_string[:position] + char * num_copies + new_string[position + 1 :]
+        indices = numpy.flatnonzero(positions).tolist()
+        return [
+            Edit(position, 1, input_string[position] * copies)
+            for position, copies in zip(
+                indices, self.random_buffer.integers(2, 5, len(indices))
             )
-
-        return new_string
+        ]
@@ -2,15 +2,14 @@
 Convert a space or tab to a newline character (\r, \n).
 """
 
-import random
-
-# imports
-from typing import List
+# packages
+import numpy
 
 # project imports
 from alea_data_generator.perturbations.errors.config import (
     ErrorConfig,
 )
+from alea_data_generator.perturbations.errors.edits import Edit, EditScript
 from alea_data_generator.perturbations.errors.methods.filter_character import (
     FilterCharacterErrorMethod,
 )
@@ -21,7 +20,12 @@ class WhitespaceNewlineErrorMethod(FilterCharacterErrorMethod):
     Error method that converts a space or tab to a newline character.
     """
 
-    # override constructor to set lambda for filter_method to .isspace()
+    # each newline replaces its own whitespace character
+    local_edits = True
+
+    NEWLINES = ("\r", "\n", "\r\n")
+
+    # override constructor to filter on a character class
     def __init__(self, config: ErrorConfig):
         """
         Initialize the whitespace copy error method.
@@ -29,20 +33,23 @@ class WhitespaceNewlineErrorMethod(FilterCharacterErrorMethod):
         Args:
             config: Error configuration.
         """
-        super().__init__(config, filter_method=lambda x: x in (" ", "\t"))
+        super().__init__(config, character_class="blank")
 
-    def apply_error(self, input_string: str, positions: List[int]) -> str:
+    def get_edits(self, input_string: str, positions: numpy.ndarray) -> EditScript:
         """
-        Apply the whitespace error by replacing a space with a newline character.
+        Get the edits that replace the spaces at the specified positions with newline characters.
 
         Args:
             input_string: Input string to apply errors to.
-            positions: List of positions to apply the error.
+            positions: Boolean mask of the positions to apply the error.
 
         Returns:
-            Modified string with newline whitespace characters.
+            Non-overlapping edits sorted by offset.
         """
-        return "".join(
-            random.choice(("\r", "\n", "\r\n")) if i in positions else c
-            for i, c in enumerate(input_string)
-        )
+        indices = numpy.flatnonzero(positions).tolist()
+        return [
+            Edit(i, 1, newline)
+            for i, newline in zip(
+                indices, self.random_buffer.choices(self.NEWLINES, len(indices))
+            )
+        ]
@@ -2,16 +2,25 @@
 Whitespace remove error method that removes whitespace characters.
 """
 
-# imports
-from typing import List
+# packages
+import numpy
 
 # project imports
+from alea_data_generator.perturbations.errors.codepoints import (
+    from_code_points,
+    to_code_points,
+)
 from alea_data_generator.perturbations.errors.config import (
     ErrorConfig,
 )
+from alea_data_generator.perturbations.errors.edits import Edit, EditScript
 from alea_data_generator.perturbations.errors.methods.filter_character import (
     FilterCharacterErrorMethod,
 )
+from alea_data_generator.perturbations.errors.sampling import (
+    Positions,
+    positions_to_mask,
+)
 
 
 class WhitespaceRemoveErrorMethod(FilterCharacterErrorMethod):
@@ -19,7 +28,10 @@ class WhitespaceRemoveErrorMethod(FilterCharacterErrorMethod):
     Error method that removes whitespace characters.
     """
 
-    # override constructor to set lambda for filter_method to .isspace()
+    # each removal deletes its own whitespace character
+    local_edits = True
+
+    # override constructor to filter on a character class
     def __init__(self, config: ErrorConfig):
         """
         Initialize the whitespace copy error method.
@@ -27,25 +39,33 @@ class WhitespaceRemoveErrorMethod(FilterCharacterErrorMethod):
         Args:
             config: Error configuration.
         """
-        super().__init__(config, filter_method=lambda x: x.isspace())
+        super().__init__(config, character_class="whitespace")
 
-    def apply_error(self, input_string: str, positions: List[int]) -> str:
+    def apply_error(self, input_string: str, positions: Positions) -> str:
         """
-        Apply the whitespace error by replacing whitespace with 2-5 copies.
+        Apply the whitespace error by dropping the masked code points in one vectorized operation.
 
         Args:
             input_string: Input string to apply errors to.
-            positions: List of positions to apply the error.
+            positions: Boolean mask or list of positions to apply the error.
 
         Returns:
-            Modified string with duplicated whitespace characters.
+            Modified string with removed whitespace characters.
         """
-        # create a new string with duplicated whitespace characters
-        new_string = input_string
+        mask = positions_to_mask(positions, len(input_string))
+        return from_code_points(to_code_points(input_string)[~mask])
 
-        # process from right to avoid left offset changes
-        for position in sorted(positions, reverse=True):
-            # insert the copies
-            new_string = new_string[:position] + new_string[position + 1 :]
+    def get_edits(self, input_string: str, positions: numpy.ndarray) -> EditScript:
+        """
+        Get the edits that remove the whitespace characters at the specified positions.
 
-        return new_string
+        Args:
+            input_string: Input string to apply errors to.
+            positions: Boolean mask of the positions to apply the error.
+
+        Returns:
+            Non-overlapping edits sorted by offset.
+        """
+        return [
+            Edit(position, 1, "") for position in numpy.flatnonzero(positions).tolist()
+        ]
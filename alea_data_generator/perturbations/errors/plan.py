@@ -0,0 +1,172 @@
+"""
+Perturbation plans compiled once from a JSON or dictionary specification.
+"""
+
+# future
+from __future__ import annotations
+
+# imports
+import copy
+import dataclasses
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+# packages
+import numpy.random
+
+# project
+from alea_data_generator.perturbations.errors.config import (
+    ErrorConfig,
+    ErrorSampleType,
+)
+from alea_data_generator.perturbations.errors.corpus import MethodSpec
+from alea_data_generator.perturbations.errors.methods.base import BaseErrorMethod
+from alea_data_generator.perturbations.errors.chain import ErrorChain
+from alea_data_generator.perturbations.errors.registry import get_error_method_class
+from alea_data_generator.perturbations.errors.sampling import (
+    get_count_sampler,
+    get_position_sampler,
+)
+
+# a plan specification is either an object with "seed" and "methods" or a bare list of methods
+PlanSpec = Union[Dict[str, Any], Sequence[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class MethodPlan:
+    """
+    One validated step of a perturbation plan: an error method class and its configuration.
+
+    Method classes are pickled by reference and configurations hold only plain values and enums,
+    so a plan step is cheap to send to worker processes, including spawn-based pools.
+    """
+
+    name: str
+    method_class: Type[BaseErrorMethod]
+    config: ErrorConfig
+
+    def build(self, seed: Optional[int] = None) -> BaseErrorMethod:
+        """
+        Build the error method for this step.
+
+        Args:
+            seed: Seed to use instead of the configured seed, e.g., a shard seed.
+
+        Returns:
+            Error method.
+        """
+        config = copy.deepcopy(self.config)
+        if seed is not None:
+            config = dataclasses.replace(config, seed=seed)
+        return self.method_class(config)
+
+
+@dataclass(frozen=True)
+class PerturbationPlan:
+    """
+    Immutable, picklable sequence of validated error method steps with an optional corpus seed.
+    """
+
+    methods: Tuple[MethodPlan, ...]
+    seed: Optional[int] = None
+
+    @property
+    def specs(self) -> List[MethodSpec]:
+        """
+        Get the error method classes and configurations, e.g., for CorpusPerturber.
+
+        Returns:
+            List of error method classes and configurations, in order.
+        """
+        return [(method.method_class, method.config) for method in self.methods]
+
+    def build_methods(self) -> List[BaseErrorMethod]:
+        """
+        Build the error methods with their configured seeds.
+
+        Returns:
+            List of error methods, in order.
+        """
+        return [method.build() for method in self.methods]
+
+    def build_chain(self) -> ErrorChain:
+        """
+        Build an error chain with the configured seeds.
+
+        Returns:
+            Error chain.
+        """
+        return ErrorChain(self.build_methods())
+
+
+def validate_config(config: ErrorConfig) -> None:
+    """
+    Check that an error configuration can be sampled from, by resolving its samplers and drawing once.
+
+    Args:
+        config: Error configuration.
+
+    Returns:
+        None.
+    """
+    if config.error_sample_type == ErrorSampleType.INDEPENDENT_RATE:
+        if not isinstance(config.rate, (int, float)) or not 0 <= config.rate <= 1:
+            raise ValueError(f"rate must be a number in [0, 1], got {config.rate!r}")
+
+    try:
+        count_sampler = get_count_sampler(config)
+        get_position_sampler(config)
+        if count_sampler is not None:
+            count_sampler(numpy.random.default_rng(0), 1)
+    except (KeyError, TypeError) as error:
+        raise ValueError(
+            f"Invalid distribution_args for {config.error_sample_type.value}: {error}"
+        ) from error
+
+
+def compile_method(method_spec: Dict[str, Any]) -> MethodPlan:
+    """
+    Compile one method specification into a plan step.
+
+    Args:
+        method_spec: Dictionary with a "method" name and the ErrorConfig.from_dict fields.
+
+    Returns:
+        Validated plan step.
+    """
+    method_spec = dict(method_spec)
+    if "method" not in method_spec:
+        raise ValueError("Each method specification must have a method name.")
+    name = method_spec.pop("method")
+    method_class = get_error_method_class(name)
+    config = ErrorConfig.from_dict(method_spec)
+    validate_config(config)
+    return MethodPlan(name, method_class, config)
+
+
+def compile_plan(spec: PlanSpec) -> PerturbationPlan:
+    """
+    Compile a JSON or dictionary specification into a perturbation plan.
+
+    All validation happens here, once, so building and running the plan's error methods never
+    re-validates the specification.
+
+    Args:
+        spec: Object with an optional "seed" and a list of "methods", or a bare list of methods,
+            where each method is a "method" name and the ErrorConfig.from_dict fields.
+
+    Returns:
+        Perturbation plan.
+    """
+    # allow a bare list of methods
+    if not isinstance(spec, dict):
+        spec = {"methods": list(spec)}
+
+    seed = spec.get("seed")
+    if not isinstance(seed, int) and seed is not None:
+        raise ValueError("seed must be an integer")
+
+    return PerturbationPlan(
+        tuple(compile_method(method_spec) for method_spec in spec.get("methods", [])),
+        seed,
+    )
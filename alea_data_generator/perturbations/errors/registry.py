@@ -0,0 +1,90 @@
+"""
+Registry of error methods by name, e.g., for building error methods from configuration files.
+"""
+
+# imports
+from typing import Dict, Type
+
+# project
+from alea_data_generator.perturbations.errors.methods.base import BaseErrorMethod
+from alea_data_generator.perturbations.errors.methods.double_character import (
+    DoubleCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.double_word import (
+    DoubleWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.hyphenate_word import (
+    HyphenateWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.keyboard_character import (
+    KeyboardCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.ocr_character import (
+    OCRCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.ocr_sequence import (
+    OCRSequenceErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.skip_character import (
+    SkipCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.skip_word import (
+    SkipWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.swap_character import (
+    SwapCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.transpose_character import (
+    TransposeCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.transpose_word import (
+    TransposeWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.whitespace_add import (
+    WhitespaceAddErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.whitespace_copy import (
+    WhitespaceCopyErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.whitespace_newline import (
+    WhitespaceNewlineErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.whitespace_remove import (
+    WhitespaceRemoveErrorMethod,
+)
+
+# error method classes by their module name
+ERROR_METHODS: Dict[str, Type[BaseErrorMethod]] = {
+    "double_character": DoubleCharacterErrorMethod,
+    "double_word": DoubleWordErrorMethod,
+    "hyphenate_word": HyphenateWordErrorMethod,
+    "keyboard_character": KeyboardCharacterErrorMethod,
+    "ocr_character": OCRCharacterErrorMethod,
+    "ocr_sequence": OCRSequenceErrorMethod,
+    "skip_character": SkipCharacterErrorMethod,
+    "skip_word": SkipWordErrorMethod,
+    "swap_character": SwapCharacterErrorMethod,
+    "transpose_character": TransposeCharacterErrorMethod,
+    "transpose_word": TransposeWordErrorMethod,
+    "whitespace_add": WhitespaceAddErrorMethod,
+    "whitespace_copy": WhitespaceCopyErrorMethod,
+    "whitespace_newline": WhitespaceNewlineErrorMethod,
+    "whitespace_remove": WhitespaceRemoveErrorMethod,
+}
+
+
+def get_error_method_class(name: str) -> Type[BaseErrorMethod]:
+    """
+    Get an error method class by name.
+
+    Args:
+        name: Name of the error method, e.g., "keyboard_character".
+
+    Returns:
+        Error method class.
+    """
+    if name not in ERROR_METHODS:
+        raise ValueError(
+            f"Unknown error method: {name}; expected one of {', '.join(sorted(ERROR_METHODS))}"
+        )
+    return ERROR_METHODS[name]
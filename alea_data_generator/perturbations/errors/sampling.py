@@ -0,0 +1,489 @@
+"""
+Position sampling engine shared by the error methods.
+"""
+
+# imports
+import math
+from functools import partial
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+# packages
+import numpy
+import numpy.random
+
+# project
+from alea_data_generator.perturbations.errors.config import (
+    ErrorConfig,
+    ErrorDistributionType,
+    ErrorSampleType,
+)
+
+# count sampler signature: (rng, size) -> array of counts
+CountSampler = Callable[[numpy.random.Generator, int], numpy.ndarray]
+
+# position sampler signature: (rng, length, count) -> sorted array of positions
+PositionSampler = Callable[[numpy.random.Generator, int, Optional[int]], numpy.ndarray]
+
+# positions are either a sequence of indices or a boolean mask over the sampled range
+Positions = Union[Sequence[int], numpy.ndarray]
+
+# rates above this threshold are cheaper to sample with one Bernoulli draw over a mask
+DENSE_RATE_THRESHOLD = 0.2
+
+# sparse rate sampling draws blocks of geometric gaps this many standard deviations above the expected
+# number of hits, plus padding, so that one block almost always covers the whole range
+RATE_BLOCK_SIGMAS = 4
+RATE_BLOCK_PADDING = 16
+
+# counts below length / this factor are cheaper to sample with Floyd's algorithm than a permutation
+SPARSE_COUNT_FACTOR = 32
+
+
+def sample_rate_positions(
+    rng: numpy.random.Generator, length: int, rate: float
+) -> numpy.ndarray:
+    """
+    Sample positions independently with probability rate from the range [0, length).
+
+    For sparse rates, the gaps between hits are drawn from a geometric distribution, so the
+    cost scales with the number of sampled positions rather than the length.  For dense rates,
+    a single vectorized Bernoulli draw over the full range is used instead.
+
+    Args:
+        rng: Random number generator to draw from.
+        length: Number of positions to sample from.
+        rate: Probability of sampling each position.
+
+    Returns:
+        Sorted array of sampled positions.
+    """
+    # jump out early on empty ranges and degenerate rates
+    if length <= 0 or not rate or rate <= 0:
+        return numpy.empty(0, dtype=numpy.int64)
+    if rate >= 1:
+        return numpy.arange(length, dtype=numpy.int64)
+
+    # dense case: one uniform draw per position
+    if rate > DENSE_RATE_THRESHOLD:
+        return numpy.flatnonzero(rng.random(length) < rate).astype(numpy.int64)
+
+    # sparse case: draw blocks of geometric gaps until we pass the end of the range
+    expected = length * rate
+    block_size = (
+        int(expected + RATE_BLOCK_SIGMAS * math.sqrt(expected)) + RATE_BLOCK_PADDING
+    )
+    blocks = []
+    offset = -1
+    while True:
+        hits = offset + numpy.cumsum(rng.geometric(rate, size=block_size))
+        if hits[-1] >= length:
+            blocks.append(hits[hits < length])
+            break
+        blocks.append(hits)
+        offset = int(hits[-1])
+
+    return numpy.concatenate(blocks).astype(numpy.int64)
+
+
+class GapStream:
+    """
+    Stream of geometric gaps drawn ahead in blocks, so that values taken from it follow the order in
+    which sample_rate_positions would draw them one block at a time.
+    """
+
+    def __init__(self, rng: numpy.random.Generator, rate: float, size: int):
+        """
+        Initialize the stream and draw its first size gaps.
+
+        Args:
+            rng: Random number generator to draw from.
+            rate: Success probability of the geometric gaps.
+            size: Number of gaps to draw ahead.
+        """
+        self.rng = rng
+        self.rate = rate
+        self.gaps = rng.geometric(rate, size=size)
+        self.cursor = 0
+
+    def take(self, size: int) -> numpy.ndarray:
+        """
+        Take the next size gaps, drawing any that have not been drawn yet.
+
+        Args:
+            size: Number of gaps to take.
+
+        Returns:
+            Array of gaps.
+        """
+        missing = self.cursor + size - len(self.gaps)
+        if missing > 0:
+            self.gaps = numpy.concatenate(
+                (self.gaps[self.cursor :], self.rng.geometric(self.rate, size=missing))
+            )
+            self.cursor = 0
+        self.cursor += size
+        return self.gaps[self.cursor - size : self.cursor]
+
+    def give_back(self, size: int) -> None:
+        """
+        Return the last size gaps taken, so that they are taken again next.
+
+        Args:
+            size: Number of gaps to return.
+
+        Returns:
+            None.
+        """
+        self.cursor -= size
+
+    def extend_hits(
+        self, hits: numpy.ndarray, length: int, block_size: int
+    ) -> numpy.ndarray:
+        """
+        Extend the hits of a first block that falls short of the end of its range, as
+        sample_rate_positions does.
+
+        Args:
+            hits: Hits of the first block, all below length.
+            length: Number of positions in the range.
+            block_size: Number of gaps per block.
+
+        Returns:
+            Sorted array of all hits in the range.
+        """
+        blocks = [hits]
+        while True:
+            block = int(blocks[-1][-1]) + numpy.cumsum(self.take(block_size))
+            if block[-1] >= length:
+                blocks.append(block[block < length])
+                break
+            blocks.append(block)
+        return numpy.concatenate(blocks)
+
+
+def sample_batch_rate_positions(
+    rng: numpy.random.Generator, lengths: numpy.ndarray, rate: float
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Sample positions independently with probability rate from each of several ranges [0, length).
+
+    The result is the same as calling sample_rate_positions once per range in order, and the rng is
+    left in the same state, but the uniforms or geometric gaps for all ranges are drawn in one call.
+    Each range consumes the same values from the stream as its own call would; in the rare case that
+    the first block of gaps of a range falls short of its end, the following values of the GapStream
+    are taken as further blocks for that range, exactly as sample_rate_positions would draw them.
+
+    Args:
+        rng: Random number generator to draw from.
+        lengths: Number of positions to sample from in each range.
+        rate: Probability of sampling each position.
+
+    Returns:
+        Tuple of the sampled positions and the index of the range each belongs to, sorted by range
+        and position.
+    """
+    lengths = numpy.asarray(lengths, dtype=numpy.int64)
+    ends = numpy.cumsum(lengths)
+    starts = ends - lengths
+
+    # jump out early on degenerate rates, which draw nothing
+    if not rate or rate <= 0 or len(lengths) == 0:
+        return numpy.empty(0, dtype=numpy.int64), numpy.empty(0, dtype=numpy.int64)
+    if rate >= 1:
+        ranges = numpy.repeat(numpy.arange(len(lengths)), lengths)
+        return numpy.arange(int(ends[-1]), dtype=numpy.int64) - starts[ranges], ranges
+
+    # dense case: one uniform per position, so the draws for all ranges are one contiguous draw
+    if rate > DENSE_RATE_THRESHOLD:
+        hits = numpy.flatnonzero(rng.random(int(ends[-1])) < rate)
+        ranges = numpy.searchsorted(ends, hits, side="right")
+        return hits - starts[ranges], ranges
+
+    # sparse case: empty ranges draw nothing, and every other range draws one block of gaps first
+    nonempty = numpy.flatnonzero(lengths > 0)
+    expected = lengths[nonempty] * rate
+    block_sizes = (expected + RATE_BLOCK_SIGMAS * numpy.sqrt(expected)).astype(
+        numpy.int64
+    ) + RATE_BLOCK_PADDING
+    gaps = GapStream(rng, rate, int(block_sizes.sum()))
+
+    positions: List[numpy.ndarray] = [numpy.empty(0, dtype=numpy.int64)]
+    ranges: List[numpy.ndarray] = [numpy.empty(0, dtype=numpy.int64)]
+    first = 0
+    while first < len(nonempty):
+        # running totals of the first blocks of every remaining range; a range's hits are its totals
+        # minus the total before its block, minus one
+        block_ends = numpy.cumsum(block_sizes[first:])
+        block_starts = block_ends - block_sizes[first:]
+        totals = numpy.cumsum(gaps.take(int(block_ends[-1])))
+        bases = numpy.concatenate(([0], totals[block_ends[:-1] - 1]))
+
+        # accept every range up to the first whose block falls short of its end
+        range_lengths = lengths[nonempty[first:]]
+        short = numpy.flatnonzero(totals[block_ends - 1] - bases <= range_lengths)
+        accepted = int(short[0]) if len(short) else len(block_ends)
+
+        # totals are increasing, so the hits of an accepted range below its length are a prefix of
+        # its block
+        counts = (
+            numpy.searchsorted(
+                totals, bases[:accepted] + range_lengths[:accepted], side="right"
+            )
+            - block_starts[:accepted]
+        )
+        hit_ranges = numpy.repeat(numpy.arange(accepted), counts)
+        hit_indices = numpy.arange(len(hit_ranges)) + numpy.repeat(
+            block_starts[:accepted] - (numpy.cumsum(counts) - counts), counts
+        )
+        positions.append(totals[hit_indices] - bases[hit_ranges] - 1)
+        ranges.append(nonempty[first + hit_ranges])
+        if accepted == len(block_ends):
+            break
+
+        # give back the gaps taken for later ranges and extend the short range block by block
+        gaps.give_back(int(block_ends[-1] - block_ends[accepted]))
+        extended = gaps.extend_hits(
+            totals[block_starts[accepted] : block_ends[accepted]] - bases[accepted] - 1,
+            int(range_lengths[accepted]),
+            int(block_sizes[first + accepted]),
+        )
+        positions.append(extended)
+        ranges.append(numpy.full(len(extended), nonempty[first + accepted]))
+        first += accepted + 1
+
+    return (
+        numpy.concatenate(positions).astype(numpy.int64),
+        numpy.concatenate(ranges).astype(numpy.int64),
+    )
+
+
+def sample_count_positions(
+    rng: numpy.random.Generator, length: int, count: int
+) -> numpy.ndarray:
+    """
+    Sample count positions without replacement from the range [0, length).
+
+    When count is much smaller than length, Floyd's algorithm is used so that memory and time are
+    O(count) rather than O(length).  Otherwise, a permutation of the range is cheaper and is used instead.
+
+    Args:
+        rng: Random number generator to draw from.
+        length: Number of positions to sample from.
+        count: Number of positions to sample.
+
+    Returns:
+        Sorted array of sampled positions.
+    """
+    # jump out early on empty ranges and degenerate counts
+    if length <= 0 or count <= 0:
+        return numpy.empty(0, dtype=numpy.int64)
+    if count >= length:
+        return numpy.arange(length, dtype=numpy.int64)
+
+    # dense case: take a prefix of a permutation
+    if count * SPARSE_COUNT_FACTOR >= length:
+        return numpy.sort(rng.permutation(length)[:count])
+
+    # sparse case: Floyd's algorithm with all uniforms drawn in one call
+    selected: set[int] = set()
+    for j, u in zip(range(length - count, length), rng.random(count).tolist()):
+        t = int(u * (j + 1))
+        selected.add(j if t in selected else t)
+
+    return numpy.sort(numpy.fromiter(selected, dtype=numpy.int64, count=count))
+
+
+def _fixed_counts(_rng: numpy.random.Generator, size: int, count: int) -> numpy.ndarray:
+    """
+    Draw fixed error counts; the rng slot of the count sampler signature is ignored.
+    """
+    return numpy.full(size, count, dtype=numpy.int64)
+
+
+def _uniform_counts(
+    rng: numpy.random.Generator, size: int, **kwargs: Any
+) -> numpy.ndarray:
+    """
+    Draw error counts from a uniform distribution.
+    """
+    return rng.integers(size=size, **kwargs)
+
+
+def _normal_counts(
+    rng: numpy.random.Generator, size: int, **kwargs: Any
+) -> numpy.ndarray:
+    """
+    Draw error counts from a normal distribution, rounded to integers.
+    """
+    return numpy.rint(rng.normal(size=size, **kwargs))
+
+
+def _poisson_counts(
+    rng: numpy.random.Generator, size: int, **kwargs: Any
+) -> numpy.ndarray:
+    """
+    Draw error counts from a poisson distribution.
+    """
+    return rng.poisson(size=size, **kwargs)
+
+
+def get_count_sampler(config: ErrorConfig) -> Optional[CountSampler]:
+    """
+    Resolve the error configuration into a function that draws a vector of error counts.
+
+    The returned sampler is a partial over a module-level function, so it can be resolved once
+    per method and reused for every call.  Drawing n counts in one call yields the same values as
+    n calls drawing one count each.
+
+    Args:
+        config: Error configuration.
+
+    Returns:
+        Count sampler taking an rng and a size, or None for INDEPENDENT_RATE configurations.
+    """
+    if config.error_sample_type == ErrorSampleType.INDEPENDENT_RATE:
+        return None
+
+    if config.error_sample_type == ErrorSampleType.FIXED_COUNT:
+        return partial(_fixed_counts, count=config.distribution_kwargs["count"])
+
+    if config.error_sample_type == ErrorSampleType.SAMPLED_COUNT:
+        if config.error_distribution_type == ErrorDistributionType.UNIFORM:
+            return partial(_uniform_counts, **config.distribution_kwargs)
+        if config.error_distribution_type == ErrorDistributionType.NORMAL:
+            return partial(_normal_counts, **config.distribution_kwargs)
+        if config.error_distribution_type == ErrorDistributionType.POISSON:
+            return partial(_poisson_counts, **config.distribution_kwargs)
+        raise ValueError(
+            f"Invalid error distribution type: {config.error_distribution_type}"
+        )
+
+    raise ValueError(f"Invalid error sample type: {config.error_sample_type}")
+
+
+def _rate_positions(
+    rng: numpy.random.Generator, length: int, _count: Optional[int], rate: float
+) -> numpy.ndarray:
+    """
+    Sample positions independently with a bound rate; the count slot of the signature is ignored.
+    """
+    return sample_rate_positions(rng, length, rate)
+
+
+def _count_positions(
+    rng: numpy.random.Generator, length: int, count: Optional[int]
+) -> numpy.ndarray:
+    """
+    Sample a pre-drawn count of positions without replacement.
+    """
+    return sample_count_positions(rng, length, count or 0)
+
+
+def get_position_sampler(config: ErrorConfig) -> PositionSampler:
+    """
+    Resolve the error configuration into a function that samples positions for a pre-drawn count.
+
+    Like get_count_sampler, the returned sampler is a partial over a module-level function, so it is
+    picklable and the configuration is not re-interpreted on every call.
+
+    Args:
+        config: Error configuration.
+
+    Returns:
+        Position sampler taking an rng, a length, and a count, which is ignored for INDEPENDENT_RATE.
+    """
+    if config.error_sample_type == ErrorSampleType.INDEPENDENT_RATE:
+        return partial(_rate_positions, rate=config.rate or 0.0)
+
+    if config.error_sample_type in (
+        ErrorSampleType.FIXED_COUNT,
+        ErrorSampleType.SAMPLED_COUNT,
+    ):
+        return _count_positions
+
+    raise ValueError(f"Invalid error sample type: {config.error_sample_type}")
+
+
+def draw_error_counts(
+    count_sampler: Optional[CountSampler],
+    rng: numpy.random.Generator,
+    size: int,
+) -> List[Optional[int]]:
+    """
+    Draw the number of errors to apply for each of size inputs.
+
+    Args:
+        count_sampler: Count sampler from get_count_sampler.
+        rng: Random number generator to draw from.
+        size: Number of counts to draw.
+
+    Returns:
+        List of non-negative counts, or a list of None if there is no count sampler.
+    """
+    if count_sampler is None:
+        return [None] * size
+    return numpy.maximum(count_sampler(rng, size), 0).astype(numpy.int64).tolist()  # type: ignore
+
+
+def positions_to_mask(positions: Positions, length: int) -> numpy.ndarray:
+    """
+    Convert positions to a boolean mask over the range [0, length).
+
+    Args:
+        positions: Boolean mask or sequence of positions.
+        length: Length of the mask.
+
+    Returns:
+        Boolean mask, which is the input itself if it is already a mask of the right length.
+    """
+    if isinstance(positions, numpy.ndarray) and positions.dtype == numpy.bool_:
+        if len(positions) != length:
+            raise ValueError(
+                f"Position mask length {len(positions)} does not match input length {length}."
+            )
+        return positions
+
+    mask = numpy.zeros(length, dtype=numpy.bool_)
+    mask[numpy.asarray(positions, dtype=numpy.int64)] = True
+    return mask
+
+
+def get_lengths(input_strings: Sequence[str]) -> numpy.ndarray:
+    """
+    Get the lengths of a batch of strings as an array.
+
+    Args:
+        input_strings: Input strings.
+
+    Returns:
+        Array with the length of each input string.
+    """
+    return numpy.fromiter(
+        map(len, input_strings), dtype=numpy.int64, count=len(input_strings)
+    )
+
+
+def split_batch_mask(
+    mask: numpy.ndarray, starts: numpy.ndarray, ends: numpy.ndarray
+) -> List[Tuple[int, numpy.ndarray]]:
+    """
+    Split a boolean mask over a joined batch into the masks of the inputs with any position set.
+
+    Args:
+        mask: Boolean mask over the joined batch.
+        starts: Start of each input in the mask, in increasing order.
+        ends: End of each input in the mask; positions between an end and the next start, e.g.,
+            separators, are dropped.
+
+    Returns:
+        Tuples of the input index and its mask, a view into mask, in input order.
+    """
+    hits = numpy.flatnonzero(mask)
+    indices = numpy.searchsorted(starts, hits, side="right") - 1
+    indices = numpy.unique(indices[hits < ends[indices]])
+    return [
+        (index, mask[start:end])
+        for index, start, end in zip(
+            indices.tolist(), starts[indices].tolist(), ends[indices].tolist()
+        )
+    ]
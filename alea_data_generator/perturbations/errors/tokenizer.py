@@ -0,0 +1,70 @@
+"""
+Offset-preserving word tokenizer for word-level error methods.
+"""
+
+# imports
+import re
+from itertools import chain
+from typing import List, Pattern, Tuple
+
+# packages
+import numpy
+
+# project
+from alea_data_generator.perturbations.errors.character_classes import (
+    character_class_mask,
+)
+
+# words are maximal runs of non-whitespace characters, matching str.split()
+WORD_PATTERN: Pattern[str] = re.compile(r"\S+")
+
+# strings at least this long are tokenized with vectorized whitespace masks rather than the regex
+VECTORIZED_TOKENIZE_LENGTH = 1024
+
+
+def tokenize_spans(
+    input_string: str, pattern: Pattern[str] = WORD_PATTERN
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Find all word spans in one pass.
+
+    Long strings are tokenized with the default pattern by taking the edges of a vectorized
+    whitespace mask, which matches the regex since both use str.isspace; otherwise the regex is used.
+
+    Args:
+        input_string: Input string to tokenize.
+        pattern: Compiled word pattern.
+
+    Returns:
+        Tuple of start and end offset arrays, one entry per word.
+    """
+    # for the default pattern, word boundaries are the edges of the non-whitespace mask
+    if pattern is WORD_PATTERN and len(input_string) >= VECTORIZED_TOKENIZE_LENGTH:
+        is_word = ~character_class_mask(input_string, "whitespace")
+        edges = numpy.flatnonzero(numpy.diff(is_word, prepend=False, append=False))
+        return edges[0::2], edges[1::2]
+
+    offsets = numpy.fromiter(
+        chain.from_iterable(match.span() for match in pattern.finditer(input_string)),
+        dtype=numpy.int64,
+    )
+    return offsets[0::2], offsets[1::2]
+
+
+def get_span_words(
+    input_string: str, starts: numpy.ndarray, ends: numpy.ndarray
+) -> List[str]:
+    """
+    Get the words for a list of spans.
+
+    Args:
+        input_string: Input string the spans refer to.
+        starts: Start offsets.
+        ends: End offsets.
+
+    Returns:
+        List of words.
+    """
+    return [
+        input_string[start:end] for start, end in zip(starts.tolist(), ends.tolist())
+    ]
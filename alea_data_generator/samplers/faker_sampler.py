@@ -1,12 +1,20 @@
 """
 Faker sampling interface designed to simplify and improve on default faker behavior.
+
+The shared FAKER_INSTANCE and FAKER_TAG_MAP are created on first access rather than at import time,
+since importing faker and binding its providers dominates the import time of the package.
 """
 
+# future
+from __future__ import annotations
+
 # imports
-from typing import Callable, Dict, Optional
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
 # packages
-from faker import Faker
+if TYPE_CHECKING:
+    from faker import Faker
 
 # project
 
@@ -248,6 +256,9 @@ def get_faker_instance(
     Returns:
         Faker: The faker instance.
     """
+    # import faker on first use
+    from faker import Faker  # pylint: disable=import-outside-toplevel
+
     # create the faker instance
     instance = Faker(locale)
 
@@ -278,8 +289,52 @@ def get_faker_tag_map(faker_instance: Faker) -> Dict[str, Callable]:
     return method_map
 
 
-# create the shared faker instance
-FAKER_INSTANCE = get_faker_instance()
+# shared faker instance and default tag map, created on first access by __getattr__
+SHARED_STATE: Dict[str, Any] = {}
+SHARED_STATE_LOCK = threading.Lock()
+
+
+def get_shared_faker_instance() -> Faker:
+    """
+    Get the shared faker instance, creating it on first use.
+
+    Returns:
+        Faker: The shared faker instance.
+    """
+    if "instance" not in SHARED_STATE:
+        with SHARED_STATE_LOCK:
+            if "instance" not in SHARED_STATE:
+                SHARED_STATE["instance"] = get_faker_instance()
+    return SHARED_STATE["instance"]
+
+
+def get_shared_faker_tag_map() -> Dict[str, Callable]:
+    """
+    Get the default tag map bound to the shared faker instance, creating it on first use.
 
-# create the default tag map
-FAKER_TAG_MAP = get_faker_tag_map(FAKER_INSTANCE)
+    Returns:
+        Dict[str, Callable]: The map of faker methods by name.
+    """
+    if "tag_map" not in SHARED_STATE:
+        instance = get_shared_faker_instance()
+        with SHARED_STATE_LOCK:
+            if "tag_map" not in SHARED_STATE:
+                SHARED_STATE["tag_map"] = get_faker_tag_map(instance)
+    return SHARED_STATE["tag_map"]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Create FAKER_INSTANCE and FAKER_TAG_MAP on first access.
+
+    Args:
+        name (str): The module attribute name.
+
+    Returns:
+        Any: The attribute value.
+    """
+    if name == "FAKER_INSTANCE":
+        return get_shared_faker_instance()
+    if name == "FAKER_TAG_MAP":
+        return get_shared_faker_tag_map()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
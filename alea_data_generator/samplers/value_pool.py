@@ -0,0 +1,352 @@
+"""
+Pre-generated value pools for expensive tag methods, e.g., Faker providers, with background refresh.
+"""
+
+# imports
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+# packages
+import numpy
+import numpy.dtypes
+
+# project
+from alea_data_generator.samplers.faker_sampler import (
+    get_faker_instance,
+    get_faker_tag_map,
+)
+
+# default number of values per pool
+DEFAULT_POOL_SIZE = 1000
+
+# default fraction of each pool replaced per refresh
+DEFAULT_REFRESH_FRACTION = 0.1
+
+
+class ValuePool:
+    """
+    Pool of pre-generated string values for one tag method.
+
+    Values are stored as one numpy StringDType array and sampled with numpy indices.  The pool is
+    filled on first use; refresh replaces the oldest values with new ones, so the pool keeps a
+    bounded number of distinct values that rotate over time.  Fills and refreshes hold the refresh
+    lock, and refreshes build a new array and swap it in, so sampling never sees a partially
+    refreshed pool and needs no lock.
+
+    Calls with arguments cannot be served from the pool and are passed to the tag method.
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., Any],
+        size: int = DEFAULT_POOL_SIZE,
+        rng: Optional[numpy.random.Generator] = None,
+        lock: Optional[threading.Lock] = None,
+    ):
+        """
+        Initialize the value pool.
+
+        Args:
+            method (Callable[..., Any]): The tag method to generate values with.
+            size (int): The number of values in the pool.
+            rng (Optional[numpy.random.Generator]): The generator to sample indices with.
+            lock (Optional[threading.Lock]): The lock to hold while calling the tag method, e.g., one
+                shared by all pools on the same Faker instance.
+        """
+        if size < 1:
+            raise ValueError("size must be positive")
+
+        self.method = method
+        self.size = size
+        self.rng = rng if rng is not None else numpy.random.default_rng()
+        self.lock = lock if lock is not None else threading.Lock()
+        self.refresh_lock = threading.Lock()
+        self.values: Optional[numpy.ndarray] = None
+        self.cursor = 0
+
+    def __len__(self) -> int:
+        """
+        Get the number of values in the pool.
+
+        Returns:
+            int: The pool size.
+        """
+        return self.size
+
+    @property
+    def is_filled(self) -> bool:
+        """
+        Check whether the pool has been filled.
+
+        Returns:
+            bool: True if the pool has been filled.
+        """
+        return self.values is not None
+
+    def generate(self, count: int) -> List[str]:
+        """
+        Generate new string values with the tag method.
+
+        Args:
+            count (int): The number of values to generate.
+
+        Returns:
+            List[str]: The generated values.
+        """
+        with self.lock:
+            return [str(self.method()) for _ in range(count)]
+
+    def fill(self) -> numpy.ndarray:
+        """
+        Fill the pool if it has not been filled yet.
+
+        Returns:
+            numpy.ndarray: The pool values.
+        """
+        values = self.values
+        if values is None:
+            # fill under the refresh lock, so concurrent first uses generate the pool only once
+            with self.refresh_lock:
+                if self.values is None:
+                    # StringDType is created at import time by numpy's C extension, so pylint
+                    # cannot see it
+                    # pylint: disable-next=no-member
+                    string_dtype = numpy.dtypes.StringDType()
+                    self.values = numpy.array(
+                        self.generate(self.size), dtype=string_dtype
+                    )
+                values = self.values
+        return values
+
+    def refresh(self, count: int) -> None:
+        """
+        Replace the count oldest values in the pool with new values.
+
+        Args:
+            count (int): The number of values to replace.
+
+        Returns:
+            None.
+        """
+        if self.values is None or count < 1:
+            return
+
+        count = min(count, self.size)
+        with self.refresh_lock:
+            slots = (self.cursor + numpy.arange(count)) % self.size
+            values = self.values.copy()
+            values[slots] = self.generate(count)
+            self.values = values
+            self.cursor = int((self.cursor + count) % self.size)
+
+    def sample_many(self, n: int, *args: Any) -> List[Any]:
+        """
+        Sample n values from the pool.
+
+        Args:
+            n (int): The number of values to sample.
+            *args (Any): Arguments for the tag method; if any are given, the method is called n times.
+
+        Returns:
+            List[Any]: The sampled values.
+        """
+        if args:
+            with self.lock:
+                return [self.method(*args) for _ in range(n)]
+
+        values = self.fill()
+        return values[self.rng.integers(0, len(values), size=n)].tolist()
+
+    def __call__(self, *args: Any) -> Any:
+        """
+        Sample one value from the pool.
+
+        Args:
+            *args (Any): Arguments for the tag method; if any are given, the method is called directly.
+
+        Returns:
+            Any: The sampled value.
+        """
+        if args:
+            with self.lock:
+                return self.method(*args)
+
+        values = self.fill()
+        return values[int(self.rng.integers(0, len(values)))]
+
+
+class ValuePoolTagMap(Mapping[str, ValuePool]):
+    """
+    Tag map of value pools, usable as a drop-in tag_map for FakerTemplateFormatter.
+
+    Pools are created for every tag but only filled when first sampled.  Background refresh is opt-in:
+    with a refresh_interval, a daemon thread periodically replaces a fraction of each filled pool,
+    oldest values first.  Since the timing of refreshes is not deterministic, seeded runs should leave
+    it disabled and call refresh explicitly.
+    """
+
+    def __init__(
+        self,
+        tag_map: Mapping[str, Callable[..., Any]],
+        *,
+        pool_sizes: Optional[Mapping[str, int]] = None,
+        default_pool_size: int = DEFAULT_POOL_SIZE,
+        refresh_fraction: float = DEFAULT_REFRESH_FRACTION,
+        refresh_interval: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the tag map of value pools.
+
+        Args:
+            tag_map (Mapping[str, Callable[..., Any]]): The tag methods to pool values for.
+            pool_sizes (Optional[Mapping[str, int]]): Pool sizes by tag, e.g., larger pools for names.
+            default_pool_size (int): The pool size for tags without a size in pool_sizes.
+            refresh_fraction (float): The fraction of each pool replaced per refresh.
+            refresh_interval (Optional[float]): Seconds between background refreshes; None, the default,
+                disables them.
+            seed (Optional[int]): The seed for sampling pool indices.
+        """
+        self.refresh_fraction = refresh_fraction
+        self.refresh_interval = refresh_interval
+
+        # tag methods usually share one generator, e.g., a Faker instance, so they share a lock
+        lock = threading.Lock()
+        pool_sizes = pool_sizes or {}
+        rngs = numpy.random.default_rng(seed).spawn(len(tag_map))
+        self.pools: Dict[str, ValuePool] = {
+            tag: ValuePool(
+                method, size=pool_sizes.get(tag, default_pool_size), rng=rng, lock=lock
+            )
+            for (tag, method), rng in zip(tag_map.items(), rngs)
+        }
+
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        if refresh_interval is not None:
+            self.start()
+
+    def __getitem__(self, tag: str) -> ValuePool:
+        """
+        Get the value pool for a tag.
+
+        Args:
+            tag (str): The tag name.
+
+        Returns:
+            ValuePool: The value pool.
+        """
+        return self.pools[tag]
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the tags.
+
+        Returns:
+            Iterator[str]: The tag names.
+        """
+        return iter(self.pools)
+
+    def __len__(self) -> int:
+        """
+        Get the number of tags.
+
+        Returns:
+            int: The number of tags.
+        """
+        return len(self.pools)
+
+    def refresh(self) -> None:
+        """
+        Replace the configured fraction of each filled pool with new values.
+
+        Returns:
+            None.
+        """
+        for pool in self.pools.values():
+            if self.stop_event.is_set():
+                return
+            if pool.is_filled:
+                pool.refresh(max(1, int(len(pool) * self.refresh_fraction)))
+
+    def run(self) -> None:
+        """
+        Refresh the pools every refresh_interval seconds until stopped.
+
+        Returns:
+            None.
+        """
+        while not self.stop_event.wait(self.refresh_interval):
+            self.refresh()
+
+    def start(self) -> None:
+        """
+        Start the background refresh thread if it is not running.
+
+        Returns:
+            None.
+        """
+        if self.thread is not None and self.thread.is_alive():
+            return
+        if self.refresh_interval is None:
+            raise ValueError(
+                "refresh_interval must be set to refresh in the background"
+            )
+
+        self.stop_event.clear()
+        self.thread = threading.Thread(
+            target=self.run, name="value-pool-refresh", daemon=True
+        )
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background refresh thread and wait for it to finish.
+
+        Returns:
+            None.
+        """
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def __enter__(self) -> "ValuePoolTagMap":
+        """
+        Enter a context that stops background refresh on exit.
+
+        Returns:
+            ValuePoolTagMap: The tag map.
+        """
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """
+        Stop background refresh.
+
+        Returns:
+            None.
+        """
+        self.stop()
+
+
+def get_faker_value_pools(
+    locale: Optional[str] = None,
+    seed: Optional[int] = None,
+    **kwargs: Any,
+) -> ValuePoolTagMap:
+    """
+    Get a tag map of value pools over the default Faker tag methods of a new Faker instance.
+
+    Args:
+        locale (Optional[str]): The locale to use for the Faker instance.
+        seed (Optional[int]): The seed for the Faker instance and for sampling pool indices.
+        **kwargs (Any): Keyword arguments for ValuePoolTagMap, e.g., pool_sizes.
+
+    Returns:
+        ValuePoolTagMap: The tag map of value pools.
+    """
+    faker_instance = get_faker_instance(locale)
+    if seed is not None:
+        faker_instance.seed_instance(seed)
+    return ValuePoolTagMap(get_faker_tag_map(faker_instance), seed=seed, **kwargs)
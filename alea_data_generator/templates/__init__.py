@@ -1,7 +1,22 @@
 """Initialization file for the templates module."""
 
+from typing import TYPE_CHECKING, Any
+
 from .faker_formatter import FakerTemplateFormatter
-from .jinja2_formatter import Jinja2TemplateFormatter
 from .template_formatter import TemplateFormatter
 
+# only type checkers import jinja2 eagerly; at runtime, __getattr__ provides the formatter lazily
+if TYPE_CHECKING:
+    from .jinja2_formatter import Jinja2TemplateFormatter
+
 __all__ = ["TemplateFormatter", "FakerTemplateFormatter", "Jinja2TemplateFormatter"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import Jinja2TemplateFormatter, and with it jinja2, on first access."""
+    if name == "Jinja2TemplateFormatter":
+        # pylint: disable=import-outside-toplevel
+        from .jinja2_formatter import Jinja2TemplateFormatter
+
+        return Jinja2TemplateFormatter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
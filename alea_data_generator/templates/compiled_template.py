@@ -0,0 +1,102 @@
+"""CompiledTemplate class for rendering a lexed template in a single pass."""
+
+# Standard library imports
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# a tag is identified by its name, optional index, and optional raw argument string
+TagKey = Tuple[str, Optional[str], Optional[str]]
+
+
+@dataclass(frozen=True)
+class TagSlot:
+    """A distinct tag in a template with its pre-parsed arguments."""
+
+    key: TagKey
+    args: Optional[Tuple[Any, ...]] = None
+    args_error: Optional[Exception] = None
+
+    @property
+    def tag(self) -> str:
+        """
+        Get the tag name.
+
+        Returns:
+            str: The tag name.
+        """
+        return self.key[0]
+
+    @property
+    def has_args(self) -> bool:
+        """
+        Check whether the tag has an argument string, even an empty one.
+
+        Returns:
+            bool: True if the tag has an argument string.
+        """
+        return self.key[2] is not None
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """
+    A template lexed once into literal segments and tag slots.
+
+    The literals interleave with the tag occurrences, so there is one more literal than there are
+    occurrences; each occurrence refers to one of the distinct slots, in order of first occurrence,
+    and every occurrence of a slot renders the same value.
+    """
+
+    template: str
+    literals: Tuple[str, ...]
+    occurrences: Tuple[int, ...]
+    slots: Tuple[TagSlot, ...]
+
+    def render(self, values: Sequence[str]) -> str:
+        """
+        Render the template with one string value per slot in a single join.
+
+        Args:
+            values (Sequence[str]): String values for each slot, in slot order.
+
+        Returns:
+            str: The rendered template.
+        """
+        if not self.occurrences:
+            return self.template
+
+        parts = [""] * (2 * len(self.occurrences) + 1)
+        parts[0::2] = self.literals
+        parts[1::2] = [values[slot_index] for slot_index in self.occurrences]
+        return "".join(parts)
+
+    def render_with_spans(
+        self, values: Sequence[str]
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Render the template and record the span of each tag occurrence in one pass.
+
+        Args:
+            values (Sequence[str]): String values for each slot, in slot order.
+
+        Returns:
+            Tuple[str, List[Dict[str, Any]]]: The rendered template and one span per tag occurrence,
+                with its start, end, tag, and value, in order.
+        """
+        parts: List[str] = [self.literals[0]]
+        spans: List[Dict[str, Any]] = []
+        offset = len(self.literals[0])
+        for slot_index, literal in zip(self.occurrences, self.literals[1:]):
+            value = values[slot_index]
+            spans.append(
+                {
+                    "start": offset,
+                    "end": offset + len(value),
+                    "tag": self.slots[slot_index].tag,
+                    "value": value,
+                }
+            )
+            parts.append(value)
+            parts.append(literal)
+            offset += len(value) + len(literal)
+        return "".join(parts), spans
@@ -3,13 +3,14 @@
 # Standard library imports
 import random
 import re
-from typing import Any, Callable, Dict, Optional, Tuple
-
-# packages
-from faker import Faker
+from typing import Any, Callable, Dict, Optional
 
 # projects
-from alea_data_generator.samplers.faker_sampler import FAKER_TAG_MAP
+from alea_data_generator.samplers.faker_sampler import (
+    get_faker_instance,
+    get_shared_faker_tag_map,
+)
+from alea_data_generator.templates.compiled_template import TagSlot
 from alea_data_generator.templates.template_formatter import TemplateFormatter
 
 
@@ -34,39 +35,33 @@ class FakerTemplateFormatter(TemplateFormatter):
             seed (Optional[int]): The seed for the random number generator.
             tag_map (Optional[Dict[str, Callable]]): Custom tag map to extend or override default tags.
         """
-        super().__init__(pattern_mapper, FAKER_TAG_MAP.copy())
-        self.faker = Faker(locale)
+        super().__init__(pattern_mapper, get_shared_faker_tag_map().copy())
+        self.faker = get_faker_instance(locale)
         if seed is not None:
             random.seed(seed)
             self.faker.seed_instance(seed)
         if tag_map:
             self.tag_map.update(tag_map)
 
-    def sample_values(
-        self, pattern_map: Dict[Tuple[str, Optional[str], Optional[str]], Any]
-    ) -> Dict[Tuple[str, Optional[str], Optional[str]], Any]:
+    def sample_value(self, slot: TagSlot) -> Any:
         """
-        Sample values for each Faker method in the pattern map.
+        Sample a value for a Faker tag slot.
 
         Args:
-            pattern_map (Dict[Tuple[str, Optional[str], Optional[str]], Any]): Mapping of Faker tags to their methods.
+            slot (TagSlot): The tag slot to sample.
 
         Returns:
-            Dict[Tuple[str, Optional[str], Optional[str]], Any]: Mapping of Faker tags to their sampled values.
+            Any: The sampled value, or an error string for unknown tags and invalid arguments.
         """
-        value_map: Dict[Tuple[str, Optional[str], Optional[str]], Any] = {}
-        for tag, index, args in pattern_map.keys():
-            if tag in self.tag_map:
-                if args:
-                    try:
-                        arg_list = self.parse_args(args)
-                        value_map[(tag, index, args)] = self.tag_map[tag](*arg_list)
-                    except Exception as e:  # pylint: disable=broad-except
-                        value_map[(tag, index, args)] = (
-                            f"<Error: Invalid arguments for {tag}>: {e}"
-                        )
-                else:
-                    value_map[(tag, index, args)] = self.tag_map[tag]()
-            else:
-                value_map[(tag, index, args)] = f"<Unknown tag: {tag}>"
-        return value_map
+        if slot.tag not in self.tag_map:
+            return f"<Unknown tag: {slot.tag}>"
+
+        if not slot.has_args:
+            return self.tag_map[slot.tag]()
+
+        try:
+            if slot.args_error is not None:
+                raise slot.args_error
+            return self.tag_map[slot.tag](*(slot.args or ()))
+        except Exception as e:  # pylint: disable=broad-except
+            return f"<Error: Invalid arguments for {slot.tag}>: {e}"
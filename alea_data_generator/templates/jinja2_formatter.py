@@ -1,17 +1,21 @@
 """Jinja2TemplateFormatter class for ALEA data generation."""
 
 # Standard library imports
-from typing import Any, Dict, Optional
-
-from faker import Faker
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 # Third-party imports
 from jinja2 import BaseLoader, Environment, TemplateNotFound
 
-from alea_data_generator.samplers.faker_sampler import FAKER_TAG_MAP
+from alea_data_generator.samplers.faker_sampler import (
+    get_faker_instance,
+    get_shared_faker_tag_map,
+)
 
 # Local imports
-from alea_data_generator.templates.template_formatter import TemplateFormatter
+from alea_data_generator.templates.template_formatter import (
+    DEFAULT_FORMAT_CHUNK_SIZE,
+    TemplateFormatter,
+)
 
 
 class Jinja2TemplateFormatter(TemplateFormatter):
@@ -32,12 +36,10 @@ class Jinja2TemplateFormatter(TemplateFormatter):
             custom_filters (Optional[Dict[str, Any]]): Custom filters to add to the Jinja2 environment.
         """
         super().__init__()
-        self.faker = Faker(locale)
-        if seed is not None:
-            Faker.seed(seed)
+        self.faker = get_faker_instance(locale, seed)
 
         self.env = Environment(loader=BaseLoader())
-        self.env.globals.update(FAKER_TAG_MAP)
+        self.env.globals.update(get_shared_faker_tag_map())
         self.env.globals["faker"] = self.faker
 
         if custom_filters:
@@ -61,6 +63,48 @@ class Jinja2TemplateFormatter(TemplateFormatter):
         except Exception as e:  # pylint: disable=broad-except
             return f"<Error: {str(e)}>"
 
+    def iter_format_many(
+        self,
+        template: str,
+        n: int,
+        chunk_size: int = DEFAULT_FORMAT_CHUNK_SIZE,
+        annotations: bool = False,
+    ) -> Iterator[List[Union[str, Dict[str, Any]]]]:
+        """
+        Format a Jinja2 template n times, compiling it once, and yield the documents in chunks.
+
+        Args:
+            template (str): The template string containing Jinja2 syntax and Faker methods.
+            n (int): The number of documents to format.
+            chunk_size (int): The maximum number of documents per chunk.
+            annotations (bool): Whether to yield annotations, which uses the tag syntax of TemplateFormatter.
+
+        Yields:
+            List[Union[str, Dict[str, Any]]]: Chunks of formatted documents, in order.
+        """
+        if annotations:
+            yield from super().iter_format_many(template, n, chunk_size, annotations)
+            return
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        try:
+            jinja_template = self.env.from_string(template)
+        except Exception as e:  # pylint: disable=broad-except
+            for chunk_start in range(0, n, chunk_size):
+                yield [f"<Error: {str(e)}>"] * min(chunk_size, n - chunk_start)
+            return
+
+        for chunk_start in range(0, n, chunk_size):
+            chunk: List[Union[str, Dict[str, Any]]] = []
+            for _ in range(min(chunk_size, n - chunk_start)):
+                try:
+                    chunk.append(jinja_template.render())
+                except Exception as e:  # pylint: disable=broad-except
+                    chunk.append(f"<Error: {str(e)}>")
+            yield chunk
+
     def add_custom_filter(self, name: str, filter_func: Any) -> None:
         """
         Add a custom filter to the Jinja2 environment.
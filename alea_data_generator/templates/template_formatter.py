@@ -3,13 +3,36 @@
 # Standard library imports
 import ast
 import re
+import threading
 import tokenize
+from collections import OrderedDict
 from io import StringIO
-from typing import Any, Callable, Dict, Optional, Pattern, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
 
 # Third-party imports
 
 # Local imports
+from alea_data_generator.templates.compiled_template import (
+    CompiledTemplate,
+    TagKey,
+    TagSlot,
+)
+
+# default number of compiled templates kept per formatter
+DEFAULT_TEMPLATE_CACHE_SIZE = 1024
+
+# default number of documents rendered per chunk by iter_format_many
+DEFAULT_FORMAT_CHUNK_SIZE = 10_000
 
 
 class TemplateFormatter:
@@ -21,6 +44,7 @@ class TemplateFormatter:
             r"<\|(?P<tag>\w+)(?::(?P<index>[0-9]+|[a-z]))?(?P<args>\(.*?\))?\|>"
         ),
         tag_map: Optional[Dict[str, Callable]] = None,
+        template_cache_size: int = DEFAULT_TEMPLATE_CACHE_SIZE,
     ):
         """
         Initialize the TemplateFormatter.
@@ -28,9 +52,13 @@ class TemplateFormatter:
         Args:
             pattern_mapper (Pattern[str]): Compiled regex pattern for matching tags.
             tag_map (Optional[Dict[str, Callable]]): Custom tag map to extend or override default tags.
+            template_cache_size (int): Maximum number of compiled templates to keep; 0 disables caching.
         """
         self.pattern = pattern_mapper
         self.tag_map = tag_map or {}
+        self.template_cache_size = template_cache_size
+        self.template_cache: OrderedDict[str, CompiledTemplate] = OrderedDict()
+        self.template_cache_lock = threading.Lock()
 
     def build_pattern_map(
         self, template: str
@@ -75,6 +103,139 @@ class TemplateFormatter:
                     args.append(ast.literal_eval(token.string))
         return args
 
+    def compile_slot(self, key: TagKey) -> TagSlot:
+        """
+        Compile a tag into a slot, parsing its arguments once.
+
+        Args:
+            key (TagKey): The tag name, index, and raw argument string.
+
+        Returns:
+            TagSlot: The slot with its parsed arguments, or the error raised while parsing them.
+        """
+        args = key[2]
+        if args is None:
+            return TagSlot(key)
+        if not isinstance(args, str):
+            raise ValueError(f"Invalid args type for tag: {key[0]}")
+
+        try:
+            return TagSlot(key, tuple(self.parse_args(args)))
+        except Exception as e:  # pylint: disable=broad-except
+            return TagSlot(key, args_error=e)
+
+    def compile(self, template: str) -> CompiledTemplate:
+        """
+        Compile a template into literal segments and tag slots, using the LRU cache of compiled templates.
+
+        The cache is only read and updated under a lock, so formatters can be shared between threads;
+        templates are compiled outside the lock.
+
+        Args:
+            template (str): The template string containing tags.
+
+        Returns:
+            CompiledTemplate: The compiled template.
+        """
+        with self.template_cache_lock:
+            compiled = self.template_cache.get(template)
+            if compiled is not None:
+                self.template_cache.move_to_end(template)
+                return compiled
+
+        literals: List[str] = []
+        occurrences: List[int] = []
+        slot_indices: Dict[TagKey, int] = {}
+        position = 0
+        for match in self.pattern.finditer(template):
+            key = (match.group("tag"), match.group("index"), match.group("args"))
+            if key not in slot_indices:
+                slot_indices[key] = len(slot_indices)
+            literals.append(template[position : match.start()])
+            occurrences.append(slot_indices[key])
+            position = match.end()
+        literals.append(template[position:])
+
+        compiled = CompiledTemplate(
+            template,
+            tuple(literals),
+            tuple(occurrences),
+            tuple(self.compile_slot(key) for key in slot_indices),
+        )
+        if self.template_cache_size > 0:
+            with self.template_cache_lock:
+                self.template_cache[template] = compiled
+                if len(self.template_cache) > self.template_cache_size:
+                    self.template_cache.popitem(last=False)
+        return compiled
+
+    def sample_value(self, slot: TagSlot) -> Any:
+        """
+        Sample a value for a tag slot.
+
+        Tag methods are looked up in the tag map on every call, so changes to the tag map apply to
+        templates that were already compiled.
+
+        Args:
+            slot (TagSlot): The tag slot to sample.
+
+        Returns:
+            Any: The sampled value.
+        """
+        if slot.tag not in self.tag_map:
+            raise ValueError(f"Unknown tag: {slot.tag}")
+
+        if not slot.has_args:
+            return self.tag_map[slot.tag]()
+
+        try:
+            if slot.args_error is not None:
+                raise slot.args_error
+            return self.tag_map[slot.tag](*(slot.args or ()))
+        except Exception:  # pylint: disable=broad-except
+            return f"<Error: Invalid arguments for {slot.tag}>"
+
+    def sample_slot_values(self, compiled: CompiledTemplate) -> List[str]:
+        """
+        Sample a string value for each slot of a compiled template, in order of first occurrence.
+
+        Args:
+            compiled (CompiledTemplate): The compiled template.
+
+        Returns:
+            List[str]: The sampled values as strings, in slot order.
+        """
+        return [str(self.sample_value(slot)) for slot in compiled.slots]
+
+    def sample_column(self, slot: TagSlot, n: int) -> List[str]:
+        """
+        Sample n string values for a tag slot.
+
+        Tag methods with a sample_many(n, *args) attribute, e.g., value pools, are sampled in one bulk
+        call; other methods, and bulk calls that fail, are sampled one value at a time with sample_value.
+
+        Args:
+            slot (TagSlot): The tag slot to sample.
+            n (int): The number of values to sample.
+
+        Returns:
+            List[str]: The sampled values as strings.
+        """
+        method = self.tag_map.get(slot.tag)
+        sample_many = getattr(method, "sample_many", None)
+        if sample_many is not None and slot.args_error is None:
+            # invalid arguments fall back to sampling one value at a time, which reports them per
+            # value; any other error is a bug in the tag method and propagates
+            try:
+                return [str(value) for value in sample_many(n, *(slot.args or ()))]
+            except (TypeError, ValueError):
+                pass
+
+        # bind zero-argument methods once; sample_value handles errors for the rest
+        if method is not None and not slot.has_args:
+            return [str(method()) for _ in range(n)]
+        return [str(self.sample_value(slot)) for _ in range(n)]
+
     def sample_values(
         self, pattern_map: Dict[Tuple[str, Optional[str], Optional[str]], Any]
     ) -> Dict[Tuple[str, Optional[str], Optional[str]], Any]:
@@ -87,24 +248,9 @@ class TemplateFormatter:
         Returns:
             Dict[Tuple[str, Optional[str], Optional[str]], Any]: Mapping of tags to their sampled values.
         """
-        value_map: dict[tuple[str, str | None, str | None], Any] = {}
-        for tag, index, args in pattern_map.keys():
-            if tag in self.tag_map:
-                if isinstance(args, str):
-                    try:
-                        arg_list = self.parse_args(args)
-                        value_map[(tag, index, args)] = self.tag_map[tag](*arg_list)  # type: ignore
-                    except Exception:  # pylint: disable=broad-except
-                        value_map[(tag, index, args)] = (
-                            f"<Error: Invalid arguments for {tag}>"
-                        )
-                elif args is None:
-                    value_map[(tag, index, args)] = self.tag_map[tag]()  # type: ignore
-                else:
-                    raise ValueError(f"Invalid args type for tag: {tag}")
-            else:
-                raise ValueError(f"Unknown tag: {tag}")
-        return value_map
+        return {
+            key: self.sample_value(self.compile_slot(key)) for key in pattern_map.keys()
+        }
 
     def apply_template_map(
         self,
@@ -139,9 +285,8 @@ class TemplateFormatter:
         Returns:
             str: The formatted template with tags replaced by their corresponding values.
         """
-        pattern_map = self.build_pattern_map(template)
-        value_map = self.sample_values(pattern_map)
-        return self.apply_template_map(template, value_map)
+        compiled = self.compile(template)
+        return compiled.render(self.sample_slot_values(compiled))
 
     def __call__(self, template: str) -> str:
         """
@@ -165,32 +310,83 @@ class TemplateFormatter:
         Returns:
             Dict[str, Any]: A dictionary containing the formatted text and span annotations.
         """
-        # set up the pattern map and sample values
-        pattern_map = self.build_pattern_map(template)
-        value_map = self.sample_values(pattern_map)
+        compiled = self.compile(template)
+        output_text, spans = compiled.render_with_spans(
+            self.sample_slot_values(compiled)
+        )
+        return {"text": output_text, "spans": spans}
 
-        output_text = template
-        spans = []
-        try:
-            while match := next(self.pattern.finditer(output_text)):
-                start_pos = match.start()
-                end_pos = match.end()
-                tag = match.group("tag")
-                index = match.group("index")
-                args = match.group("args")
-                value = value_map[(tag, index, args)]
-                output_text = (
-                    output_text[:start_pos] + str(value) + output_text[end_pos:]
-                )
-                spans.append(
-                    {
-                        "start": start_pos,
-                        "end": start_pos + len(str(value)),
-                        "tag": tag,
-                        "value": str(value),
-                    }
-                )
-        except StopIteration:
-            pass
+    def iter_format_many(
+        self,
+        template: str,
+        n: int,
+        chunk_size: int = DEFAULT_FORMAT_CHUNK_SIZE,
+        annotations: bool = False,
+    ) -> Iterator[List[Union[str, Dict[str, Any]]]]:
+        """
+        Format a template n times, yielding the documents in chunks.
 
-        return {"text": output_text, "spans": spans}
+        The template is compiled once, and the values for each chunk are sampled one tag at a time,
+        in column order, so each tag method is called in bulk where it supports it.  Each document
+        samples its own values, as with repeated calls to format.
+
+        Args:
+            template (str): The template string containing tags.
+            n (int): The number of documents to format.
+            chunk_size (int): The maximum number of documents per chunk.
+            annotations (bool): Whether to yield format_with_annotations dictionaries instead of strings.
+
+        Yields:
+            List[Union[str, Dict[str, Any]]]: Chunks of formatted documents, in order.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        compiled = self.compile(template)
+        for chunk_start in range(0, n, chunk_size):
+            size = min(chunk_size, n - chunk_start)
+            columns = [self.sample_column(slot, size) for slot in compiled.slots]
+            rows = zip(*columns) if columns else ((),) * size
+            if annotations:
+                yield [
+                    dict(zip(("text", "spans"), compiled.render_with_spans(row)))
+                    for row in rows
+                ]
+            else:
+                yield [compiled.render(row) for row in rows]
+
+    def format_many(self, template: str, n: int) -> List[str]:
+        """
+        Format a template n times.
+
+        Args:
+            template (str): The template string containing tags.
+            n (int): The number of documents to format.
+
+        Returns:
+            List[str]: The formatted documents.
+        """
+        return [
+            document
+            for chunk in self.iter_format_many(template, n, max(n, 1))
+            for document in chunk
+        ]  # type: ignore
+
+    def format_many_with_annotations(
+        self, template: str, n: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Format a template n times and return annotations for each document.
+
+        Args:
+            template (str): The template string containing tags.
+            n (int): The number of documents to format.
+
+        Returns:
+            List[Dict[str, Any]]: A dictionary with the formatted text and span annotations per document.
+        """
+        return [
+            document
+            for chunk in self.iter_format_many(template, n, max(n, 1), annotations=True)
+            for document in chunk
+        ]  # type: ignore
@@ -0,0 +1,57 @@
+"""
+Shared fixtures for the perturbation benchmarks, including a deterministic synthetic corpus.
+"""
+
+# imports
+from functools import lru_cache
+
+# packages
+import numpy
+import pytest
+
+# vocabulary with legal prose, numbers, punctuation, and a few non-ASCII characters
+VOCABULARY = (
+    "the of and to in a is that for on with as by this shall be or any such "
+    "Agreement Party Parties Section Article pursuant thereto hereunder notwithstanding "
+    "provided however Company Licensee Licensor obligations indemnify liability damages "
+    "termination confidential information written notice days date effective governing "
+    "law court jurisdiction 1 2 3.1 4(b) 10 2024 $1,000,000 (c) TM § café naïve"
+).split()
+
+SEPARATORS = (" ",) * 16 + (", ", ". ", "; ", "\n", "\n\n", "\t", "  ")
+
+CORPUS_SEED = 20240901
+
+
+@lru_cache(maxsize=None)
+def generate_corpus(size: int, seed: int = CORPUS_SEED) -> str:
+    """
+    Generate a deterministic synthetic corpus of exactly size characters.
+
+    Args:
+        size: Number of characters.
+        seed: Seed for the word and separator draws.
+
+    Returns:
+        Synthetic corpus.
+    """
+    rng = numpy.random.default_rng(seed)
+    # words and separators average more than 6 characters
+    num_words = size // 6 + 1
+    words = rng.integers(0, len(VOCABULARY), size=num_words).tolist()
+    separators = rng.integers(0, len(SEPARATORS), size=num_words).tolist()
+    text = "".join(
+        VOCABULARY[word] + SEPARATORS[separator]
+        for word, separator in zip(words, separators)
+    )
+    while len(text) < size:
+        text += text
+    return text[:size]
+
+
+@pytest.fixture
+def corpus_factory():
+    """
+    Get the synthetic corpus generator.
+    """
+    return generate_corpus
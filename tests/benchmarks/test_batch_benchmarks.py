@@ -0,0 +1,96 @@
+"""
+Benchmarks for execute_batch on many short records against a loop of execute calls.
+
+Records are short clauses, so per-call overhead dominates.  Batches are also checked against a replay
+of the per-position Bernoulli draws of the original per-record implementation, which is a lower bound
+on its cost.  Run them with the benchmark marker, e.g.:
+
+    pytest -m benchmark tests/benchmarks/test_batch_benchmarks.py --no-cov
+"""
+
+# imports
+import random
+import time
+from typing import Callable, List
+
+# packages
+import pytest
+
+# project
+from alea_data_generator.perturbations.errors.config import ErrorConfig, ErrorSampleType
+from alea_data_generator.perturbations.errors.methods.base import BaseErrorMethod
+from alea_data_generator.perturbations.errors.registry import ERROR_METHODS
+
+RECORDS = [f"Section {i}. The party shall pay." for i in range(10_000)]
+
+RATE = 0.01
+
+pytestmark = pytest.mark.benchmark
+
+
+def build_method(method_name: str) -> BaseErrorMethod:
+    """
+    Build an error method with an independent rate.
+    """
+    return ERROR_METHODS[method_name](
+        ErrorConfig(
+            error_sample_type=ErrorSampleType.INDEPENDENT_RATE, rate=RATE, seed=42
+        )
+    )
+
+
+def baseline_positions(records: List[str]) -> List[List[int]]:
+    """
+    Replay the original per-record position draws, one random.random call per character.
+    """
+    return [
+        [i for i in range(len(record)) if random.random() < RATE] for record in records
+    ]
+
+
+def measure(function: Callable[[], object], rounds: int = 3) -> float:
+    """
+    Measure the best wall time of a function over a few rounds, in seconds.
+    """
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+@pytest.mark.parametrize("mode", ["batch", "loop"])
+@pytest.mark.parametrize("method_name", sorted(ERROR_METHODS))
+def test_short_record_throughput(benchmark, method_name, mode):
+    method = build_method(method_name)
+    benchmark.group = f"{method_name}-short-records"
+    benchmark.extra_info["records"] = len(RECORDS)
+    if mode == "batch":
+        result = benchmark.pedantic(
+            method.execute_batch, args=(RECORDS,), rounds=5, iterations=1
+        )
+    else:
+        result = benchmark.pedantic(
+            lambda: [method.execute(record) for record in RECORDS],
+            rounds=5,
+            iterations=1,
+        )
+    assert len(result) == len(RECORDS)
+
+
+@pytest.mark.parametrize("method_name", sorted(ERROR_METHODS))
+def test_batch_beats_loop(method_name):
+    method = build_method(method_name)
+    batch_time = measure(lambda: method.execute_batch(RECORDS))
+    loop_time = measure(lambda: [method.execute(record) for record in RECORDS])
+    assert batch_time < loop_time
+
+
+@pytest.mark.parametrize(
+    "method_name", ["skip_character", "whitespace_copy", "keyboard_character"]
+)
+def test_batch_beats_baseline_positions(method_name):
+    method = build_method(method_name)
+    batch_time = measure(lambda: method.execute_batch(RECORDS))
+    assert batch_time < measure(lambda: baseline_positions(RECORDS))
@@ -0,0 +1,87 @@
+"""
+Throughput benchmarks for every error method across input sizes, rates, and sample types.
+
+The benchmarks are deselected by default; run them with the benchmark marker, e.g.:
+
+    pytest -m benchmark tests/benchmarks --no-cov -k "not 10MB"
+
+Baselines depend on the machine, so they are not committed; save one locally with:
+
+    pytest -m benchmark tests/benchmarks --no-cov \
+        --benchmark-storage=tests/benchmarks/baselines --benchmark-save=baseline
+
+and compare against it, failing on mean regressions over 25%, with:
+
+    pytest -m benchmark tests/benchmarks --no-cov \
+        --benchmark-storage=tests/benchmarks/baselines --benchmark-compare \
+        --benchmark-compare-fail=mean:25%
+"""
+
+# packages
+import pytest
+
+# project
+from alea_data_generator.perturbations.errors.config import (
+    ErrorConfig,
+    ErrorDistributionType,
+    ErrorSampleType,
+)
+from alea_data_generator.perturbations.errors.registry import ERROR_METHODS
+
+SIZES = {"100B": 100, "10KB": 10_000, "1MB": 1_000_000, "10MB": 10_000_000}
+
+RATES = (0.001, 0.05)
+
+pytestmark = pytest.mark.benchmark
+
+
+def build_config(sample_type: ErrorSampleType, rate: float, size: int) -> ErrorConfig:
+    """
+    Build an error configuration with about rate * size errors for any sample type.
+    """
+    if sample_type == ErrorSampleType.INDEPENDENT_RATE:
+        return ErrorConfig(error_sample_type=sample_type, rate=rate, seed=42)
+
+    if sample_type == ErrorSampleType.FIXED_COUNT:
+        return ErrorConfig(
+            error_sample_type=sample_type,
+            distribution_kwargs={"count": max(1, int(rate * size))},
+            seed=42,
+        )
+
+    return ErrorConfig(
+        error_sample_type=sample_type,
+        error_distribution_type=ErrorDistributionType.POISSON,
+        distribution_kwargs={"lam": max(1.0, rate * size)},
+        seed=42,
+    )
+
+
+def get_rounds(size: int) -> int:
+    """
+    Get the number of benchmark rounds for an input size.
+    """
+    if size <= 10_000:
+        return 50
+    if size <= 1_000_000:
+        return 5
+    return 2
+
+
+@pytest.mark.parametrize("sample_type", list(ErrorSampleType), ids=lambda t: t.value)
+@pytest.mark.parametrize("rate", RATES, ids=lambda rate: f"rate={rate}")
+@pytest.mark.parametrize("size_name", list(SIZES))
+@pytest.mark.parametrize("method_name", sorted(ERROR_METHODS))
+def test_error_method_throughput(
+    benchmark, corpus_factory, method_name, size_name, rate, sample_type
+):
+    size = SIZES[size_name]
+    corpus = corpus_factory(size)
+    method = ERROR_METHODS[method_name](build_config(sample_type, rate, size))
+
+    benchmark.group = f"{method_name}-{size_name}"
+    benchmark.extra_info["characters"] = size
+    result = benchmark.pedantic(
+        method.execute, args=(corpus,), rounds=get_rounds(size), iterations=1
+    )
+    assert isinstance(result, str)
@@ -0,0 +1,51 @@
+"""
+Import-time benchmarks that keep package imports under a fixed budget.
+
+Each round imports the module in a fresh interpreter with -X importtime and measures the module's
+cumulative import time, which excludes interpreter startup; run them with the benchmark marker, e.g.:
+
+    pytest -m benchmark tests/benchmarks/test_import_time.py --no-cov
+"""
+
+# imports
+import subprocess
+import sys
+
+# packages
+import pytest
+
+# cumulative import time budgets in seconds
+IMPORT_BUDGETS = {
+    "alea_data_generator": 0.05,
+    "alea_data_generator.templates": 0.15,
+}
+
+pytestmark = pytest.mark.benchmark
+
+
+def measure_import_time(module: str) -> float:
+    """
+    Measure the cumulative import time of a module in a fresh interpreter, in seconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1e6
+    raise AssertionError(f"No import time reported for {module}")
+
+
+@pytest.mark.parametrize("module", list(IMPORT_BUDGETS))
+def test_import_time(benchmark, module):
+    import_times = []
+    benchmark.pedantic(
+        lambda: import_times.append(measure_import_time(module)),
+        rounds=5,
+        iterations=1,
+    )
+    assert min(import_times) < IMPORT_BUDGETS[module]
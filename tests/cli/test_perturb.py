@@ -0,0 +1,187 @@
+import io
+import json
+
+import pytest
+
+from alea_data_generator.cli.perturb import (
+    TEXT_LINE_ESCAPES,
+    iter_input_lines,
+    load_method_specs,
+    main,
+    perturb_stream,
+)
+from alea_data_generator.perturbations.errors.corpus import CorpusPerturber
+from alea_data_generator.perturbations.errors.methods.skip_word import (
+    SkipWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.plan import compile_plan
+from alea_data_generator.perturbations.errors.registry import get_error_method_class
+
+CONFIG = {
+    "seed": 42,
+    "methods": [
+        {
+            "method": "keyboard_character",
+            "error_sample_type": "independent_rate",
+            "rate": 0.1,
+        },
+        {
+            "method": "skip_word",
+            "error_sample_type": "fixed_count",
+            "distribution_args": {"count": 1},
+        },
+    ],
+}
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(CONFIG), encoding="utf-8")
+    return path
+
+
+def test_registry():
+    assert get_error_method_class("skip_word") is SkipWordErrorMethod
+    with pytest.raises(ValueError):
+        get_error_method_class("missing")
+
+
+def test_load_method_specs(config_path):
+    specs, seed = load_method_specs(config_path)
+    assert seed == 42
+    assert [method_class for method_class, _ in specs][1] is SkipWordErrorMethod
+    assert specs[0][1].rate == 0.1
+
+
+def test_perturb_stream_jsonl(config_path):
+    specs, seed = load_method_specs(config_path)
+    lines = [
+        json.dumps({"id": i, "text": f"the quick brown fox {i} jumps"})
+        for i in range(20)
+    ]
+    lines.insert(5, "")
+    output = io.StringIO()
+    perturber = CorpusPerturber(specs, seed=seed, workers=1, shard_size=4)
+    num_records, num_characters = perturb_stream(
+        perturber, lines, output, input_format="jsonl"
+    )
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert num_records == 20
+    assert num_characters == sum(
+        len(f"the quick brown fox {i} jumps") for i in range(20)
+    )
+    assert [record["id"] for record in records] == list(range(20))
+    assert all(
+        record["text"] != f"the quick brown fox {i} jumps"
+        for i, record in enumerate(records)
+    )
+
+
+def test_main_text(config_path, tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("the quick brown fox\njumps over the lazy dog\n")
+    output_paths = [tmp_path / "output1.txt", tmp_path / "output2.txt"]
+    for output_path, workers in zip(output_paths, ("1", "2")):
+        main(
+            [
+                str(input_path),
+                "--config_path",
+                str(config_path),
+                "--output_path",
+                str(output_path),
+                "--workers",
+                workers,
+                "--shard_size",
+                "1",
+                "--quiet",
+            ]
+        )
+    output_lines = output_paths[0].read_text().splitlines()
+    assert len(output_lines) == 2
+    assert output_paths[1].read_text().splitlines() == output_lines
+
+
+def test_main_stats_path(config_path, tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("the quick brown fox\njumps over the lazy dog\n")
+    stats_path = tmp_path / "stats.json"
+    main(
+        [
+            str(input_path),
+            "--config_path",
+            str(config_path),
+            "--output_path",
+            str(tmp_path / "output.txt"),
+            "--stats_path",
+            str(stats_path),
+            "--quiet",
+        ]
+    )
+    stats = json.loads(stats_path.read_text())
+    assert stats["KeyboardCharacterErrorMethod"]["calls"] == 2
+    assert stats["SkipWordErrorMethod"]["positions"] == 2
+
+
+def test_perturb_stream_text_escapes_newlines():
+    specs = compile_plan(
+        {
+            "methods": [
+                {
+                    "method": "whitespace_newline",
+                    "error_sample_type": "independent_rate",
+                    "rate": 1.0,
+                }
+            ]
+        }
+    ).specs
+    lines = ["the quick brown fox", "jumps over the lazy dog"]
+    output = io.StringIO()
+    perturber = CorpusPerturber(specs, seed=1, workers=1, shard_size=1)
+    assert perturb_stream(perturber, lines, output)[0] == 2
+    output_lines = output.getvalue().split("\n")
+    assert output_lines[-1] == ""
+    assert len(output_lines) == 3
+    assert all("\\n" in line or "\\r" in line for line in output_lines[:2])
+
+
+def test_text_line_escapes_are_reversible():
+    for text in ("a\\nb", "a\nb", "a\\\nb", "c:\\r\r\n"):
+        escaped = text.translate(TEXT_LINE_ESCAPES)
+        assert "\n" not in escaped and "\r" not in escaped
+        assert escaped.encode("ascii").decode("unicode_escape") == text
+
+
+def test_iter_input_lines_splits_on_newline_only(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes(b"one\rtwo\r\nthree\n")
+    assert list(iter_input_lines([input_path], io.StringIO())) == [
+        "one\rtwo",
+        "three",
+    ]
+
+
+def test_main_jsonl_missing_field(config_path, tmp_path, capsys):
+    input_path = tmp_path / "input.jsonl"
+    input_path.write_text(
+        json.dumps({"text": "the quick brown fox"})
+        + "\n\n"
+        + json.dumps({"body": "jumps over the lazy dog"})
+        + "\n",
+        encoding="utf-8",
+    )
+    with pytest.raises(SystemExit) as excinfo:
+        main(
+            [
+                str(input_path),
+                "--config_path",
+                str(config_path),
+                "--output_path",
+                str(tmp_path / "output.jsonl"),
+                "--format",
+                "jsonl",
+                "--quiet",
+            ]
+        )
+    assert excinfo.value.code == 1
+    assert "line 3" in capsys.readouterr().err
@@ -0,0 +1,55 @@
+import numpy
+import pytest
+
+from alea_data_generator.data.constants.keyboard import (
+    KEY_ERROR_MAPPING,
+    KEY_ERROR_TABLE,
+)
+from alea_data_generator.data.constants.ocr import OCR_ERROR_MAPPING, OCR_ERROR_TABLE
+from alea_data_generator.data.constants.substitution_table import (
+    build_alias_table,
+    compile_substitution_table,
+)
+
+
+@pytest.mark.parametrize(
+    "mapping, table",
+    [(KEY_ERROR_MAPPING, KEY_ERROR_TABLE), (OCR_ERROR_MAPPING, OCR_ERROR_TABLE)],
+)
+def test_table_matches_mapping(mapping, table):
+    for key, candidates in mapping.items():
+        if len(key) == 1:
+            assert table.get_candidates(key) == candidates
+    assert table.get_candidates("li") == ()
+    assert table.get_candidates("\U0001f600") == ()
+    assert not table.offsets.flags.writeable
+
+
+def test_sample_uniform():
+    table = compile_substitution_table({"a": ["x", "y"], "c": ["z"]})
+    code_points = numpy.array([ord("a"), ord("b"), ord("c"), -1, 1000, ord("a")])
+    uniforms = numpy.array([0.1, 0.5, 0.9, 0.5, 0.5, 0.9])
+    has_candidates, substitutions = table.sample(code_points, uniforms)
+    assert has_candidates.tolist() == [True, False, True, False, False, True]
+    assert substitutions.tolist() == ["x", "z", "y"]
+
+
+def test_sample_weighted():
+    table = compile_substitution_table(
+        {"a": ["x", "y", "z"]}, weights={"a": [0.7, 0.2, 0.1]}
+    )
+    rng = numpy.random.default_rng(42)
+    size = 100_000
+    _, substitutions = table.sample(numpy.full(size, ord("a")), rng.random(size))
+    values, counts = numpy.unique(substitutions.astype(str), return_counts=True)
+    frequencies = dict(zip(values.tolist(), (counts / size).tolist()))
+    assert frequencies == pytest.approx({"x": 0.7, "y": 0.2, "z": 0.1}, abs=0.01)
+
+
+def test_build_alias_table():
+    probabilities, aliases = build_alias_table([1, 1, 2])
+    assert len(probabilities) == len(aliases) == 3
+    with pytest.raises(ValueError):
+        build_alias_table([])
+    with pytest.raises(ValueError):
+        compile_substitution_table({"a": ["x"]}, weights={"a": [1.0, 2.0]})
@@ -0,0 +1,115 @@
+import numpy
+import pytest
+
+from alea_data_generator.perturbations.errors import ErrorChain
+from alea_data_generator.perturbations.errors.alignment import (
+    OffsetAlignment,
+    remap_spans,
+)
+from alea_data_generator.perturbations.errors.config import ErrorConfig, ErrorSampleType
+from alea_data_generator.perturbations.errors.edits import Edit, apply_edits
+from alea_data_generator.perturbations.errors.methods.double_character import (
+    DoubleCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.hyphenate_word import (
+    HyphenateWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.skip_character import (
+    SkipCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.skip_word import (
+    SkipWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.whitespace_add import (
+    WhitespaceAddErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.whitespace_copy import (
+    WhitespaceCopyErrorMethod,
+)
+
+INPUT_STRING = "Alice met Bob in Paris."
+SPANS = [(0, 5), (10, 13), (17, 22)]
+
+
+@pytest.fixture
+def error_config():
+    return ErrorConfig(
+        error_sample_type=ErrorSampleType.INDEPENDENT_RATE, rate=0.2, seed=42
+    )
+
+
+def test_from_edits_maps_unchanged_spans():
+    # replace "met" with "visited", delete " in", insert "!" at the end
+    edits = [Edit(6, 3, "visited"), Edit(13, 3, ""), Edit(23, 0, "!")]
+    output_string = apply_edits(INPUT_STRING, edits)
+    assert output_string == "Alice visited Bob Paris.!"
+    spans = remap_spans(SPANS, OffsetAlignment.from_edits(edits, len(INPUT_STRING)))
+    assert [output_string[start:end] for start, end in spans] == [
+        "Alice",
+        "Bob",
+        "Paris",
+    ]
+
+
+def test_spans_grow_over_edits():
+    alignment = OffsetAlignment.from_edits([Edit(1, 1, "xyz"), Edit(3, 0, "+")], 5)
+    # starts inside a replacement move to its start, ends inside move to its end
+    assert remap_spans([(1, 2), (2, 3), (3, 5), (0, 0)], alignment) == [
+        (1, 4),
+        (4, 5),
+        (6, 8),
+        (0, 0),
+    ]
+    assert alignment.target_length == 8
+
+
+def test_identity():
+    alignment = OffsetAlignment.identity(10)
+    offsets = numpy.arange(11)
+    assert alignment.map_starts(offsets).tolist() == offsets.tolist()
+    assert alignment.map_ends(offsets).tolist() == offsets.tolist()
+    assert remap_spans([], alignment) == []
+
+
+@pytest.mark.parametrize(
+    "method_class",
+    [
+        DoubleCharacterErrorMethod,
+        SkipCharacterErrorMethod,
+        WhitespaceCopyErrorMethod,
+        SkipWordErrorMethod,
+    ],
+)
+def test_execute_with_alignment(error_config, method_class):
+    output_string, alignment = method_class(error_config).execute_with_alignment(
+        INPUT_STRING
+    )
+    assert output_string == method_class(error_config).execute(INPUT_STRING)
+    assert alignment.target_length == len(output_string)
+    for start, end in remap_spans(SPANS, alignment):
+        assert 0 <= start <= end <= len(output_string)
+
+
+def build_chain(config):
+    return ErrorChain(
+        [
+            WhitespaceAddErrorMethod(config),
+            DoubleCharacterErrorMethod(config),
+            SkipCharacterErrorMethod(config),
+            SkipWordErrorMethod(config),
+            HyphenateWordErrorMethod(config),
+        ]
+    )
+
+
+def test_chain_alignment(error_config):
+    input_string = "the quick brown fox jumps over the lazy dog " * 5
+    output_string, alignments = build_chain(error_config).execute_with_alignment(
+        input_string
+    )
+    assert output_string == build_chain(error_config).execute(input_string)
+    assert len(alignments) == 5
+    assert alignments[-1].target_length == len(output_string)
+    assert remap_spans([(0, len(input_string))], alignments) == [
+        (0, len(output_string))
+    ]
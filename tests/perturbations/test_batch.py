@@ -0,0 +1,104 @@
+import pytest
+
+from alea_data_generator.perturbations.errors.config import (
+    ErrorConfig,
+    ErrorDistributionType,
+    ErrorSampleType,
+)
+from alea_data_generator.perturbations.errors.methods.double_word import (
+    DoubleWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.hyphenate_word import (
+    HyphenateWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.keyboard_character import (
+    KeyboardCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.skip_character import (
+    SkipCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.whitespace_copy import (
+    WhitespaceCopyErrorMethod,
+)
+from alea_data_generator.perturbations.errors.registry import ERROR_METHODS
+
+BATCH = [
+    "This Agreement is made as of the date first written above.",
+    "",
+    "Section 2.1",
+    "the quick brown fox jumps over the lazy dog",
+    "x",
+] * 5
+
+CONFIGS = [
+    ErrorConfig(ErrorSampleType.INDEPENDENT_RATE, rate=0.05, seed=42),
+    ErrorConfig(ErrorSampleType.INDEPENDENT_RATE, rate=0.2, seed=1),
+    ErrorConfig(ErrorSampleType.INDEPENDENT_RATE, rate=0.5, seed=42),
+    ErrorConfig(ErrorSampleType.FIXED_COUNT, distribution_kwargs={"count": 2}, seed=42),
+    ErrorConfig(
+        ErrorSampleType.SAMPLED_COUNT,
+        ErrorDistributionType.POISSON,
+        distribution_kwargs={"lam": 2},
+        seed=42,
+    ),
+    ErrorConfig(
+        ErrorSampleType.SAMPLED_COUNT,
+        ErrorDistributionType.UNIFORM,
+        distribution_kwargs={"low": 0, "high": 4},
+        seed=42,
+    ),
+    ErrorConfig(
+        ErrorSampleType.SAMPLED_COUNT,
+        ErrorDistributionType.NORMAL,
+        distribution_kwargs={"loc": 2, "scale": 1},
+        seed=42,
+    ),
+]
+
+METHODS = [
+    SkipCharacterErrorMethod,
+    KeyboardCharacterErrorMethod,
+    WhitespaceCopyErrorMethod,
+    HyphenateWordErrorMethod,
+    DoubleWordErrorMethod,
+]
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+@pytest.mark.parametrize("method_class", METHODS)
+def test_execute_batch_matches_execute_loop(method_class, config):
+    loop_method = method_class(config)
+    expected = [loop_method.execute(s) for s in BATCH]
+    result = method_class(config).execute_batch(BATCH)
+    assert result == expected
+
+
+@pytest.mark.parametrize("rate", [0.05, 0.2, 0.5])
+@pytest.mark.parametrize("method_class", list(ERROR_METHODS.values()))
+def test_every_method_batch_matches_execute_loop(method_class, rate):
+    config = ErrorConfig(ErrorSampleType.INDEPENDENT_RATE, rate=rate, seed=1)
+    loop_method = method_class(config)
+    expected = [loop_method.execute(s) for s in BATCH]
+    result = method_class(config).execute_batch(BATCH)
+    assert result == expected
+    assert result != BATCH
+
+
+def test_execute_batch_rate_samples_each_input():
+    config = ErrorConfig(ErrorSampleType.INDEPENDENT_RATE, rate=0.1, seed=42)
+    batch = ["abcdefghij"] * 2000
+    result = SkipCharacterErrorMethod(config).execute_batch(batch)
+    assert all(len(output) <= 10 for output in result)
+    skipped = sum(10 - len(output) for output in result)
+    assert 1700 < skipped < 2300
+
+    words = DoubleWordErrorMethod(config).execute_batch(["a b c"] * 2000)
+    assert all(set(output.split()) == {"a", "b", "c"} for output in words)
+    assert "\n" not in "".join(words)
+
+
+def test_execute_batch_empty():
+    config = ErrorConfig(
+        ErrorSampleType.FIXED_COUNT, distribution_kwargs={"count": 2}, seed=42
+    )
+    assert SkipCharacterErrorMethod(config).execute_batch([]) == []
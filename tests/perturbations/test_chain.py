@@ -0,0 +1,101 @@
+import pytest
+
+from alea_data_generator.perturbations.errors import ErrorChain
+from alea_data_generator.perturbations.errors.config import ErrorConfig, ErrorSampleType
+from alea_data_generator.perturbations.errors.methods.double_character import (
+    DoubleCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.double_word import (
+    DoubleWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.keyboard_character import (
+    KeyboardCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.skip_character import (
+    SkipCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.whitespace_copy import (
+    WhitespaceCopyErrorMethod,
+)
+
+
+@pytest.fixture
+def error_config():
+    return ErrorConfig(
+        error_sample_type=ErrorSampleType.FIXED_COUNT,
+        distribution_kwargs={"count": 2},
+        seed=42,
+    )
+
+
+def build_chain(config):
+    return ErrorChain(
+        [
+            KeyboardCharacterErrorMethod(config),
+            WhitespaceCopyErrorMethod(config),
+            DoubleWordErrorMethod(config),
+            SkipCharacterErrorMethod(config),
+        ]
+    )
+
+
+def test_chain_single_method_matches_execute(error_config):
+    input_string = "the quick brown fox jumps over the lazy dog"
+    method = DoubleCharacterErrorMethod(error_config)
+    chain = ErrorChain([DoubleCharacterErrorMethod(error_config)])
+    assert chain.execute(input_string) == method.execute(input_string)
+
+
+def test_chain_matches_chained_execute(error_config):
+    input_string = "the quick brown fox jumps over the lazy dog"
+    expected = input_string
+    for method in build_chain(error_config).methods:
+        expected = method.execute(expected)
+    assert build_chain(error_config).execute(input_string) == expected
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        ErrorConfig(ErrorSampleType.INDEPENDENT_RATE, rate=0.2, seed=42),
+        ErrorConfig(
+            ErrorSampleType.FIXED_COUNT, distribution_kwargs={"count": 2}, seed=42
+        ),
+    ],
+)
+def test_chain_batch_matches_chained_execute_batch(config):
+    batch = ["the quick brown fox", "", "jumps over the lazy dog"] * 3
+    expected = batch
+    for method in build_chain(config).methods:
+        expected = method.execute_batch(expected)
+    assert build_chain(config).execute_batch(batch) == expected
+
+
+def test_chain_later_methods_see_earlier_edits(error_config):
+    # doubled characters are separate characters for the next method, so skipping two of them
+    # leaves the length of the input
+    chain = ErrorChain(
+        [
+            DoubleCharacterErrorMethod(error_config),
+            SkipCharacterErrorMethod(error_config),
+        ]
+    )
+    assert len(chain("abcdef")) == 6
+
+
+def test_chain_mixed_levels(error_config):
+    input_string = "the quick brown fox jumps over the lazy dog"
+    result = build_chain(error_config).execute(input_string)
+    assert result != input_string
+    assert len(result.split()) >= len(input_string.split())
+
+
+def test_chain_batch_matches_loop(error_config):
+    batch = ["the quick brown fox", "", "jumps over the lazy dog"] * 3
+    loop_chain = build_chain(error_config)
+    expected = [loop_chain.execute(s) for s in batch]
+    assert build_chain(error_config).execute_batch(batch) == expected
+
+
+def test_chain_empty():
+    assert ErrorChain([]).execute("hello world") == "hello world"
@@ -0,0 +1,64 @@
+import string
+
+import numpy
+import pytest
+
+from alea_data_generator.perturbations.errors.character_classes import (
+    CHARACTER_CLASSES,
+    CharacterClassIndex,
+    character_class_mask,
+)
+from alea_data_generator.perturbations.errors.config import ErrorConfig, ErrorSampleType
+from alea_data_generator.perturbations.errors.methods.hyphenate_word import (
+    HyphenateWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.whitespace_remove import (
+    WhitespaceRemoveErrorMethod,
+)
+
+SAMPLE_TEXT = "Hello,\tworld! 123 café  \U0001d400\U0001f600 (ok)\n"
+
+
+@pytest.mark.parametrize("character_class", sorted(CHARACTER_CLASSES))
+def test_mask_matches_predicate(character_class):
+    predicate = CHARACTER_CLASSES[character_class]
+    expected = [predicate(c) for c in SAMPLE_TEXT]
+    index = CharacterClassIndex(SAMPLE_TEXT)
+    assert index.mask(character_class).tolist() == expected
+    assert character_class_mask(SAMPLE_TEXT, character_class).tolist() == expected
+
+
+def test_mask_classes():
+    index = CharacterClassIndex("a1 .é")
+    assert index.mask("alpha").tolist() == [True, False, False, False, True]
+    assert index.mask("digit").tolist() == [False, True, False, False, False]
+    assert index.mask("whitespace").tolist() == [False, False, True, False, False]
+    assert index.mask("punctuation").tolist() == [False, False, False, True, False]
+    assert index.mask("printable").tolist() == [True, True, True, True, False]
+    assert len(index) == 5
+
+
+def test_mask_empty_and_unknown():
+    assert len(CharacterClassIndex("").mask("alpha")) == 0
+    with pytest.raises(ValueError):
+        CharacterClassIndex("abc").mask("vowel")
+
+
+def test_masks_cached_per_index():
+    index = CharacterClassIndex("".join(string.ascii_letters) * 3)
+    assert index.mask("alpha") is index.mask("alpha")
+    assert not index.mask("alpha").flags.writeable
+
+
+def test_filter_positions_use_class():
+    config = ErrorConfig(
+        error_sample_type=ErrorSampleType.INDEPENDENT_RATE, rate=1.0, seed=42
+    )
+    text = "a b\tc\nd"
+    assert numpy.flatnonzero(
+        WhitespaceRemoveErrorMethod(config).get_positions(len(text), text)
+    ).tolist() == [1, 3, 5]
+    text = "ab cde f"
+    assert numpy.flatnonzero(
+        HyphenateWordErrorMethod(config).get_positions(len(text), text)
+    ).tolist() == [4]
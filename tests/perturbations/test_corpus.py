@@ -0,0 +1,76 @@
+import pytest
+
+from alea_data_generator.perturbations.errors import CorpusPerturber
+from alea_data_generator.perturbations.errors.config import ErrorConfig, ErrorSampleType
+from alea_data_generator.perturbations.errors.corpus import get_shard_seed
+from alea_data_generator.perturbations.errors.methods.double_word import (
+    DoubleWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.keyboard_character import (
+    KeyboardCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.whitespace_remove import (
+    WhitespaceRemoveErrorMethod,
+)
+
+RECORDS = [
+    f"record {i}: the quick brown fox jumps over the lazy dog" for i in range(50)
+]
+
+
+@pytest.fixture
+def specs():
+    config = ErrorConfig(error_sample_type=ErrorSampleType.INDEPENDENT_RATE, rate=0.1)
+    return [
+        (KeyboardCharacterErrorMethod, config),
+        (WhitespaceRemoveErrorMethod, config),
+        (DoubleWordErrorMethod, config),
+    ]
+
+
+def test_shard_seeds_are_independent():
+    seeds = {
+        get_shard_seed(42, shard, method) for shard in range(10) for method in range(3)
+    }
+    assert len(seeds) == 30
+    assert get_shard_seed(42, 3, 1) == get_shard_seed(42, 3, 1)
+    assert max(seeds).bit_length() > 64
+
+
+def test_perturb_is_reproducible(specs):
+    first = list(
+        CorpusPerturber(specs, seed=42, workers=1, shard_size=8).perturb(RECORDS)
+    )
+    second = list(
+        CorpusPerturber(specs, seed=42, workers=1, shard_size=8).perturb(RECORDS)
+    )
+    other = list(
+        CorpusPerturber(specs, seed=7, workers=1, shard_size=8).perturb(RECORDS)
+    )
+    assert first == second
+    assert first != other
+    assert len(first) == len(RECORDS)
+    assert first != RECORDS
+
+
+def test_perturb_independent_of_workers(specs):
+    expected = list(
+        CorpusPerturber(specs, seed=42, workers=1, shard_size=8).perturb(RECORDS)
+    )
+    perturber = CorpusPerturber(specs, seed=42, workers=2, shard_size=8, max_pending=2)
+    assert list(perturber.perturb(RECORDS)) == expected
+
+
+def test_perturb_files(specs, tmp_path):
+    paths = [tmp_path / "a.txt", tmp_path / "b.txt"]
+    paths[0].write_text("\n".join(RECORDS[:20]) + "\n", encoding="utf-8")
+    paths[1].write_text("\n".join(RECORDS[20:]) + "\n", encoding="utf-8")
+    perturber = CorpusPerturber(specs, seed=42, workers=1, shard_size=8)
+    assert list(perturber.perturb_files(paths)) == list(
+        CorpusPerturber(specs, seed=42, workers=1, shard_size=8).perturb(RECORDS)
+    )
+
+
+def test_invalid_shard_size(specs):
+    with pytest.raises(ValueError):
+        CorpusPerturber(specs, shard_size=0)
@@ -0,0 +1,152 @@
+import pytest
+
+from alea_data_generator.perturbations.errors import ErrorChain
+from alea_data_generator.perturbations.errors.config import ErrorConfig, ErrorSampleType
+from alea_data_generator.perturbations.errors.document import (
+    iter_chunk_bounds,
+    perturb_chunk,
+    perturb_document,
+)
+from alea_data_generator.perturbations.errors.methods.hyphenate_word import (
+    HyphenateWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.keyboard_character import (
+    KeyboardCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.transpose_word import (
+    TransposeWordErrorMethod,
+)
+
+TEXT = "The café's quick brown fox jumps over the lazy dog; exam-\nple text.\n" * 200
+
+
+def build_chain(rate=0.05, seed=42):
+    config = ErrorConfig(
+        error_sample_type=ErrorSampleType.INDEPENDENT_RATE, rate=rate, seed=seed
+    )
+    return ErrorChain(
+        [
+            KeyboardCharacterErrorMethod(config),
+            HyphenateWordErrorMethod(config),
+            TransposeWordErrorMethod(config),
+        ]
+    )
+
+
+@pytest.fixture
+def input_path(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    return path
+
+
+def test_chunk_bounds_are_word_safe():
+    buffer = TEXT.encode("utf-8")
+    bounds = list(iter_chunk_bounds(buffer, 100))
+    assert bounds[0][0] == 0 and bounds[-1][1] == len(buffer)
+    assert all(
+        end == next_start for (_, end), (next_start, _) in zip(bounds, bounds[1:])
+    )
+    assert all(end - start <= 100 for start, end in bounds)
+    for _, end in bounds[:-1]:
+        assert buffer[end - 1 : end].isspace()
+        assert not buffer[end - 2 : end - 1].isspace()
+        assert buffer[end - 2 : end - 1] != b"-"
+
+
+def test_chunk_bounds_long_token():
+    buffer = ("é" * 100).encode("utf-8")
+    bounds = list(iter_chunk_bounds(buffer, 25))
+    assert all(end - start <= 25 for start, end in bounds)
+    assert "".join(buffer[start:end].decode("utf-8") for start, end in bounds) == (
+        "é" * 100
+    )
+    with pytest.raises(ValueError):
+        list(iter_chunk_bounds(buffer, 0))
+
+
+def test_perturb_document_is_deterministic(input_path, tmp_path):
+    outputs = []
+    for name in ("first.txt", "second.txt"):
+        output_path = tmp_path / name
+        bytes_read, bytes_written = perturb_document(
+            build_chain(), input_path, output_path, chunk_size=256
+        )
+        assert bytes_read == len(TEXT.encode("utf-8"))
+        assert bytes_written == output_path.stat().st_size
+        outputs.append(output_path.read_text(encoding="utf-8"))
+
+    assert outputs[0] == outputs[1]
+    assert outputs[0] != TEXT
+
+
+def test_perturb_document_single_chunk(input_path, tmp_path):
+    output_path = tmp_path / "output.txt"
+    perturb_document(build_chain(), input_path, output_path, chunk_size=1 << 20)
+    assert output_path.read_text(encoding="utf-8") == build_chain().execute(TEXT)
+
+
+def test_perturb_document_without_errors(input_path, tmp_path):
+    output_path = tmp_path / "output.txt"
+    perturb_document(build_chain(rate=0.0), input_path, output_path, chunk_size=64)
+    assert output_path.read_text(encoding="utf-8") == TEXT
+
+
+def test_perturb_empty_document(tmp_path):
+    input_path = tmp_path / "empty.txt"
+    input_path.write_bytes(b"")
+    output_path = tmp_path / "output.txt"
+    assert perturb_document(build_chain(), input_path, output_path) == (0, 0)
+    assert output_path.read_bytes() == b""
+
+
+def test_seed_chunk_is_random_access():
+    chunks = [
+        f"chunk {i}: the quick brown fox jumps over the lazy dog" for i in range(6)
+    ]
+    sequential_chain = build_chain(rate=0.2)
+    sequential = [
+        perturb_chunk(sequential_chain, chunk, 3, chunk_index)
+        for chunk_index, chunk in enumerate(chunks)
+    ]
+    for chunk_index in reversed(range(len(chunks))):
+        assert (
+            perturb_chunk(build_chain(rate=0.2), chunks[chunk_index], 3, chunk_index)
+            == sequential[chunk_index]
+        )
+    assert perturb_chunk(build_chain(rate=0.2), chunks[0], 4, 0) != sequential[0]
+
+
+def test_perturb_document_independent_of_workers(input_path, tmp_path):
+    outputs = []
+    for workers in (1, 2):
+        output_path = tmp_path / f"output{workers}.txt"
+        perturb_document(
+            build_chain(),
+            input_path,
+            output_path,
+            chunk_size=512,
+            document_id=7,
+            workers=workers,
+            max_pending=2,
+        )
+        outputs.append(output_path.read_bytes())
+    assert outputs[0] == outputs[1]
+    assert outputs[0] != TEXT.encode("utf-8")
+
+    with pytest.raises(ValueError):
+        perturb_document(build_chain(), input_path, tmp_path / "x.txt", workers=2)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_perturb_document_keeps_chain_streams(input_path, tmp_path, workers):
+    chain = build_chain()
+    perturb_document(
+        chain,
+        input_path,
+        tmp_path / "output.txt",
+        chunk_size=512,
+        document_id=7,
+        workers=workers,
+    )
+    assert chain.execute(TEXT) == build_chain().execute(TEXT)
@@ -0,0 +1,47 @@
+import pytest
+
+from alea_data_generator.perturbations.errors.config import ErrorConfig, ErrorSampleType
+from alea_data_generator.perturbations.errors.edits import Edit, apply_edits
+from alea_data_generator.perturbations.errors.methods.transpose_character import (
+    TransposeCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.whitespace_copy import (
+    WhitespaceCopyErrorMethod,
+)
+
+
+@pytest.fixture
+def error_config():
+    return ErrorConfig(
+        error_sample_type=ErrorSampleType.INDEPENDENT_RATE, rate=0.3, seed=42
+    )
+
+
+def test_apply_edits():
+    edits = [Edit(0, 0, ">"), Edit(1, 1, "B"), Edit(3, 2, ""), Edit(6, 0, "!")]
+    assert apply_edits("abcdef", edits) == ">aBcf!"
+    assert apply_edits("abcdef", []) == "abcdef"
+
+
+def test_apply_edits_rejects_overlap():
+    with pytest.raises(ValueError):
+        apply_edits("abcdef", [Edit(1, 2, "x"), Edit(2, 1, "y")])
+
+
+def test_execute_with_edits(error_config):
+    input_string = "the quick brown fox jumps over the lazy dog"
+    method = WhitespaceCopyErrorMethod(error_config)
+    output_string, edits = method.execute_with_edits(input_string)
+    assert output_string == WhitespaceCopyErrorMethod(error_config).execute(
+        input_string
+    )
+    assert apply_edits(input_string, edits) == output_string
+    assert [edit.offset for edit in edits] == sorted(edit.offset for edit in edits)
+    assert all(input_string[edit.offset].isspace() for edit in edits)
+
+
+def test_transpose_character_runs(error_config):
+    method = TransposeCharacterErrorMethod(error_config)
+    assert method.apply_error("abcdef", [0, 1, 2]) == "dabcef"
+    assert method.apply_error("abcdef", [0, 2, 3]) == "baecdf"
+    assert method.apply_error("abcdef", [4, 5]) == "abcdfe"
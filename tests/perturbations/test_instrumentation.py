@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from alea_data_generator.perturbations.errors import CorpusPerturber, ErrorChain
+from alea_data_generator.perturbations.errors.config import ErrorConfig, ErrorSampleType
+from alea_data_generator.perturbations.errors.instrumentation import (
+    INSTRUMENTATION,
+    InstrumentationRegistry,
+    MethodStats,
+)
+from alea_data_generator.perturbations.errors.methods.double_word import (
+    DoubleWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.keyboard_character import (
+    KeyboardCharacterErrorMethod,
+)
+
+TEXT = "the quick brown fox jumps over the lazy dog"
+
+
+@pytest.fixture
+def error_config():
+    return ErrorConfig(
+        error_sample_type=ErrorSampleType.INDEPENDENT_RATE, rate=0.2, seed=42
+    )
+
+
+@pytest.fixture
+def registry():
+    INSTRUMENTATION.reset()
+    INSTRUMENTATION.enable()
+    yield INSTRUMENTATION
+    INSTRUMENTATION.disable()
+    INSTRUMENTATION.reset()
+
+
+def test_disabled_records_nothing(error_config):
+    INSTRUMENTATION.reset()
+    KeyboardCharacterErrorMethod(error_config).execute_batch([TEXT] * 3)
+    assert INSTRUMENTATION.to_dict() == {}
+
+
+def test_method_counters(registry, error_config):
+    KeyboardCharacterErrorMethod(error_config).execute_batch([TEXT] * 3)
+    DoubleWordErrorMethod(error_config).execute(TEXT)
+
+    stats = registry.to_dict()
+    assert stats["KeyboardCharacterErrorMethod"]["calls"] == 3
+    assert stats["KeyboardCharacterErrorMethod"]["units"] == 3 * len(TEXT)
+    assert stats["KeyboardCharacterErrorMethod"]["positions"] > 0
+    assert stats["DoubleWordErrorMethod"]["units"] == len(TEXT.split())
+    assert all(
+        method_stats["get_positions_ns"] > 0 and method_stats["apply_error_ns"] > 0
+        for method_stats in stats.values()
+    )
+    assert json.loads(registry.to_json()) == stats
+
+
+def test_chain_counters(registry, error_config):
+    chain = ErrorChain(
+        [
+            KeyboardCharacterErrorMethod(error_config),
+            DoubleWordErrorMethod(error_config),
+        ]
+    )
+    chain.execute_batch([TEXT] * 4)
+    stats = registry.to_dict()
+    assert stats["KeyboardCharacterErrorMethod"]["calls"] == 4
+    assert stats["DoubleWordErrorMethod"]["calls"] == 4
+
+
+def test_merge():
+    first = InstrumentationRegistry()
+    second = InstrumentationRegistry()
+    first.merge({"A": MethodStats(calls=1, units=10, positions=2)})
+    second.merge({"A": {"calls": 2, "units": 5}, "B": {"calls": 1}})
+    first.merge(second.to_dict())
+    assert first.to_dict()["A"] == MethodStats(calls=3, units=15, positions=2).to_dict()
+    assert first.to_dict()["B"]["calls"] == 1
+
+
+def test_corpus_workers_merge_counters(registry, error_config):
+    specs = [(KeyboardCharacterErrorMethod, error_config)]
+    records = [TEXT] * 20
+
+    list(CorpusPerturber(specs, seed=1, workers=1, shard_size=4).perturb(records))
+    expected = registry.to_dict()
+    registry.reset()
+    list(CorpusPerturber(specs, seed=1, workers=2, shard_size=4).perturb(records))
+    stats = registry.to_dict()
+
+    assert stats["KeyboardCharacterErrorMethod"]["calls"] == 20
+    for key in ("calls", "units", "positions"):
+        assert (
+            stats["KeyboardCharacterErrorMethod"][key]
+            == expected["KeyboardCharacterErrorMethod"][key]
+        )
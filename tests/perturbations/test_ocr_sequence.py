@@ -0,0 +1,81 @@
+import numpy
+import pytest
+
+from alea_data_generator.data.constants.ocr import OCR_ERROR_MAPPING
+from alea_data_generator.perturbations.errors import ErrorChain
+from alea_data_generator.perturbations.errors.aho_corasick import AhoCorasickAutomaton
+from alea_data_generator.perturbations.errors.config import ErrorConfig, ErrorSampleType
+from alea_data_generator.perturbations.errors.edits import apply_edits
+from alea_data_generator.perturbations.errors.methods.ocr_sequence import (
+    OCRSequenceErrorMethod,
+)
+
+
+@pytest.fixture
+def error_config():
+    return ErrorConfig(
+        error_sample_type=ErrorSampleType.INDEPENDENT_RATE, rate=1.0, seed=42
+    )
+
+
+def naive_find_all(patterns, text):
+    return sorted(
+        (start, pattern_index)
+        for pattern_index, pattern in enumerate(patterns)
+        for start in range(len(text))
+        if text.startswith(pattern, start)
+    )
+
+
+def test_automaton_matches_naive_search():
+    patterns = ["he", "she", "his", "hers", "e", "rs"]
+    automaton = AhoCorasickAutomaton(patterns)
+    text = "ushers and his heroes"
+    assert sorted(automaton.find_all(text)) == naive_find_all(patterns, text)
+    assert automaton.find_starts("ushers").tolist() == [1, 2, 3, 4]
+    assert [patterns[i] for i in automaton.match_at("hers", 0)] == ["he", "hers"]
+    assert automaton.match_at("hers", 3) == []
+
+
+def test_automaton_over_ocr_keys():
+    patterns = tuple(OCR_ERROR_MAPPING)
+    automaton = AhoCorasickAutomaton(patterns)
+    text = "modern (c) 2024 ``quoted'' TM clip rn vv"
+    assert sorted(automaton.find_all(text)) == naive_find_all(patterns, text)
+    assert sorted(automaton.find_all(list(text))) == naive_find_all(patterns, text)
+
+
+def test_automaton_rejects_empty_pattern():
+    with pytest.raises(ValueError):
+        AhoCorasickAutomaton(["a", ""])
+
+
+def test_ocr_sequence_edits_are_confusions(error_config):
+    input_string = "The modern corn (c) clipper"
+    method = OCRSequenceErrorMethod(error_config)
+    output_string, edits = method.execute_with_edits(input_string)
+    assert output_string != input_string
+    assert apply_edits(input_string, edits) == output_string
+    for offset, delete_length, insert_text in edits:
+        key = input_string[offset : offset + delete_length]
+        assert insert_text in OCR_ERROR_MAPPING[key]
+    assert any(delete_length > 1 for _, delete_length, _ in edits)
+
+
+def test_ocr_sequence_merges(error_config):
+    method = OCRSequenceErrorMethod(error_config)
+    # both the single-character key and the merge start at position 0
+    outputs = {method.apply_error("rn", [0]) for _ in range(200)}
+    assert "m" in outputs
+    assert method.apply_error("#?#", [0, 1, 2]) == "#?#"
+
+
+def test_ocr_sequence_positions(error_config):
+    method = OCRSequenceErrorMethod(error_config)
+    positions = method.get_positions(6, "#(c)##", None)
+    assert numpy.flatnonzero(positions).tolist() == [1, 2, 3]
+
+
+def test_ocr_sequence_in_chain(error_config):
+    chain = ErrorChain([OCRSequenceErrorMethod(error_config)])
+    assert chain("modern") != "modern"
@@ -0,0 +1,94 @@
+import pickle
+
+import pytest
+
+from alea_data_generator.perturbations.errors import ErrorChain
+from alea_data_generator.perturbations.errors.config import ErrorConfig, ErrorSampleType
+from alea_data_generator.perturbations.errors.methods.keyboard_character import (
+    KeyboardCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.skip_word import (
+    SkipWordErrorMethod,
+)
+from alea_data_generator.perturbations.errors.plan import compile_plan
+from alea_data_generator.perturbations.errors.registry import ERROR_METHODS
+
+TEXT = "The quick brown fox, 42 times, jumps over the lazy dog.\n"
+
+SPEC = {
+    "seed": 7,
+    "methods": [
+        {
+            "method": "keyboard_character",
+            "error_sample_type": "independent_rate",
+            "rate": 0.1,
+            "seed": 1,
+        },
+        {
+            "method": "skip_word",
+            "error_sample_type": "sampled_count",
+            "error_distribution_type": "poisson",
+            "distribution_args": {"lam": 2},
+            "seed": 2,
+        },
+    ],
+}
+
+
+def test_compile_plan():
+    plan = compile_plan(SPEC)
+    assert plan.seed == 7
+    assert [method.name for method in plan.methods] == [
+        "keyboard_character",
+        "skip_word",
+    ]
+    assert plan.specs[1][0] is SkipWordErrorMethod
+    assert compile_plan(SPEC["methods"]).seed is None
+
+
+def test_plan_chain_matches_methods():
+    plan = compile_plan(SPEC)
+    expected = ErrorChain(
+        [
+            KeyboardCharacterErrorMethod(plan.methods[0].config),
+            SkipWordErrorMethod(plan.methods[1].config),
+        ]
+    ).execute_batch([TEXT] * 5)
+    assert plan.build_chain().execute_batch([TEXT] * 5) == expected
+
+
+def test_plan_is_picklable():
+    plan = compile_plan(SPEC)
+    restored = pickle.loads(pickle.dumps(plan))
+    assert restored == plan
+    assert restored.build_chain()(TEXT) == plan.build_chain()(TEXT)
+
+
+@pytest.mark.parametrize("method_class", list(ERROR_METHODS.values()))
+def test_methods_are_picklable(method_class):
+    config = ErrorConfig(
+        error_sample_type=ErrorSampleType.INDEPENDENT_RATE, rate=0.2, seed=42
+    )
+    method = method_class(config)
+    restored = pickle.loads(pickle.dumps(method))
+    assert restored.execute(TEXT) == method.execute(TEXT)
+
+
+@pytest.mark.parametrize(
+    "method_spec",
+    [
+        {"error_sample_type": "independent_rate", "rate": 0.1},
+        {"method": "missing", "error_sample_type": "independent_rate", "rate": 0.1},
+        {"method": "skip_word", "error_sample_type": "independent_rate", "rate": 2},
+        {"method": "skip_word", "error_sample_type": "fixed_count"},
+        {
+            "method": "skip_word",
+            "error_sample_type": "sampled_count",
+            "error_distribution_type": "normal",
+            "distribution_args": {"lam": 1},
+        },
+    ],
+)
+def test_compile_plan_invalid(method_spec):
+    with pytest.raises(ValueError):
+        compile_plan([method_spec])
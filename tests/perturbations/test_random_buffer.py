@@ -0,0 +1,47 @@
+import numpy
+import pytest
+
+from alea_data_generator.perturbations.errors.config import ErrorConfig, ErrorSampleType
+from alea_data_generator.perturbations.errors.methods.whitespace_add import (
+    WhitespaceAddErrorMethod,
+)
+from alea_data_generator.perturbations.errors.methods.whitespace_newline import (
+    WhitespaceNewlineErrorMethod,
+)
+from alea_data_generator.perturbations.errors.random_buffer import RandomBuffer
+
+
+def test_draws_independent_of_block_size():
+    small = RandomBuffer(numpy.random.default_rng(42), block_size=3)
+    large = RandomBuffer(numpy.random.default_rng(42))
+    for buffer in (small, large):
+        buffer.uniform()
+    assert small.uniforms(10) == large.uniforms(10)
+    assert small.uniform() == large.uniform()
+    assert small.integers(0, 100, 7) == large.integers(0, 100, 7)
+
+
+def test_draw_ranges():
+    buffer = RandomBuffer(numpy.random.default_rng(42), block_size=16)
+    assert all(0.0 <= u < 1.0 for u in buffer.uniforms(1000))
+    assert set(buffer.integers(2, 5, 1000)) == {2, 3, 4}
+    assert set(buffer.choices("abc", 1000)) == {"a", "b", "c"}
+    assert buffer.uniforms(0) == []
+
+
+def test_invalid_block_size():
+    with pytest.raises(ValueError):
+        RandomBuffer(numpy.random.default_rng(42), block_size=0)
+
+
+@pytest.mark.parametrize(
+    "method_class", [WhitespaceAddErrorMethod, WhitespaceNewlineErrorMethod]
+)
+def test_seeded_whitespace_methods_are_reproducible(method_class):
+    config = ErrorConfig(
+        error_sample_type=ErrorSampleType.INDEPENDENT_RATE, rate=0.5, seed=42
+    )
+    input_string = "the quick brown fox jumps over the lazy dog " * 10
+    assert method_class(config).execute(input_string) == method_class(config).execute(
+        input_string
+    )
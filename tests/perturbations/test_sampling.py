@@ -0,0 +1,94 @@
+import numpy
+import pytest
+
+from alea_data_generator.perturbations.errors.config import ErrorConfig, ErrorSampleType
+from alea_data_generator.perturbations.errors.methods.skip_character import (
+    SkipCharacterErrorMethod,
+)
+from alea_data_generator.perturbations.errors import sampling
+from alea_data_generator.perturbations.errors.sampling import (
+    positions_to_mask,
+    sample_batch_rate_positions,
+    sample_count_positions,
+    sample_rate_positions,
+)
+
+
+def test_sample_rate_positions_edge_cases():
+    rng = numpy.random.default_rng(42)
+    assert sample_rate_positions(rng, 0, 0.5).tolist() == []
+    assert sample_rate_positions(rng, 10, 0.0).tolist() == []
+    assert sample_rate_positions(rng, 5, 1.0).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_sample_rate_positions_sparse_and_dense():
+    for rate in (0.01, 0.5):
+        positions = sample_rate_positions(numpy.random.default_rng(42), 100_000, rate)
+        assert numpy.all(numpy.diff(positions) > 0)
+        assert positions.min() >= 0 and positions.max() < 100_000
+        # within a generous tolerance of the expected count
+        assert abs(len(positions) - 100_000 * rate) < 10 * (100_000 * rate) ** 0.5
+
+
+@pytest.mark.parametrize("rate", [0.0, 0.001, 0.05, 0.2, 0.5, 1.0])
+@pytest.mark.parametrize("short_blocks", [False, True])
+def test_sample_batch_rate_positions_matches_loop(monkeypatch, rate, short_blocks):
+    if short_blocks:
+        # blocks of about the expected number of hits often fall short and must be extended
+        monkeypatch.setattr(sampling, "RATE_BLOCK_SIGMAS", 0)
+        monkeypatch.setattr(sampling, "RATE_BLOCK_PADDING", 1)
+    lengths = numpy.random.default_rng(0).integers(0, 500, size=200)
+    lengths[::7] = 0
+
+    batch_rng = numpy.random.default_rng(42)
+    positions, ranges = sample_batch_rate_positions(batch_rng, lengths, rate)
+    loop_rng = numpy.random.default_rng(42)
+    for index, length in enumerate(lengths.tolist()):
+        expected = sample_rate_positions(loop_rng, length, rate)
+        assert positions[ranges == index].tolist() == expected.tolist()
+    assert batch_rng.random() == loop_rng.random()
+
+
+def test_sample_count_positions_sparse_and_dense():
+    rng = numpy.random.default_rng(42)
+    assert sample_count_positions(rng, 10, 0).tolist() == []
+    assert sample_count_positions(rng, 3, 5).tolist() == [0, 1, 2]
+    for length, count in ((10_000_000, 3), (100, 50)):
+        positions = sample_count_positions(rng, length, count)
+        assert len(positions) == count
+        assert len(set(positions.tolist())) == count
+        assert numpy.all(numpy.diff(positions) > 0)
+        assert positions.min() >= 0 and positions.max() < length
+
+
+def test_independent_rate_is_reproducible():
+    config = ErrorConfig(
+        error_sample_type=ErrorSampleType.INDEPENDENT_RATE, rate=0.05, seed=42
+    )
+    input_string = "the quick brown fox jumps over the lazy dog " * 100
+    result1 = SkipCharacterErrorMethod(config).execute(input_string)
+    result2 = SkipCharacterErrorMethod(config).execute(input_string)
+    assert result1 == result2
+    assert result1 != input_string
+
+
+def test_positions_to_mask():
+    mask = positions_to_mask([1, 3], 5)
+    assert mask.dtype == numpy.bool_
+    assert mask.tolist() == [False, True, False, True, False]
+    assert positions_to_mask(mask, 5) is mask
+    with pytest.raises(ValueError):
+        positions_to_mask(mask, 4)
+
+
+def test_get_positions_returns_mask():
+    config = ErrorConfig(
+        error_sample_type=ErrorSampleType.FIXED_COUNT,
+        distribution_kwargs={"count": 2},
+        seed=42,
+    )
+    method = SkipCharacterErrorMethod(config)
+    mask = method.get_positions(11, "hello world")
+    assert mask.dtype == numpy.bool_
+    assert mask.sum() == 2
+    assert len(method.apply_error("hello world", mask)) == 9
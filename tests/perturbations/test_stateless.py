@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+import pytest
+
+from alea_data_generator.perturbations.errors import ErrorChain
+from alea_data_generator.perturbations.errors.config import ErrorConfig, ErrorSampleType
+from alea_data_generator.perturbations.errors.registry import ERROR_METHODS
+
+TEXT = "The quick brown fox, 42 times, jumps over the lazy dog.\n" * 20
+
+
+@pytest.fixture
+def error_config():
+    return ErrorConfig(
+        error_sample_type=ErrorSampleType.INDEPENDENT_RATE, rate=0.1, seed=42
+    )
+
+
+@pytest.mark.parametrize("method_class", list(ERROR_METHODS.values()))
+def test_stateless_does_not_touch_method_state(method_class, error_config):
+    method = method_class(error_config)
+    expected = method_class(error_config).execute_batch([TEXT, TEXT])
+
+    first = method.execute_stateless(TEXT, numpy.random.default_rng(1))
+    second = method.execute_stateless(TEXT, numpy.random.default_rng(1))
+    assert first == second
+    assert method.execute_batch([TEXT, TEXT]) == expected
+
+
+def test_stateless_threads_share_one_method(error_config):
+    method = ERROR_METHODS["keyboard_character"](error_config)
+    expected = [
+        method.execute_stateless(TEXT, numpy.random.default_rng(seed))
+        for seed in range(32)
+    ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda seed: method.execute_stateless(
+                    TEXT, numpy.random.default_rng(seed)
+                ),
+                range(32),
+            )
+        )
+    assert results == expected
+    assert len(set(results)) > 1
+
+
+def test_stateless_chain_threads(error_config):
+    chain = ErrorChain(
+        [
+            ERROR_METHODS["ocr_character"](error_config),
+            ERROR_METHODS["whitespace_add"](error_config),
+            ERROR_METHODS["transpose_word"](error_config),
+        ]
+    )
+    expected = [
+        chain.execute_batch_stateless([TEXT] * 2, numpy.random.default_rng(seed))
+        for seed in range(16)
+    ]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda seed: chain.execute_batch_stateless(
+                    [TEXT] * 2, numpy.random.default_rng(seed)
+                ),
+                range(16),
+            )
+        )
+    assert results == expected
+    assert chain.execute_stateless(TEXT) != TEXT
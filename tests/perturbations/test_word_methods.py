@@ -1,6 +1,8 @@
+import numpy
 import pytest
 
 from alea_data_generator.perturbations.errors.config import ErrorConfig, ErrorSampleType
+from alea_data_generator.perturbations.errors.edits import apply_edits
 from alea_data_generator.perturbations.errors.methods.double_word import (
     DoubleWordErrorMethod,
 )
@@ -10,6 +12,8 @@ from alea_data_generator.perturbations.errors.methods.skip_word import (
 from alea_data_generator.perturbations.errors.methods.transpose_word import (
     TransposeWordErrorMethod,
 )
+from alea_data_generator.perturbations.errors.sampling import positions_to_mask
+from alea_data_generator.perturbations.errors.tokenizer import tokenize_spans
 
 
 @pytest.fixture
@@ -101,3 +105,48 @@ def test_error_methods_with_single_word(error_config: ErrorConfig) -> None:
     for method in methods:
         result = method.execute("word")
         assert len(result.split()) in [0, 1, 2]  # Depending on the method
+
+
+def test_word_methods_accept_masks(error_config: ErrorConfig) -> None:
+    words = ["the", "quick", "brown", "fox"]
+    mask = numpy.array([False, True, False, True])
+    assert DoubleWordErrorMethod(error_config).apply_error(words, mask) == (
+        "the quick quick brown fox fox"
+    )
+    assert SkipWordErrorMethod(error_config).apply_error(words, mask) == "the brown"
+
+
+def test_tokenize_spans() -> None:
+    starts, ends = tokenize_spans("  the\tquick\n\nfox ")
+    assert starts.tolist() == [2, 6, 13]
+    assert ends.tolist() == [5, 11, 16]
+    starts, ends = tokenize_spans(" \n ")
+    assert starts.tolist() == [] and ends.tolist() == []
+
+
+@pytest.mark.parametrize(
+    "method_class, positions, expected",
+    [
+        (DoubleWordErrorMethod, [1, 3], " the\tquick quick\n\nbrown  fox fox\n"),
+        (SkipWordErrorMethod, [1, 3], " the\tbrown\n"),
+        (SkipWordErrorMethod, [0, 1], " brown  fox\n"),
+        (SkipWordErrorMethod, [0, 1, 2, 3], " \n"),
+        (TransposeWordErrorMethod, [0], " quick\tthe\n\nbrown  fox\n"),
+    ],
+)
+def test_word_edits_preserve_whitespace(
+    error_config: ErrorConfig, method_class, positions, expected
+) -> None:
+    input_string = " the\tquick\n\nbrown  fox\n"
+    method = method_class(error_config)
+    starts, ends = tokenize_spans(input_string)
+    mask = positions_to_mask(positions, len(starts))
+    edits = method.get_word_edits(input_string, starts, ends, mask)
+    assert apply_edits(input_string, edits) == expected
+
+
+def test_execute_preserves_whitespace(error_config: ErrorConfig) -> None:
+    input_string = "the quick\n\tbrown fox"
+    result = TransposeWordErrorMethod(error_config).execute(input_string)
+    assert "\n\t" in result
+    assert sorted(result.split()) == sorted(input_string.split())
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+import pytest
+
+from alea_data_generator.samplers import faker_sampler
+
+
+def test_import_does_not_load_faker():
+    code = (
+        "import sys, alea_data_generator.templates; "
+        "print('faker' in sys.modules, 'jinja2' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_shared_instance_is_created_once():
+    instance = faker_sampler.FAKER_INSTANCE
+    tag_map = faker_sampler.FAKER_TAG_MAP
+    assert faker_sampler.FAKER_INSTANCE is instance
+    assert faker_sampler.FAKER_TAG_MAP is tag_map
+    assert set(faker_sampler.ZERO_ARG_METHODS) == set(tag_map)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        faker_sampler.MISSING  # pylint: disable=pointless-statement
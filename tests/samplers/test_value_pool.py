@@ -0,0 +1,100 @@
+import itertools
+import threading
+import time
+
+import pytest
+
+from alea_data_generator.samplers.value_pool import (
+    ValuePool,
+    ValuePoolTagMap,
+    get_faker_value_pools,
+)
+from alea_data_generator.templates.faker_formatter import FakerTemplateFormatter
+
+
+def counting_method():
+    counter = itertools.count()
+    return lambda *args: f"{'-'.join(map(str, args))}{next(counter)}"
+
+
+def test_value_pool_fills_lazily():
+    pool = ValuePool(counting_method(), size=10)
+    assert not pool.is_filled
+    values = pool.sample_many(100)
+    assert pool.is_filled
+    assert set(values) <= {str(i) for i in range(10)}
+    assert pool() in {str(i) for i in range(10)}
+    with pytest.raises(ValueError):
+        ValuePool(counting_method(), size=0)
+
+
+def test_value_pool_refresh_evicts_oldest():
+    pool = ValuePool(counting_method(), size=4)
+    pool.fill()
+    pool.refresh(3)
+    assert pool.values.tolist() == ["4", "5", "6", "3"]
+    pool.refresh(2)
+    assert pool.values.tolist() == ["8", "5", "6", "7"]
+
+
+def test_value_pool_fills_once_across_threads():
+    calls = []
+
+    def slow_method():
+        calls.append(None)
+        time.sleep(0.001)
+        return "x"
+
+    pool = ValuePool(slow_method, size=5)
+    threads = [threading.Thread(target=pool.fill) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 5
+    assert pool.values.tolist() == ["x"] * 5
+
+
+def test_value_pool_arguments_bypass_pool():
+    pool = ValuePool(counting_method(), size=4)
+    assert pool("a") == "a0"
+    assert pool.sample_many(2, "b") == ["b1", "b2"]
+    assert not pool.is_filled
+
+
+def test_value_pool_tag_map_sizes_and_seed():
+    tag_map = {"a": counting_method(), "b": counting_method()}
+    pools = ValuePoolTagMap(tag_map, pool_sizes={"a": 3}, default_pool_size=5)
+    assert len(pools["a"]) == 3 and len(pools["b"]) == 5
+    assert pools.thread is None
+    assert sorted(pools) == ["a", "b"]
+
+    samples = [
+        ValuePoolTagMap({"a": counting_method()}, seed=7)["a"].sample_many(20)
+        for _ in range(2)
+    ]
+    assert samples[0] == samples[1]
+
+
+def test_value_pool_tag_map_background_refresh():
+    with ValuePoolTagMap(
+        {"a": counting_method()},
+        default_pool_size=10,
+        refresh_fraction=0.5,
+        refresh_interval=0.01,
+    ) as pools:
+        pools["a"].fill()
+        deadline = time.monotonic() + 5
+        while pools["a"].cursor == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "0" not in pools["a"].values.tolist()
+    assert pools.thread is None
+
+
+def test_faker_value_pools_as_tag_map():
+    pools = get_faker_value_pools(seed=42, default_pool_size=20)
+    formatter = FakerTemplateFormatter(tag_map=pools)
+    results = formatter.format_many("<|name|> of <|city|>", 200)
+    names = {result.split(" of ")[0] for result in results}
+    assert 1 < len(names) <= 20
+    assert formatter.format("<|unknown_tag|>") == "<Unknown tag: unknown_tag>"
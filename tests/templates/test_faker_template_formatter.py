@@ -1,6 +1,7 @@
 import pytest
 
 from alea_data_generator.templates.faker_formatter import FakerTemplateFormatter
+from alea_data_generator.templates.jinja2_formatter import Jinja2TemplateFormatter
 
 
 @pytest.fixture
@@ -86,3 +87,25 @@ def test_span_annotations(faker_template_formatter):
     print(result)
     for span in result["spans"]:
         assert result["text"][span["start"] : span["end"]] == span["value"]
+
+
+def test_format_many(faker_template_formatter):
+    template = "<|name|> works at <|company|>; <|unknown_tag|>"
+    results = faker_template_formatter.format_many(template, 20)
+    assert len(results) == 20
+    assert len(set(results)) > 1
+    assert all(" works at " in result for result in results)
+    assert all(result.endswith("<Unknown tag: unknown_tag>") for result in results)
+
+    annotated = faker_template_formatter.format_many_with_annotations(template, 3)
+    for result in annotated:
+        for span in result["spans"]:
+            assert result["text"][span["start"] : span["end"]] == span["value"]
+
+
+def test_jinja2_format_many():
+    formatter = Jinja2TemplateFormatter(seed=42)
+    results = formatter.format_many("{{ name() }} and {{ 1 + 1 }}", 5)
+    assert len(results) == 5
+    assert all(result.endswith(" and 2") for result in results)
+    assert formatter.format_many("{{ broken", 2)[0].startswith("<Error: ")
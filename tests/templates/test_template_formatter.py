@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from alea_data_generator.templates.template_formatter import TemplateFormatter
@@ -75,3 +77,120 @@ def test_custom_tag_map(template_formatter):
     assert result["spans"] == [
         {"start": 7, "end": 15, "tag": "name", "value": "John Doe"}
     ]
+
+
+def test_compile(template_formatter):
+    template_formatter.tag_map["args_test"] = lambda x, y: x + y
+    template = "<|test|> and <|args_test(1, 2)|>, <|test|> or <|test:1|>."
+    compiled = template_formatter.compile(template)
+    assert compiled.literals == ("", " and ", ", ", " or ", ".")
+    assert compiled.occurrences == (0, 1, 0, 2)
+    assert compiled.slots[1].args == (1, 2)
+    assert template_formatter.compile(template) is compiled
+    assert (
+        template_formatter.format(template)
+        == "test_value and 3, test_value or test_value."
+    )
+
+
+def test_compile_cache_is_bounded():
+    formatter = TemplateFormatter(
+        tag_map={"test": lambda: "test_value"}, template_cache_size=2
+    )
+    first = formatter.compile("<|test|> 1")
+    formatter.compile("<|test|> 2")
+    formatter.compile("<|test|> 1")
+    formatter.compile("<|test|> 3")
+    assert list(formatter.template_cache) == ["<|test|> 1", "<|test|> 3"]
+    assert formatter.compile("<|test|> 1") is first
+
+
+def test_compile_cache_is_thread_safe():
+    formatter = TemplateFormatter(
+        tag_map={"test": lambda: "test_value"}, template_cache_size=4
+    )
+    templates = [f"<|test|> {i % 8}" for i in range(4000)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(formatter.format, templates))
+    assert results == [f"test_value {i % 8}" for i in range(4000)]
+    assert len(formatter.template_cache) == 4
+
+
+def test_compiled_template_uses_current_tag_map(template_formatter):
+    template = "Hello, <|test|>!"
+    assert template_formatter.format(template) == "Hello, test_value!"
+    template_formatter.tag_map["test"] = lambda: "new_value"
+    assert template_formatter.format(template) == "Hello, new_value!"
+
+
+def test_format_with_annotations_repeated_tags(template_formatter):
+    template_formatter.tag_map["pair"] = lambda: "ab"
+    template = "<|test|> x <|pair|><|test|> y"
+    result = template_formatter.format_with_annotations(template)
+    assert result["text"] == "test_value x abtest_value y"
+    assert [(span["start"], span["end"], span["tag"]) for span in result["spans"]] == [
+        (0, 10, "test"),
+        (13, 15, "pair"),
+        (15, 25, "test"),
+    ]
+    for span in result["spans"]:
+        assert result["text"][span["start"] : span["end"]] == span["value"]
+
+
+def test_format_many():
+    counter = iter(range(100))
+    formatter = TemplateFormatter(tag_map={"count": lambda: next(counter)})
+    results = formatter.format_many("<|count|>-<|count|>/<|count:1|>", 3)
+    assert results == ["0-0/3", "1-1/4", "2-2/5"]
+    assert formatter.format_many("no tags", 2) == ["no tags", "no tags"]
+    assert formatter.format_many("<|count|>", 0) == []
+
+
+def test_format_many_uses_sample_many():
+    class Pool:
+        def __call__(self, prefix="v"):
+            raise AssertionError("sampled one value at a time")
+
+        def sample_many(self, n, prefix="v"):
+            return [f"{prefix}{i}" for i in range(n)]
+
+    formatter = TemplateFormatter(tag_map={"pool": Pool()})
+    assert formatter.format_many("<|pool('x')|>!", 3) == ["x0!", "x1!", "x2!"]
+
+    chunks = list(formatter.iter_format_many("<|pool|>", 5, chunk_size=2))
+    assert chunks == [["v0", "v1"], ["v0", "v1"], ["v0"]]
+
+
+def test_format_many_sample_many_errors():
+    class Pool:
+        def __init__(self, error):
+            self.error = error
+
+        def __call__(self, *args):
+            return "single"
+
+        def sample_many(self, n, *args):
+            raise self.error
+
+    formatter = TemplateFormatter(tag_map={"pool": Pool(TypeError("bad args"))})
+    assert formatter.format_many("<|pool(1)|>", 2) == ["single", "single"]
+
+    formatter = TemplateFormatter(tag_map={"pool": Pool(RuntimeError("broken"))})
+    with pytest.raises(RuntimeError):
+        formatter.format_many("<|pool(1)|>", 2)
+
+
+def test_format_many_with_annotations(template_formatter):
+    results = template_formatter.format_many_with_annotations("a <|test|> b", 2)
+    assert (
+        results
+        == [
+            {
+                "text": "a test_value b",
+                "spans": [
+                    {"start": 2, "end": 12, "tag": "test", "value": "test_value"}
+                ],
+            }
+        ]
+        * 2
+    )